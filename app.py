@@ -7,63 +7,96 @@ for document upload and processing with structured data extraction capabilities.
 """
 # pylint: disable=too-many-lines
 
+import codecs
+import csv
+import hashlib
+import io
+import json
+import multiprocessing
 import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
 import uuid
-from flask import Flask, render_template, request, jsonify, send_from_directory
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from flask import (Flask, Request, Response, abort, g, render_template, request, jsonify,
+                   send_from_directory, stream_with_context, url_for)
 from werkzeug.utils import secure_filename
 import config
+import jobs
+import lazy_imports
+import metrics
+import ocr_engines
+import result_cache
+import storage
+import timing
+
+# Heavy libraries are imported on first use (see lazy_imports), not at startup
+np = lazy_imports.LazyModule('numpy')
+pd = lazy_imports.LazyModule('pandas')
+openpyxl = lazy_imports.LazyModule('openpyxl')
+docx = lazy_imports.LazyModule('docx')
+pdf2image = lazy_imports.LazyModule('pdf2image')
+pytesseract = lazy_imports.LazyModule('pytesseract')
+PyPDF2 = lazy_imports.LazyModule('PyPDF2')  # pylint: disable=invalid-name
+
+# Check that the OCR libraries are installed without importing them
+try:
+    from PIL import Image, ImageFilter, ImageStat
+    OCR_LIBRARIES_INSTALLED = all(
+        lazy_imports.is_installed(module_name)
+        for module_name in ('pytesseract', 'pdf2image', 'docx', 'numpy', 'openpyxl', 'pandas')
+    )
+except ImportError:
+    OCR_LIBRARIES_INSTALLED = False
 
-# Initialize global variables first
-PDF_TEXT_EXTRACTION_AVAILABLE = False
-OCR_AVAILABLE = False
+# For enhanced PDF processing
+PDF_TEXT_EXTRACTION_AVAILABLE = OCR_LIBRARIES_INSTALLED and lazy_imports.is_installed('PyPDF2')
 
-# Try to import OCR libraries with graceful fallback
+# MessagePack is optional: without it only JSON responses are offered
 try:
-    import pytesseract
-    from PIL import Image, ImageEnhance
-    import pdf2image
-    from docx import Document
-    import pandas as pd
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
-    # For enhanced PDF processing
-    try:
-        import PyPDF2
-        PDF_TEXT_EXTRACTION_AVAILABLE = True
-    except ImportError:
-        PDF_TEXT_EXTRACTION_AVAILABLE = False
+# Word box fields reported as parallel arrays in the columnar response format
+COLUMNAR_FIELDS = ['text', 'confidence', 'left', 'top', 'width', 'height']
 
-    # Configure Tesseract OCR path - try multiple locations
-    TESSERACT_FOUND = False
+# Server settings that change processing results; they are part of every result cache key
+CACHE_FINGERPRINT_SETTINGS = [
+    'DPI_PRESETS', 'OCR_MAX_IMAGE_DIMENSION', 'TESSDATA_PATH', 'MAX_PDF_PAGES',
+    'PDF_TEXT_EXTRACTION_FIRST', 'CSV_DELIMITER', 'CSV_ENCODING', 'CSV_FALLBACK_ENCODINGS',
+    'CSV_SNIFF_BYTES', 'CSV_SNIFF_DELIMITERS', 'EXCEL_MAX_ROWS', 'EXCEL_MAX_COLUMNS'
+]
 
-    for tesseract_path in config.TESSERACT_PATHS:
-        try:
-            pytesseract.pytesseract.tesseract_cmd = tesseract_path
-            # Test if Tesseract is working
-            pytesseract.get_tesseract_version()
-            TESSERACT_FOUND = True
-            print(f"✅ Tesseract found at: {tesseract_path}")
-            break
-        except (pytesseract.TesseractNotFoundError, FileNotFoundError, OSError):
-            continue
 
-    # Fallback: try to force set the most common Windows path
-    if not TESSERACT_FOUND:
-        FORCE_PATH = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-        if os.path.exists(FORCE_PATH):
-            pytesseract.pytesseract.tesseract_cmd = FORCE_PATH
-            try:
-                pytesseract.get_tesseract_version()
-                TESSERACT_FOUND = True
-                print(f"✅ Tesseract found at: {FORCE_PATH}")
-            except (pytesseract.TesseractNotFoundError, OSError):
-                pass
+class UploadRequest(Request):
+    """
+    Flask request that keeps uploaded file parts in memory in ephemeral mode
+    Werkzeug otherwise spools file parts larger than 500KB to a temporary file
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        if config.EPHEMERAL_UPLOADS:
+            # Bounded by MAX_CONTENT_LENGTH
+            return io.BytesIO()
+        return super()._get_file_stream(total_content_length, content_type, filename,
+                                        content_length)
 
-    OCR_AVAILABLE = TESSERACT_FOUND
-except ImportError:
-    OCR_AVAILABLE = False
 
 # Initialize Flask application
 app = Flask(__name__)
+app.request_class = UploadRequest
 
 # Configure application settings from config file
 app.config['UPLOAD_FOLDER'] = config.UPLOAD_FOLDER
@@ -73,6 +106,25 @@ app.config['MAX_CONTENT_LENGTH'] = config.MAX_CONTENT_LENGTH
 if not os.path.exists(config.UPLOAD_FOLDER):
     os.makedirs(config.UPLOAD_FOLDER)
 
+# Tesseract binary found by discovery, which runs once per process
+_TESSERACT_DISCOVERY = {'done': False, 'cmd': None, 'version': None, 'thread': None}
+_TESSERACT_DISCOVERY_LOCK = threading.Lock()
+
+# Cached Tesseract metadata so requests never spawn Tesseract just to list languages
+_TESSERACT_INFO = {'languages': None, 'version': None, 'loaded_at': 0.0}
+_TESSERACT_INFO_LOCK = threading.Lock()
+
+# Shared process pool for concurrent PDF page OCR (created on first use)
+_OCR_POOL = {'executor': None}
+_OCR_POOL_LOCK = threading.Lock()
+
+# Background threads that write PDF page previews off the OCR critical path
+_PREVIEW_POOL = {'executor': None}
+_PREVIEW_POOL_LOCK = threading.Lock()
+
+# Digest of the source that produces results, so an upgrade never serves old cached results
+_CODE_DIGEST = {'value': None}
+
 
 def allowed_file(filename):
     """
@@ -88,20 +140,117 @@ def allowed_file(filename):
             filename.rsplit('.', 1)[1].lower() in config.ALLOWED_EXTENSIONS)
 
 
-def get_available_languages():
+def run_tesseract_command(tesseract_cmd, *arguments):
+    """
+    Run a Tesseract binary directly (without importing pytesseract)
+
+    Args:
+        tesseract_cmd (str): Path to the Tesseract binary
+        *arguments: Command line arguments
+
+    Returns:
+        str: Command output (Tesseract 3 prints some information to stderr)
+    """
+    completed = subprocess.run(
+        [tesseract_cmd, *arguments], capture_output=True, check=True,
+        timeout=config.TESSERACT_PROBE_TIMEOUT
+    )
+    return (completed.stdout + completed.stderr).decode('utf-8', errors='replace')
+
+
+def find_tesseract_binary():
+    """
+    Find the first working Tesseract binary among config.TESSERACT_PATHS
+    Candidates that are neither a file nor on PATH are skipped without spawning anything
+
+    Returns:
+        tuple: (tesseract_cmd, version), both None if no binary works
+    """
+    for tesseract_path in config.TESSERACT_PATHS:
+        resolved_path = tesseract_path if os.path.isfile(tesseract_path) else shutil.which(
+            tesseract_path
+        )
+        if resolved_path is None:
+            continue
+        try:
+            # Test if Tesseract is working; the first line reads 'tesseract <version>'
+            version_output = run_tesseract_command(resolved_path, '--version')
+        except (OSError, subprocess.SubprocessError):
+            continue
+        version_words = version_output.split()
+        return resolved_path, version_words[1].lstrip('v') if len(version_words) > 1 else 'unknown'
+    return None, None
+
+
+def discover_tesseract():
+    """
+    Locate Tesseract once per process; concurrent callers wait for the same probe
+
+    Returns:
+        bool: True if a working Tesseract binary was found
+    """
+    if not _TESSERACT_DISCOVERY['done']:
+        with _TESSERACT_DISCOVERY_LOCK:
+            if not _TESSERACT_DISCOVERY['done']:
+                tesseract_cmd, version = find_tesseract_binary()
+                if tesseract_cmd is not None:
+                    print(f"✅ Tesseract found at: {tesseract_cmd}")
+                _TESSERACT_DISCOVERY.update(cmd=tesseract_cmd, version=version, done=True)
+    return _TESSERACT_DISCOVERY['cmd'] is not None
+
+
+def start_tesseract_discovery():
+    """
+    Discover Tesseract and load its language list on a background thread
+    The server accepts requests meanwhile; OCR requests wait for the probe to finish
     """
-    Detect available Tesseract language packs
+    # The lock is held for the whole probe; if it is taken, discovery is already running
+    if not _TESSERACT_DISCOVERY_LOCK.acquire(blocking=False):  # pylint: disable=consider-using-with
+        return
+    try:
+        if _TESSERACT_DISCOVERY['done'] or _TESSERACT_DISCOVERY['thread'] is not None:
+            return
+        _TESSERACT_DISCOVERY['thread'] = threading.Thread(
+            target=get_tesseract_info, name='docusense-tesseract-discovery', daemon=True
+        )
+        _TESSERACT_DISCOVERY['thread'].start()
+    finally:
+        _TESSERACT_DISCOVERY_LOCK.release()
+
+
+def is_ocr_available(wait=True):
+    """
+    Check whether the OCR libraries are installed and a Tesseract binary was found
+
+    Args:
+        wait (bool): Run (or wait for) Tesseract discovery if it has not finished;
+                     with False, report unavailable while discovery is still running
+
+    Returns:
+        bool: True if OCR can run
+    """
+    if not OCR_LIBRARIES_INSTALLED:
+        return False
+    if wait:
+        return discover_tesseract()
+    return _TESSERACT_DISCOVERY['cmd'] is not None
+
+
+def detect_available_languages():
+    """
+    Detect available Tesseract language packs by querying the Tesseract binary
 
     Returns:
         list: List of available language codes
     """
-    if not OCR_AVAILABLE:
+    if not is_ocr_available():
         return ['eng']  # Default to English only in demo mode
 
     try:
-        # Get available languages from Tesseract
-        # Note: get_languages() doesn't take a config parameter in the same way
-        available_langs = pytesseract.get_languages()
+        # Get available languages from Tesseract (the first line is a header)
+        available_langs = run_tesseract_command(
+            _TESSERACT_DISCOVERY['cmd'], '--list-langs'
+        ).splitlines()[1:]
 
         # Filter to only include languages we have configured
         supported_langs = []
@@ -114,10 +263,96 @@ def get_available_languages():
             supported_langs.insert(0, 'eng')
 
         return supported_langs
-    except (pytesseract.TesseractNotFoundError, RuntimeError):
+    except (OSError, subprocess.SubprocessError):
         return ['eng']  # Fallback to English only
 
 
+def detect_tesseract_version():
+    """
+    Query the Tesseract binary for its version
+
+    Returns:
+        str: Tesseract version, or None if unavailable
+    """
+    if not is_ocr_available():
+        return None
+
+    try:
+        version_words = run_tesseract_command(_TESSERACT_DISCOVERY['cmd'], '--version').split()
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+    return version_words[1].lstrip('v') if len(version_words) > 1 else 'unknown'
+
+
+def get_tesseract_info(refresh=False):
+    """
+    Get cached Tesseract metadata, probing the binary only when the cache is stale
+
+    Args:
+        refresh (bool): Force a new probe regardless of cache age
+
+    Returns:
+        dict: Installed languages, version and cache age information
+    """
+    with _TESSERACT_INFO_LOCK:
+        age = time.monotonic() - _TESSERACT_INFO['loaded_at']
+        expired = 0 < config.TESSERACT_INFO_CACHE_TTL < age
+
+        if refresh or expired or _TESSERACT_INFO['languages'] is None:
+            _TESSERACT_INFO['languages'] = detect_available_languages()
+            _TESSERACT_INFO['version'] = detect_tesseract_version()
+            _TESSERACT_INFO['loaded_at'] = time.monotonic()
+            age = 0.0
+
+        return {
+            'languages': list(_TESSERACT_INFO['languages']),
+            'version': _TESSERACT_INFO['version'],
+            'cache_age_seconds': round(age, 1)
+        }
+
+
+def get_available_languages():
+    """
+    Get available Tesseract language packs from the cached Tesseract metadata
+
+    Returns:
+        list: List of available language codes
+    """
+    return get_tesseract_info()['languages']
+
+
+def get_tesseract_modes(engine_mode, psm_mode):
+    """
+    Map engine and page segmentation mode keys to Tesseract's numeric values
+
+    Args:
+        engine_mode (str): OCR engine mode key
+        psm_mode (str): Page segmentation mode key
+
+    Returns:
+        tuple: (oem, psm)
+    """
+    oem = config.OCR_ENGINE_MODES.get(engine_mode, config.OCR_ENGINE_MODES['lstm'])
+    psm = config.PAGE_SEGMENTATION_MODES.get(psm_mode, config.PAGE_SEGMENTATION_MODES['auto'])
+    return oem, psm
+
+
+def warm_up_ocr_state():
+    """
+    Load Tesseract metadata and persistent OCR engines ahead of the first request
+    serve.py calls this once in the master process, so forked workers inherit it
+    """
+    if not is_ocr_available():
+        return
+    installed_languages = get_tesseract_info()['languages']
+    oem, _ = get_tesseract_modes(config.DEFAULT_OCR_ENGINE_MODE, config.DEFAULT_PSM_MODE)
+    ocr_engines.preload_engines(
+        [language for language in config.SERVE_PRELOAD_LANGUAGES
+         if language in installed_languages],
+        oem
+    )
+
+
 def get_tesseract_config(engine_mode, psm_mode, language='eng'):
     """
     Generate Tesseract configuration string based on parameters
@@ -131,8 +366,7 @@ def get_tesseract_config(engine_mode, psm_mode, language='eng'):
         tuple: (language, config_string)
     """
     # Get numeric values from config mappings
-    oem = config.OCR_ENGINE_MODES.get(engine_mode, config.OCR_ENGINE_MODES['lstm'])
-    psm = config.PAGE_SEGMENTATION_MODES.get(psm_mode, config.PAGE_SEGMENTATION_MODES['auto'])
+    oem, psm = get_tesseract_modes(engine_mode, psm_mode)
 
     # Validate language availability
     available_languages = get_available_languages()
@@ -145,42 +379,81 @@ def get_tesseract_config(engine_mode, psm_mode, language='eng'):
     return language, config_string
 
 
+def build_enhancement_lut(mean_level, contrast=1.1, brightness=1.05):
+    """
+    Build a lookup table applying a contrast boost around the mean level, then a brightness boost
+    Fusing both adjustments lets the image be remapped in a single pass
+
+    Args:
+        mean_level (int): Mean gray level contrast is stretched around
+        contrast (float): Contrast factor (1.0 = unchanged)
+        brightness (float): Brightness factor (1.0 = unchanged)
+
+    Returns:
+        list: 256 output levels for image.point()
+    """
+    lut = []
+    for level in range(256):
+        contrasted = min(255.0, max(0.0, mean_level + (level - mean_level) * contrast))
+        lut.append(min(255, int(contrasted * brightness + 0.5)))
+    return lut
+
+
 def enhance_image_for_ocr(image):
     """
     Enhanced image preprocessing for better OCR on ID cards and documents
+    Works in grayscale (Tesseract binarizes luminance anyway) with one sharpening pass
+    and one fused contrast/brightness lookup, so only one full-size copy is kept alive
 
     Args:
         image (PIL.Image): The input image
 
     Returns:
-        PIL.Image: Enhanced image for OCR
+        PIL.Image: Enhanced grayscale image for OCR
     """
-    # Convert to RGB if not already
-    if image.mode != 'RGB':
-        image = image.convert('RGB')
+    # Convert to grayscale if not already
+    if image.mode != 'L':
+        image = image.convert('L')
 
     # Apply slight sharpening to improve text clarity
-    enhancer = ImageEnhance.Sharpness(image)
-    image = enhancer.enhance(1.2)  # Slight sharpening
+    # (same as ImageEnhance.Sharpness(1.2), i.e. 1.2 * image - 0.2 * SMOOTH, in one convolution)
+    image = image.filter(ImageFilter.Kernel((3, 3), [-1, -1, -1, -1, 73, -1, -1, -1, -1], scale=65))
 
-    # Enhance contrast for better text/background separation
-    enhancer = ImageEnhance.Contrast(image)
-    image = enhancer.enhance(1.1)  # Slight contrast boost
+    # Slight contrast boost for text/background separation plus a very slight brightness boost
+    mean_level = int(ImageStat.Stat(image).mean[0] + 0.5)
+    return image.point(build_enhancement_lut(mean_level))
 
-    # Apply slight brightness adjustment if image is too dark
-    enhancer = ImageEnhance.Brightness(image)
-    image = enhancer.enhance(1.05)  # Very slight brightness boost
 
-    return image
+def get_resample_filter(scale_factor):
+    """
+    Pick the cheapest resampling filter that keeps text edges clean for the scale direction
+    Downscaling averages neighbouring pixels anyway, so bilinear is enough; upscaling
+    uses bicubic, which is close to LANCZOS on text at a fraction of the cost
+
+    Args:
+        scale_factor (float): Resize factor (< 1.0 shrinks the image)
+
+    Returns:
+        int: Pillow resampling filter
+    """
+    filter_name = 'BILINEAR' if scale_factor < 1.0 else 'BICUBIC'
+    try:
+        # Try new Resampling enum (Pillow 10.0+)
+        return getattr(Image.Resampling, filter_name)
+    except AttributeError:
+        # Fallback for older Pillow versions
+        return getattr(Image, filter_name)
 
 
-def preprocess_image_for_dpi(image, dpi_setting):
+def preprocess_image_for_dpi(image, dpi_setting, cap_dimension=True):
     """
     Preprocess image based on DPI setting for better OCR accuracy
+    Enhancement always runs on the smaller of the original and resized image
 
     Args:
-        image (PIL.Image): The input image
+        image (PIL.Image): The input image (JPEGs not loaded yet are decoded in draft mode)
         dpi_setting (str): DPI setting key ('low', 'medium', 'high')
+        cap_dimension (bool): Apply config.OCR_MAX_IMAGE_DIMENSION to the scaled image
 
     Returns:
         PIL.Image: Processed image
@@ -192,9 +465,6 @@ def preprocess_image_for_dpi(image, dpi_setting):
     if isinstance(original_dpi, (int, float)):
         original_dpi = (original_dpi, original_dpi)
 
-    # First enhance the image quality for better OCR
-    enhanced_image = enhance_image_for_ocr(image)
-
     # Calculate scaling factor - be more conservative with ID cards
     scale_factor = target_dpi / original_dpi[0]
 
@@ -203,72 +473,80 @@ def preprocess_image_for_dpi(image, dpi_setting):
     scale_factor = max(scale_factor, 0.8)  # Min 0.8x scaling
 
     # Only resize if scale factor is significantly different (higher threshold for ID cards)
-    if abs(scale_factor - 1.0) > 0.15:
-        new_width = int(enhanced_image.width * scale_factor)
-        new_height = int(enhanced_image.height * scale_factor)
+    if abs(scale_factor - 1.0) <= 0.15:
+        scale_factor = 1.0
 
-        # Use high-quality resampling with compatibility handling
-        try:
-            # Try new Resampling enum (Pillow 10.0+)
-            resample_method = Image.Resampling.LANCZOS
-        except AttributeError:
-            # Fallback for older Pillow versions
-            resample_method = getattr(Image, 'LANCZOS', 1)  # 1 is the numeric value for LANCZOS
+    # Cap the longest side so oversized photos are not upscaled (or kept) beyond usefulness
+    if cap_dimension and config.OCR_MAX_IMAGE_DIMENSION > 0:
+        scale_factor = min(scale_factor, config.OCR_MAX_IMAGE_DIMENSION / max(image.size))
+
+    target_size = (int(image.width * scale_factor), int(image.height * scale_factor))
+
+    # JPEGs decode straight to grayscale, at 1/2 to 1/8 size when the target is small enough
+    if image.format == 'JPEG':
+        image.draft('L', target_size)
 
-        enhanced_image = enhanced_image.resize((new_width, new_height), resample_method)
+    if image.size == target_size:
+        return enhance_image_for_ocr(image)
 
-    return enhanced_image
+    resample_method = get_resample_filter(scale_factor)
+    if scale_factor < 1.0:
+        # Shrink first so enhancement does not process pixels that are thrown away
+        return enhance_image_for_ocr(image.resize(target_size, resample_method))
+    return enhance_image_for_ocr(image).resize(target_size, resample_method)
 
 
-def calculate_dpi_scaling_factors(original_image, processed_image):
+def calculate_dpi_scaling_factors(original_size, processed_image):
     """
     Calculate scaling factors between original and processed images
 
     Args:
-        original_image (PIL.Image): Original image
+        original_size (tuple): Original image (width, height), taken before draft decoding
         processed_image (PIL.Image): Processed image after DPI adjustment
 
     Returns:
         tuple: (dpi_scale_x, dpi_scale_y) scaling factors
     """
-    original_width, original_height = original_image.size
+    original_width, original_height = original_size
     processed_width, processed_height = processed_image.size
     dpi_scale_x = processed_width / original_width
     dpi_scale_y = processed_height / original_height
     return dpi_scale_x, dpi_scale_y
 
 
-def clean_and_scale_ocr_data(ocr_data, dpi_scale_x, dpi_scale_y):
+def clean_and_scale_ocr_data(ocr_data, dpi_scale_x, dpi_scale_y, page=None):
     """
     Clean OCR data and scale coordinates back to original image dimensions
+    Columns are processed as arrays: filtering, scaling and casting happen in bulk
 
     Args:
         ocr_data (dict): Raw OCR data from Tesseract
         dpi_scale_x (float): X-axis scaling factor
         dpi_scale_y (float): Y-axis scaling factor
+        page (int): Page number to attach to every entry, if any
 
     Returns:
         list: Cleaned and scaled OCR data entries
     """
-    cleaned_data = []
-    for i in range(len(ocr_data['text'])):
-        text = ocr_data['text'][i].strip()
-        if text:  # Only include entries with actual text content
-            # Scale coordinates back to original image dimensions
-            scaled_left = int(ocr_data['left'][i] / dpi_scale_x)
-            scaled_top = int(ocr_data['top'][i] / dpi_scale_y)
-            scaled_width = int(ocr_data['width'][i] / dpi_scale_x)
-            scaled_height = int(ocr_data['height'][i] / dpi_scale_y)
-
-            cleaned_data.append({
-                'text': text,
-                'confidence': int(ocr_data['conf'][i]),
-                'left': scaled_left,
-                'top': scaled_top,
-                'width': scaled_width,
-                'height': scaled_height
-            })
-    return cleaned_data
+    # Only include entries with actual text content
+    texts = np.char.strip(np.asarray(ocr_data['text'], dtype=str))
+    keep = texts != ''
+
+    # Scale coordinates back to original image dimensions (astype truncates like int())
+    text = texts[keep].tolist()
+    confidence = np.asarray(ocr_data['conf'], dtype=float)[keep].astype(int).tolist()
+    left = (np.asarray(ocr_data['left'])[keep] / dpi_scale_x).astype(int).tolist()
+    top = (np.asarray(ocr_data['top'])[keep] / dpi_scale_y).astype(int).tolist()
+    width = (np.asarray(ocr_data['width'])[keep] / dpi_scale_x).astype(int).tolist()
+    height = (np.asarray(ocr_data['height'])[keep] / dpi_scale_y).astype(int).tolist()
+
+    rows = zip(text, confidence, left, top, width, height)
+    if page is None:
+        return [{'text': t, 'confidence': c, 'left': x, 'top': y, 'width': w, 'height': h}
+                for t, c, x, y, w, h in rows]
+    return [{'text': t, 'confidence': c, 'left': x, 'top': y, 'width': w, 'height': h,
+             'page': page}
+            for t, c, x, y, w, h in rows]
 
 
 def build_ocr_result(cleaned_data, dpi_setting, language, engine_mode, psm_mode):
@@ -298,45 +576,153 @@ def build_ocr_result(cleaned_data, dpi_setting, language, engine_mode, psm_mode)
     }
 
 
-def process_image(filepath, dpi_setting='medium', language='eng',
-                  engine_mode='lstm', psm_mode='auto'):
+def to_binary_stream(source):
+    """
+    Get a seekable binary stream over an in-memory source, positioned at its start
+
+    Args:
+        source: Bytes-like object or seekable binary file-like object
+
+    Returns:
+        Binary file-like object
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+@contextmanager
+def open_source(source):
+    """
+    Open a file path or in-memory upload as a binary stream
+    Only streams opened here are closed afterwards
+
+    Args:
+        source: File path, bytes-like object or seekable binary file-like object
+
+    Yields:
+        Binary file-like object positioned at the start of the content
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as stream:
+            yield stream
+    else:
+        yield to_binary_stream(source)
+
+
+def spill_source_to_file(source, folder, suffix):
+    """
+    Write an in-memory upload to a scratch file for backends that only accept paths
+
+    Args:
+        source: File path, bytes-like object or seekable binary file-like object
+        folder (str): Scratch folder that is removed by the caller
+        suffix (str): File suffix (e.g. '.pdf')
+
+    Returns:
+        str: Path to the content; file paths are returned unchanged
+    """
+    if isinstance(source, str):
+        return source
+    spill_path = os.path.join(folder, f"{uuid.uuid4().hex[:8]}_upload{suffix}")
+    with open_source(source) as stream, open(spill_path, 'wb') as spill_file:
+        shutil.copyfileobj(stream, spill_file)
+    return spill_path
+
+
+def load_image(image_source):
+    """
+    Open an image from a path, an in-memory buffer or an already decoded PIL image
+
+    Args:
+        image_source: File path, PIL.Image, bytes-like object or binary file-like object
+
+    Returns:
+        PIL.Image: The opened image
+    """
+    if isinstance(image_source, Image.Image):
+        return image_source
+    if isinstance(image_source, (bytes, bytearray, memoryview)):
+        return Image.open(io.BytesIO(image_source))
+    return Image.open(image_source)
+
+
+def run_ocr_engine(image, language, config_string, engine_mode, psm_mode):
+    """
+    Run Tesseract on a preprocessed image with the configured OCR backend
+    Persistent tesserocr engines are used when selected and installed, otherwise
+    pytesseract runs the tesseract binary as a subprocess
+
+    Args:
+        image (PIL.Image): Preprocessed image
+        language (str): Validated language code
+        config_string (str): Tesseract CLI options for the subprocess backend
+        engine_mode (str): OCR engine mode key
+        psm_mode (str): Page segmentation mode key
+
+    Returns:
+        dict: OCR data columns (text, conf, left, top, width, height, ...)
+    """
+    if ocr_engines.is_persistent_backend_enabled():
+        oem, psm = get_tesseract_modes(engine_mode, psm_mode)
+        return ocr_engines.image_to_data(image, language, oem, psm)
+
+    # pytesseract is imported on first use, so point it at the discovered binary here
+    pytesseract.pytesseract.tesseract_cmd = _TESSERACT_DISCOVERY['cmd']
+    return pytesseract.image_to_data(
+        image,
+        lang=language,
+        config=config_string,
+        output_type=pytesseract.Output.DICT
+    )
+
+
+@timing.measured('process_image')
+# pylint: disable-next=too-many-arguments,too-many-locals
+def process_image(image_source, dpi_setting='medium', language='eng',
+                  engine_mode='lstm', psm_mode='auto', *, page=None, cap_dimension=True):
     """
-    Process an image file using OCR to extract text with bounding boxes
+    Process an image using OCR to extract text with bounding boxes
 
     Args:
-        filepath (str): Path to the image file
+        image_source: Path to the image file, PIL.Image, or in-memory image buffer
         dpi_setting (str): DPI setting for image preprocessing
         language (str): Language code for OCR
         engine_mode (str): OCR engine mode
         psm_mode (str): Page segmentation mode
+        page (int): Page number to attach to every entry (PDF pages)
+        cap_dimension (bool): Apply config.OCR_MAX_IMAGE_DIMENSION while preprocessing
 
     Returns:
         dict: OCR data with text and bounding box information plus processing metadata
     """
-    if not OCR_AVAILABLE:
-        return {'data': [{'text': 'OCR libraries not available - demo mode',
-                         'confidence': 0, 'left': 0, 'top': 0, 'width': 100, 'height': 20}]}
+    if not is_ocr_available():
+        demo_entry = {'text': 'OCR libraries not available - demo mode',
+                      'confidence': 0, 'left': 0, 'top': 0, 'width': 100, 'height': 20}
+        if page is not None:
+            demo_entry['page'] = page
+        return {'data': [demo_entry]}
     try:
-        # Open and preprocess image
-        image = Image.open(filepath)
-        processed_image = preprocess_image_for_dpi(image, dpi_setting)
+        # Open (or reuse) and preprocess image
+        image = load_image(image_source)
+        original_size = image.size
+        with timing.measure('preprocess'):
+            processed_image = preprocess_image_for_dpi(image, dpi_setting, cap_dimension)
 
         # Calculate scaling factors for coordinate correction
-        dpi_scale_x, dpi_scale_y = calculate_dpi_scaling_factors(image, processed_image)
+        dpi_scale_x, dpi_scale_y = calculate_dpi_scaling_factors(original_size, processed_image)
 
         # Get Tesseract configuration
         lang, config_string = get_tesseract_config(engine_mode, psm_mode, language)
 
         # Run Tesseract OCR with advanced settings
-        ocr_data = pytesseract.image_to_data(
-            processed_image,
-            lang=lang,
-            config=config_string,
-            output_type=pytesseract.Output.DICT
-        )
+        with timing.measure('ocr'):
+            ocr_data = run_ocr_engine(processed_image, lang, config_string, engine_mode, psm_mode)
 
         # Clean up OCR data and scale coordinates back to original image size
-        cleaned_data = clean_and_scale_ocr_data(ocr_data, dpi_scale_x, dpi_scale_y)
+        with timing.measure('ocr_cleanup'):
+            cleaned_data = clean_and_scale_ocr_data(ocr_data, dpi_scale_x, dpi_scale_y, page)
 
         # Build and return final result
         return build_ocr_result(cleaned_data, dpi_setting, lang, engine_mode, psm_mode)
@@ -349,218 +735,609 @@ def process_image(filepath, dpi_setting='medium', language='eng',
         raise ValueError(f"Image processing failed: {str(e)}") from e
 
 
-def extract_text_from_pdf(filepath):
+def resolve_pdf_page_range(page_count, first_page=None, last_page=None):
+    """
+    Clamp a requested page range to the document and to MAX_PDF_PAGES
+
+    Args:
+        page_count (int): Number of pages in the PDF
+        first_page (int): First requested page (1-based), None for the first page
+        last_page (int): Last requested page (inclusive), None for the last page
+
+    Returns:
+        tuple: (first_page, last_page) actually processed
+    """
+    if page_count < 1:
+        raise ValueError("No pages found in PDF")
+
+    first_page = max(1, first_page or 1)
+    last_page = min(page_count, last_page or page_count)
+    if config.MAX_PDF_PAGES > 0:
+        last_page = min(last_page, first_page + config.MAX_PDF_PAGES - 1)
+    if first_page > last_page:
+        raise ValueError(f"Requested page range is outside the document ({page_count} pages)")
+    return first_page, last_page
+
+
+def iter_pdf_page_texts(pdf_reader, first_page, last_page):
+    """
+    Extract the text layer of PDF pages lazily, one page at a time
+
+    Args:
+        pdf_reader (PyPDF2.PdfReader): Open PDF reader
+        first_page (int): First page to extract (1-based)
+        last_page (int): Last page to extract (inclusive)
+
+    Yields:
+        tuple: (page_num, page_text) with surrounding whitespace stripped
+    """
+    for page_num in range(first_page, last_page + 1):
+        yield page_num, (pdf_reader.pages[page_num - 1].extract_text() or '').strip()
+
+
+def extract_text_from_pdf(source, first_page=None, last_page=None):
     """
     Extract text directly from text-based PDF using PyPDF2
+    Every page in the range is checked for a text layer, so a mixed PDF is recognized
+    even when its leading pages are scanned
 
     Args:
-        filepath (str): Path to the PDF file
+        source: Path to the PDF file or the in-memory upload
+        first_page (int): First page to extract (1-based), None for the first page
+        last_page (int): Last page to extract (inclusive), None for the last page
 
     Returns:
-        tuple: (success: bool, text: str, page_count: int)
+        tuple: (success: bool, page_texts: list, page_count: int, page_range: tuple)
+        where page_texts holds (page_num, text) for every page read, empty for pages
+        without a text layer, and success means at least one page has text
     """
     if not PDF_TEXT_EXTRACTION_AVAILABLE:
-        return False, "", 0
+        return False, [], 0, None
 
     try:
-        with open(filepath, 'rb') as file:
+        with open_source(source) as file:
             pdf_reader = PyPDF2.PdfReader(file)
 
             # Check if PDF is encrypted
             if pdf_reader.is_encrypted:
-                return False, "PDF is password-protected", len(pdf_reader.pages)
+                return False, [], len(pdf_reader.pages), None
 
-            text_content = []
             page_count = len(pdf_reader.pages)
+            page_range = resolve_pdf_page_range(page_count, first_page, last_page)
+
+            # Extract text page by page within the requested range
+            page_texts = list(iter_pdf_page_texts(pdf_reader, *page_range))
+            if not any(page_text for _, page_text in page_texts):
+                # No text layer on any page: treat the PDF as scanned
+                return False, [], page_count, page_range
+            return True, page_texts, page_count, page_range
+
+    except (OSError, UnicodeDecodeError, RuntimeError, PyPDF2.errors.PdfReadError):
+        return False, [], 0, None
 
-            # Extract text from each page
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                page_text = page.extract_text().strip()
-                if page_text:  # Only include pages with text
-                    text_content.append(f"--- Page {page_num} ---\n{page_text}")
 
-            full_text = '\n\n'.join(text_content)
-            return len(full_text.strip()) > 0, full_text, page_count
+def format_pdf_page_texts(page_texts):
+    """
+    Join per-page text into one document with page separators
+
+    Args:
+        page_texts (list): (page_num, text) tuples in page order
+
+    Returns:
+        str: Text of all non-empty pages, each preceded by a page header
+    """
+    return '\n\n'.join(
+        f"--- Page {page_num} ---\n{page_text}" for page_num, page_text in page_texts if page_text
+    )
+
+
+def merge_hybrid_pdf_result(ocr_result, page_texts, page_count):
+    """
+    Merge text-layer pages and OCR'd pages of a mixed PDF into one ordered result
+
+    Args:
+        ocr_result (dict): OCR result for the pages without a text layer
+        page_texts (list): (page_num, text) tuples for every page in the range
+        page_count (int): Number of pages in the PDF
+
+    Returns:
+        dict: Result with word boxes of OCR'd pages in 'data' and every page in 'pages'
+    """
+    ocr_words = {}
+    for entry in ocr_result['data']:
+        ocr_words.setdefault(entry['page'], []).append(entry['text'])
+
+    pages = []
+    for page_num, page_text in page_texts:
+        if page_text:
+            pages.append({'page': page_num, 'method': 'text_extraction', 'text': page_text})
+        else:
+            pages.append({'page': page_num, 'method': 'ocr',
+                          'text': ' '.join(ocr_words.get(page_num, []))})
 
-    except (OSError, UnicodeDecodeError, RuntimeError):
-        return False, "", 0
+    ocr_page_count = sum(1 for page in pages if page['method'] == 'ocr')
+    return {
+        **ocr_result,
+        'pages': pages,
+        'text': format_pdf_page_texts((page['page'], page['text']) for page in pages),
+        'processing_method': 'hybrid',
+        'page_count': page_count,
+        'page_range': [page_texts[0][0], page_texts[-1][0]],
+        'message': (f'Text extracted from {len(pages) - ocr_page_count} page(s), '
+                    f'OCR processed {ocr_page_count} page(s)')
+    }
 
 
-def process_pdf(filepath, dpi_setting='medium', language='eng',
-                 engine_mode='lstm', psm_mode='auto'):
+@timing.measured('process_pdf')
+# pylint: disable-next=too-many-arguments
+def process_pdf(source, dpi_setting='medium', language='eng',
+                engine_mode='lstm', psm_mode='auto', *,
+                include_images=True, page_range=None):
     """
     Enhanced PDF processing with multi-page support and text extraction
 
     Args:
-        filepath (str): Path to the PDF file
+        source: Path to the PDF file or the in-memory upload
         dpi_setting (str): DPI setting for image preprocessing
         language (str): Language code for OCR
         engine_mode (str): OCR engine mode
         psm_mode (str): Page segmentation mode
+        include_images (bool): Whether to write page preview images for OCR'd pages
+        page_range (tuple): Optional (first_page, last_page), either end may be None
 
     Returns:
         dict: OCR data with page information and processing metadata
     """
-    if not OCR_AVAILABLE:
+    if not is_ocr_available():
         return {'data': [{'text': 'PDF processing not available - demo mode',
                          'confidence': 0, 'left': 0, 'top': 0, 'width': 200, 'height': 20}]}
 
     try:
         # First attempt: Try direct text extraction for text-based PDFs
         if config.PDF_TEXT_EXTRACTION_FIRST:
-            text_success, extracted_text, page_count = extract_text_from_pdf(filepath)
+            with timing.measure('pdf_text_extraction'):
+                text_success, page_texts, page_count, pages_read = extract_text_from_pdf(
+                    source, *(page_range or (None, None))
+                )
+            scanned_pages = [page_num for page_num, page_text in page_texts if not page_text]
 
-            if text_success and extracted_text.strip():
+            if text_success and not scanned_pages:
                 return {
-                    'data': {'text_only': extracted_text},
+                    'data': {'text_only': format_pdf_page_texts(page_texts)},
                     'processing_method': 'text_extraction',
                     'page_count': page_count,
-                    'message': f'Text extracted from {page_count} page(s)'
+                    'page_range': list(pages_read),
+                    'message': f'Text extracted from {len(page_texts)} of {page_count} page(s)'
                 }
 
+            if text_success:
+                # Mixed PDF: rasterize and OCR only the pages without a text layer
+                ocr_result = process_pdf_with_ocr(source, dpi_setting, language, engine_mode,
+                                                  psm_mode, include_images=include_images,
+                                                  page_numbers=scanned_pages)
+                return merge_hybrid_pdf_result(ocr_result, page_texts, page_count)
+
         # Second attempt: OCR processing for image-based PDFs
-        return process_pdf_with_ocr(filepath, dpi_setting, language, engine_mode, psm_mode)
+        return process_pdf_with_ocr(source, dpi_setting, language, engine_mode, psm_mode,
+                                    include_images=include_images, page_range=page_range)
 
     except (RuntimeError, ValueError, OSError) as e:
         raise ValueError(f"PDF processing failed: {str(e)}") from e
 
 
-def convert_pdf_to_images(filepath, dpi_setting):
+def get_pdf_page_count(filepath):
     """
-    Convert PDF pages to images for OCR processing
+    Read the number of pages in a PDF without rasterizing it
 
     Args:
         filepath (str): Path to the PDF file
-        dpi_setting (str): DPI setting for conversion
 
     Returns:
-        list: List of PIL Image objects
+        int: Number of pages in the PDF
     """
-    pdf_dpi = config.DPI_PRESETS.get(dpi_setting, config.DPI_PRESETS['medium'])
-    max_pages = config.MAX_PDF_PAGES if config.MAX_PDF_PAGES > 0 else None
+    try:
+        pdf_info = pdf2image.pdfinfo_from_path(filepath, poppler_path=config.POPPLER_PATH)
+    except (pdf2image.exceptions.PDFInfoNotInstalledError,
+            pdf2image.exceptions.PDFPageCountError,
+            pdf2image.exceptions.PDFSyntaxError) as e:
+        raise ValueError(f"Unable to read PDF page count: {str(e)}") from e
+    return int(pdf_info.get('Pages', 0))
 
-    return pdf2image.convert_from_path(
-        filepath,
-        dpi=pdf_dpi,
-        last_page=max_pages,
-        poppler_path=config.POPPLER_PATH
-    )
 
+def convert_pdf_to_images(filepath, dpi_setting, output_folder, page_range=None,
+                          page_numbers=None):
+    """
+    Rasterize PDF pages one at a time into a working folder for OCR processing
+    Pages are rendered lazily, so only the pages currently being OCR'd exist at once
+
+    Args:
+        filepath (str): Path to the PDF file
+        dpi_setting (str): DPI setting for conversion
+        output_folder (str): Folder that receives the rendered page files
+        page_range (tuple): Optional (first_page, last_page), either end may be None
+        page_numbers (list): Explicit pages to render instead of a range (already validated)
+
+    Yields:
+        tuple: (page_num, image_path) for each rendered page
+    """
+    pdf_dpi = config.DPI_PRESETS.get(dpi_setting, config.DPI_PRESETS['medium'])
+    if page_numbers is None:
+        first_page, last_page = resolve_pdf_page_range(
+            get_pdf_page_count(filepath), *(page_range or (None, None))
+        )
+        page_numbers = range(first_page, last_page + 1)
+    jobs.set_progress(pages_done=0, pages_total=len(page_numbers))
+
+    for page_num in page_numbers:
+        # PPM is uncompressed, so writing and re-reading it costs no encoding time
+        with timing.measure('rasterization', page=page_num):
+            image_paths = pdf2image.convert_from_path(
+                filepath,
+                dpi=pdf_dpi,
+                first_page=page_num,
+                last_page=page_num,
+                output_folder=output_folder,
+                fmt='ppm',
+                paths_only=True,
+                poppler_path=config.POPPLER_PATH
+            )
+        if image_paths:
+            yield page_num, image_paths[0]
 
-def process_pdf_page_with_ocr(image, page_num, base_filename, ocr_settings):
+
+def process_pdf_page_with_ocr(image_path, page_num, ocr_settings):
     """
-    Process a single PDF page with OCR
+    Process a single rendered PDF page with OCR, entirely in memory
 
     Args:
-        image: PIL Image object
+        image_path (str): Path to the rendered page image
         page_num (int): Page number
-        base_filename (str): Base filename for saving
         ocr_settings (dict): OCR processing settings
 
     Returns:
-        tuple: (page_ocr_result, image_filename)
+        dict: Page OCR result with page numbers on every entry and stage timings
     """
-    # Save the converted image
-    image_filename = f"{base_filename}_page_{page_num}.png"
-    image_path = os.path.join(config.UPLOAD_FOLDER, image_filename)
-    image.save(image_path, 'PNG')
+    # Decode the rendered page once and OCR it without re-encoding to PNG
+    with timing.collect() as page_timings:
+        with Image.open(image_path) as image:
+            with timing.measure('image_decode'):
+                image.load()
+            # Pages are already rasterized at the preset DPI; capping them would make
+            # every preset produce the same image size
+            page_ocr_result = process_image(image, page=page_num, cap_dimension=False,
+                                            **ocr_settings)
 
-    # Process the page with OCR
-    page_ocr_result = process_image(image_path, **ocr_settings)
+    # Timings travel with the result because this may run in a worker process
+    page_ocr_result['timings'] = timing.stage_totals(page_timings)
+    return page_ocr_result
 
-    # Add page information to each OCR entry
-    for entry in page_ocr_result['data']:
-        entry['page'] = page_num
 
-    return page_ocr_result, image_filename
+def save_page_preview(image_path, preview_path):
+    """
+    Write a PNG preview of a rendered PDF page for the frontend
+
+    Args:
+        image_path (str): Path to the rendered page image
+        preview_path (str): Destination path for the preview PNG
+    """
+    with Image.open(image_path) as image:
+        if config.PDF_PREVIEW_MAX_DIMENSION > 0:
+            image.thumbnail((config.PDF_PREVIEW_MAX_DIMENSION, config.PDF_PREVIEW_MAX_DIMENSION))
+        image.save(preview_path, 'PNG', compress_level=config.PDF_PREVIEW_COMPRESS_LEVEL)
+    storage.note_stored_file(preview_path)
+
+
+def get_preview_executor():
+    """
+    Get the shared thread pool used to write page previews, creating it on first use
+
+    Returns:
+        ThreadPoolExecutor: Shared preview writer pool
+    """
+    with _PREVIEW_POOL_LOCK:
+        if _PREVIEW_POOL['executor'] is None:
+            _PREVIEW_POOL['executor'] = ThreadPoolExecutor(
+                max_workers=max(1, config.PDF_PREVIEW_THREADS),
+                thread_name_prefix='docusense-preview'
+            )
+        return _PREVIEW_POOL['executor']
 
 
-def build_pdf_ocr_result(images, filepath, ocr_settings):
+def start_page_preview(image_path, page_num, base_filename, include_images):
     """
-    Process PDF images and build OCR result
+    Start writing a page preview in the background when previews are requested
 
     Args:
-        images: List of PIL images
-        filepath: Original PDF file path
-        ocr_settings: Dictionary of OCR settings
+        image_path (str): Path to the rendered page image
+        page_num (int): Page number
+        base_filename (str): Base filename for the preview
+        include_images (bool): Whether the client wants page previews
 
     Returns:
-        dict: Complete OCR result
+        tuple: (preview_future, image_filename), both None when previews are skipped
     """
-    base_filename = os.path.splitext(os.path.basename(filepath))[0]
-    page_results = [
-        process_pdf_page_with_ocr(image, page_num, base_filename, ocr_settings)
-        for page_num, image in enumerate(images, 1)
-    ]
+    if not include_images:
+        return None, None
+    image_filename = f"{base_filename}_page_{page_num}.png"
+    preview_path = storage.get_storage_path(image_filename, create=True)
+    preview_future = get_preview_executor().submit(save_page_preview, image_path, preview_path)
+    return preview_future, image_filename
 
-    # Extract data and filenames
-    all_data = [item for page_result, _ in page_results for item in page_result['data']]
-    all_images = [filename for _, filename in page_results]
-    first_settings = next(
-        (pr['ocr_settings'] for pr, _ in page_results if 'ocr_settings' in pr), None
-    )
 
-    result = {
+def finish_pdf_page(page_job):
+    """
+    Wait for a page's OCR and preview work and release its rendered image
+
+    Args:
+        page_job (tuple): (page_num, ocr_result_or_future, preview_future, image_path,
+                           image_filename)
+
+    Returns:
+        tuple: (page_ocr_result, image_filename)
+    """
+    page_num, ocr_result, preview_future, image_path, image_filename = page_job
+    try:
+        # Parallel pages carry a future, sequential pages the finished result
+        page_ocr_result = ocr_result.result() if hasattr(ocr_result, 'result') else ocr_result
+    finally:
+        # The rendered page must outlive the preview writer before it can be removed
+        if preview_future is not None:
+            preview_future.result()
+        os.remove(image_path)
+    timing.record_page(page_num, page_ocr_result.pop('timings', {}))
+    metrics.increment('docusense_pages_ocr_total')
+    jobs.advance_progress()
+    return page_ocr_result, image_filename
+
+
+def get_ocr_worker_count():
+    """
+    Determine how many worker processes to use for multi-page OCR
+
+    Returns:
+        int: Number of OCR worker processes (at least 1)
+    """
+    if config.OCR_WORKER_PROCESSES > 0:
+        return config.OCR_WORKER_PROCESSES
+    return os.cpu_count() or 1
+
+
+def get_ocr_pool_context():
+    """
+    Get the multiprocessing context OCR worker processes are started with
+
+    Returns:
+        multiprocessing.context.BaseContext: Context for config.OCR_POOL_START_METHOD
+    """
+    start_method = config.OCR_POOL_START_METHOD
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = 'spawn'
+    return multiprocessing.get_context(start_method)
+
+
+def get_ocr_worker_state():
+    """
+    Capture the server state a freshly started OCR worker process needs
+
+    Returns:
+        tuple: (config values, Tesseract discovery, Tesseract metadata), the arguments
+               of init_ocr_worker()
+    """
+    config_values = {name: value for name, value in vars(config).items() if name.isupper()}
+    discovery = {key: _TESSERACT_DISCOVERY[key] for key in ('done', 'cmd', 'version')}
+    with _TESSERACT_INFO_LOCK:
+        tesseract_info = {key: _TESSERACT_INFO[key] for key in ('languages', 'version')}
+    return config_values, discovery, tesseract_info
+
+
+def init_ocr_worker(config_values, discovery, tesseract_info):
+    """
+    Prepare a freshly started OCR worker process
+    Workers do not inherit the server's memory, so its configuration and Tesseract
+    discovery are passed in instead of probed again, and persistent OCR engines are
+    loaded before the first page arrives
+
+    Args:
+        config_values (dict): The server's config module settings
+        discovery (dict): The server's Tesseract discovery result
+        tesseract_info (dict): The server's cached Tesseract languages and version
+    """
+    for name, value in config_values.items():
+        setattr(config, name, value)
+    if discovery['done']:
+        _TESSERACT_DISCOVERY.update(discovery)
+    if tesseract_info['languages'] is not None:
+        _TESSERACT_INFO.update(tesseract_info, loaded_at=time.monotonic())
+    # An initializer error would break the whole pool; a failed warm-up only costs the
+    # first page its load time, and any real error is reported for that page
+    try:
+        warm_up_ocr_state()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print(f"⚠️ OCR worker warm-up failed: {str(e) or type(e).__name__}")
+
+
+def get_ocr_executor():
+    """
+    Get the shared process pool used for concurrent page OCR, creating it on first use
+    Workers start from a fresh interpreter (see config.OCR_POOL_START_METHOD): forking
+    the threaded server could copy a lock that another thread holds at that moment
+
+    Returns:
+        ProcessPoolExecutor: Shared OCR worker pool
+    """
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL['executor'] is None:
+            _OCR_POOL['executor'] = ProcessPoolExecutor(
+                max_workers=get_ocr_worker_count(), mp_context=get_ocr_pool_context(),
+                initializer=init_ocr_worker, initargs=get_ocr_worker_state()
+            )
+        return _OCR_POOL['executor']
+
+
+def reset_ocr_executor():
+    """
+    Discard the shared OCR process pool so the next request starts a fresh one
+    Used after a worker process dies and leaves the pool unusable
+    """
+    with _OCR_POOL_LOCK:
+        executor = _OCR_POOL['executor']
+        _OCR_POOL['executor'] = None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def run_pdf_page_pipeline(page_images, base_filename, ocr_settings, include_images=True):
+    """
+    OCR rendered PDF pages as they are produced, keeping only a bounded number in flight
+
+    Args:
+        page_images: Iterator of (page_num, image_path) tuples
+        base_filename (str): Base filename for saving page previews
+        ocr_settings (dict): OCR processing settings
+        include_images (bool): Whether to write page preview images
+
+    Returns:
+        list: (page_ocr_result, image_filename) tuples in page order
+    """
+    worker_count = get_ocr_worker_count()
+    page_results = []
+
+    # Sequential path: render one page, OCR it, release it, move to the next
+    if worker_count <= 1:
+        for page_num, image_path in page_images:
+            preview_future, image_filename = start_page_preview(
+                image_path, page_num, base_filename, include_images
+            )
+            page_ocr_result = process_pdf_page_with_ocr(image_path, page_num, ocr_settings)
+            page_results.append(
+                finish_pdf_page((page_num, page_ocr_result, preview_future, image_path,
+                                 image_filename))
+            )
+        return page_results
+
+    # Parallel path: keep every worker busy but never render more pages than workers
+    executor = get_ocr_executor()
+    pending = deque()
+    try:
+        for page_num, image_path in page_images:
+            preview_future, image_filename = start_page_preview(
+                image_path, page_num, base_filename, include_images
+            )
+            ocr_future = executor.submit(
+                process_pdf_page_with_ocr, image_path, page_num, ocr_settings
+            )
+            pending.append((page_num, ocr_future, preview_future, image_path, image_filename))
+            if len(pending) >= worker_count:
+                page_results.append(finish_pdf_page(pending.popleft()))
+
+        while pending:
+            page_results.append(finish_pdf_page(pending.popleft()))
+    except BrokenProcessPool as e:
+        reset_ocr_executor()
+        raise RuntimeError(f"OCR worker process terminated unexpectedly: {str(e)}") from e
+    finally:
+        # Do not leave queued pages running after a failure
+        for _, ocr_future, _, _, _ in pending:
+            ocr_future.cancel()
+
+    return page_results
+
+
+def build_pdf_ocr_result(page_images, filepath, ocr_settings, include_images=True):
+    """
+    Process rendered PDF pages and build OCR result
+
+    Args:
+        page_images: Iterator of (page_num, image_path) tuples
+        filepath: Original PDF file path
+        ocr_settings: Dictionary of OCR settings
+        include_images: Whether to write page previews and list them in the result
+
+    Returns:
+        dict: Complete OCR result
+    """
+    base_filename = os.path.splitext(os.path.basename(filepath))[0]
+    page_results = run_pdf_page_pipeline(page_images, base_filename, ocr_settings, include_images)
+    if not page_results:
+        raise ValueError("No pages found in PDF")
+
+    # Extract data and filenames
+    all_data = [item for page_result, _ in page_results for item in page_result['data']]
+    first_settings = next(
+        (pr['ocr_settings'] for pr, _ in page_results if 'ocr_settings' in pr), None
+    )
+
+    result = {
         'data': all_data,
-        'converted_images': all_images,
         'processing_method': 'ocr',
-        'page_count': len(images),
-        'message': f'OCR processed {len(images)} page(s)'
+        'page_count': len(page_results),
+        'message': f'OCR processed {len(page_results)} page(s)'
     }
 
+    if include_images:
+        result['converted_images'] = [filename for _, filename in page_results]
     if first_settings:
         result['ocr_settings'] = first_settings
 
     return result
 
 
-def process_pdf_with_ocr(filepath, dpi_setting='medium', language='eng',
-                         engine_mode='lstm', psm_mode='auto'):
+@timing.measured('process_pdf_with_ocr')
+# pylint: disable-next=too-many-arguments
+def process_pdf_with_ocr(source, dpi_setting='medium', language='eng',
+                         engine_mode='lstm', psm_mode='auto', *,
+                         include_images=True, page_range=None, page_numbers=None):
     """
     Process PDF using OCR with multi-page support and advanced settings
 
     Args:
-        filepath (str): Path to the PDF file
+        source: Path to the PDF file or the in-memory upload
         dpi_setting (str): DPI setting for image preprocessing
         language (str): Language code for OCR
         engine_mode (str): OCR engine mode
         psm_mode (str): Page segmentation mode
+        include_images (bool): Whether to write page preview images
+        page_range (tuple): Optional (first_page, last_page), either end may be None
+        page_numbers (list): Explicit pages to OCR instead of a range
 
     Returns:
         dict: OCR data with page information and processing metadata
     """
     try:
-        # Convert PDF pages to images
-        images = convert_pdf_to_images(filepath, dpi_setting)
-        if not images:
-            raise ValueError("No pages found in PDF")
-
-        # Process pages and build result
         ocr_settings = {
             'dpi_setting': dpi_setting, 'language': language,
             'engine_mode': engine_mode, 'psm_mode': psm_mode
         }
-        return build_pdf_ocr_result(images, filepath, ocr_settings)
+
+        # Rasterize pages lazily into a scratch folder that is removed afterwards
+        with tempfile.TemporaryDirectory(prefix='docusense_pdf_') as render_folder:
+            # Poppler only reads files, so in-memory uploads are spilled into the same folder
+            pdf_path = spill_source_to_file(source, render_folder, '.pdf')
+            page_images = convert_pdf_to_images(pdf_path, dpi_setting, render_folder,
+                                                page_range, page_numbers)
+            return build_pdf_ocr_result(page_images, pdf_path, ocr_settings, include_images)
 
     except (RuntimeError, ValueError, OSError) as e:
         raise ValueError(f"PDF OCR processing failed: {str(e)}") from e
 
 
-def process_docx(filepath):
+@timing.measured('process_docx')
+def process_docx(source):
     """
     Extract text content from DOCX file
 
     Args:
-        filepath (str): Path to the DOCX file
+        source: Path to the DOCX file or the in-memory upload
 
     Returns:
         dict: Extracted text content
     """
-    if not OCR_AVAILABLE:
+    if not is_ocr_available():
         return {'data': {'text_only': 'DOCX processing not available - demo mode'}}
     try:
         # Open and read DOCX document
-        doc = Document(filepath)
+        with open_source(source) as stream:
+            doc = docx.Document(stream)
 
         # Extract text from all paragraphs
         text_content = []
@@ -577,20 +1354,26 @@ def process_docx(filepath):
         raise ValueError(f"DOCX processing failed: {str(e)}") from e
 
 
-def process_txt(filepath):
+@timing.measured('process_txt')
+def process_txt(source):
     """
     Read and return content from plain text file
 
     Args:
-        filepath (str): Path to the TXT file
+        source: Path to the TXT file or the in-memory upload
 
     Returns:
         dict: File content as text
     """
     try:
         # Read text file content with proper encoding handling
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as file:
-            content = file.read().strip()
+        with open_source(source) as stream:
+            text_stream = io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+            try:
+                content = text_stream.read().strip()
+            finally:
+                # Leave the underlying stream open; open_source owns it
+                text_stream.detach()
 
         return {'data': {'text_only': content}}
 
@@ -600,27 +1383,203 @@ def process_txt(filepath):
         raise ValueError(f"Text file processing failed: {str(e)}") from e
 
 
-def process_csv(filepath):
+def render_table_cells(df):
     """
-    Process CSV file and extract structured content
+    Normalize every DataFrame cell to its display string in one vectorized pass
+    Missing and whitespace-only cells become empty strings
 
     Args:
-        filepath (str): Path to the CSV file
+        df (DataFrame): Table data
 
     Returns:
-        dict: Structured CSV data as text with table formatting
+        numpy.ndarray: 2-D array of cell strings
     """
+    cells = df.fillna('').to_numpy(dtype=str)
+    return np.where(np.char.strip(cells) == '', '', cells)
+
+
+def render_table_lines(df):
+    """
+    Render DataFrame rows as ' | '-joined text lines
+
+    Args:
+        df (DataFrame): Table data
+
+    Returns:
+        list: One text line per row
+    """
+    return [" | ".join(row) for row in render_table_cells(df).tolist()]
+
+
+def build_table_records(df):
+    """
+    Build structured rows for JSON output
+
+    Args:
+        df (DataFrame): Table data
+
+    Returns:
+        dict: Column names and rows as lists of cell strings
+    """
+    return {
+        'columns': [str(column) for column in df.columns],
+        'rows': render_table_cells(df).tolist()
+    }
+
+
+def sniff_csv_format(source):
+    """
+    Detect the encoding, delimiter and column count of a CSV file from a small prefix
+
+    Args:
+        source: Path to the CSV file or the in-memory upload
+
+    Returns:
+        dict: 'encoding', 'delimiter' and 'columns' (header field count)
+    """
+    with open_source(source) as file:
+        prefix = file.read(config.CSV_SNIFF_BYTES)
+
+    # A UTF-8 byte order mark settles the encoding; otherwise use the first that decodes
+    if prefix.startswith(codecs.BOM_UTF8):
+        encoding = 'utf-8-sig'
+        prefix = prefix[len(codecs.BOM_UTF8):]
+    else:
+        encoding = None
+        for candidate in [config.CSV_ENCODING] + config.CSV_FALLBACK_ENCODINGS:
+            try:
+                # final=False tolerates a multi-byte character cut off at the end of the prefix
+                codecs.getincrementaldecoder(candidate)().decode(prefix, final=False)
+            except UnicodeDecodeError:
+                continue
+            encoding = candidate
+            break
+        if encoding is None:
+            raise ValueError("Unable to detect the CSV file encoding")
+
+    sample = codecs.getincrementaldecoder(encoding)(errors='replace').decode(prefix)
+    # Only sniff complete lines so a truncated last row does not skew the result
+    if len(prefix) == config.CSV_SNIFF_BYTES and '\n' in sample:
+        sample = sample[:sample.rindex('\n')]
+
     try:
-        # Read CSV file with pandas for robust handling
-        df = pd.read_csv(
-            filepath,
-            encoding=config.CSV_ENCODING,
-            delimiter=config.CSV_DELIMITER,
+        delimiter = csv.Sniffer().sniff(sample, delimiters=config.CSV_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = config.CSV_DELIMITER
+
+    header = next(csv.reader(io.StringIO(sample), delimiter=delimiter), [])
+    return {'encoding': encoding, 'delimiter': delimiter, 'columns': len(header)}
+
+
+def read_csv_rows(source, csv_format, max_rows=None):
+    """
+    Read a bounded window of CSV rows as strings
+    Only the requested rows (and at most EXCEL_MAX_COLUMNS columns) are parsed
+
+    Args:
+        source: Path to the CSV file or the in-memory upload
+        csv_format (dict): Output of sniff_csv_format()
+        max_rows (int): Maximum number of data rows to read, None for all
+
+    Returns:
+        DataFrame: The requested rows
+    """
+    use_columns = None
+    if csv_format['columns'] > config.EXCEL_MAX_COLUMNS:
+        use_columns = list(range(config.EXCEL_MAX_COLUMNS))
+
+    with open_source(source) as stream:
+        return pd.read_csv(
+            stream,
+            encoding=csv_format['encoding'],
+            delimiter=csv_format['delimiter'],
+            nrows=max_rows,
+            usecols=use_columns,
             on_bad_lines='skip',  # Skip problematic lines
             dtype=str,  # Read all as strings to preserve formatting
             keep_default_na=False  # Don't convert empty strings to NaN
         )
 
+
+def read_csv_records(file, max_records):
+    """
+    Read whole CSV records as raw bytes from the current file position
+    A record continues over line breaks while a quoted field is open; blank lines
+    are skipped like pandas does
+
+    Args:
+        file: Binary file object
+        max_records (int): Maximum number of records to read
+
+    Returns:
+        list: Raw records, each ending with its line break
+    """
+    records = []
+    while len(records) < max_records:
+        record = file.readline()
+        if not record:
+            break
+        # An odd number of quote characters means a quoted field spans the line break
+        while record.count(b'"') % 2:
+            continuation = file.readline()
+            if not continuation:
+                break
+            record += continuation
+        if record.strip():
+            records.append(record)
+    return records
+
+
+def read_csv_page(file_path, csv_format, cursor, limit):
+    """
+    Read one page of CSV rows starting at a byte offset
+    The file is positioned with a seek, so a page costs the same anywhere in the file
+
+    Args:
+        file_path (str): Path to the CSV file
+        csv_format (dict): Output of sniff_csv_format()
+        cursor (int): Byte offset of the page's first row (0 = first data row)
+        limit (int): Maximum number of rows
+
+    Returns:
+        tuple: (DataFrame, next_cursor) with next_cursor None on the last page, or None
+               if the cursor does not point at the start of a data row
+    """
+    with open(file_path, 'rb') as file:
+        header = read_csv_records(file, 1)
+        if cursor:
+            if cursor < file.tell():
+                return None
+            file.seek(cursor - 1)
+            if file.read(1) != b'\n':
+                return None
+        records = read_csv_records(file, limit)
+        next_cursor = file.tell()
+        has_more = bool(read_csv_records(file, 1))
+
+    # The page is parsed on its own, with the header row in front for the column names
+    df = read_csv_rows(b''.join(header + records), csv_format)
+    return df, next_cursor if has_more else None
+
+
+@timing.measured('process_csv')
+def process_csv(source, table_rows=False):
+    """
+    Process CSV file and extract structured content
+
+    Args:
+        source: Path to the CSV file or the in-memory upload
+        table_rows (bool): Also return the rows as structured JSON under 'table'
+
+    Returns:
+        dict: Structured CSV data as text with table formatting
+    """
+    try:
+        # Sniff the format from a prefix, then parse only the rows that are displayed
+        csv_format = sniff_csv_format(source)
+        # One extra row tells whether the file was truncated without reading the rest
+        df = read_csv_rows(source, csv_format, max_rows=config.EXCEL_MAX_ROWS + 1)
+
         # Limit the data size to avoid memory issues
         if len(df) > config.EXCEL_MAX_ROWS:
             df = df.head(config.EXCEL_MAX_ROWS)
@@ -628,8 +1587,7 @@ def process_csv(filepath):
         else:
             truncated_message = ""
 
-        if len(df.columns) > config.EXCEL_MAX_COLUMNS:
-            df = df.iloc[:, :config.EXCEL_MAX_COLUMNS]
+        if csv_format['columns'] > config.EXCEL_MAX_COLUMNS:
             truncated_message += f" (truncated to {config.EXCEL_MAX_COLUMNS} columns)"
 
         # Convert to formatted string representation
@@ -640,25 +1598,26 @@ def process_csv(filepath):
         formatted_content.append("=" * 50)
 
         # Add column headers
-        header_row = " | ".join(df.columns)
+        header_row = " | ".join(map(str, df.columns))
         formatted_content.append(header_row)
         formatted_content.append("-" * len(header_row))
 
         # Add data rows
-        for _, row in df.iterrows():
-            row_text = " | ".join(
-                str(cell) if pd.notna(cell) and str(cell).strip() else "" for cell in row
-            )
-            formatted_content.append(row_text)
+        formatted_content.extend(render_table_lines(df))
 
         full_text = '\n'.join(formatted_content)
 
-        return {
+        result = {
             'data': {'text_only': full_text},
             'file_type': 'csv',
             'rows': len(df),
-            'columns': len(df.columns)
+            'columns': len(df.columns),
+            'encoding': csv_format['encoding'],
+            'delimiter': csv_format['delimiter']
         }
+        if table_rows:
+            result['table'] = build_table_records(df)
+        return result
 
     except pd.errors.EmptyDataError:
         return {'data': {'text_only': 'CSV file is empty or contains no data'}}
@@ -703,70 +1662,305 @@ def format_excel_sheet_data(df, sheet_name, sheet_idx, original_size):
         return sheet_content
 
     # Add headers and data
-    header_row = " | ".join(df.columns)
+    header_row = " | ".join(map(str, df.columns))
     sheet_content.append(header_row)
     sheet_content.append("." * min(len(header_row), 80))
 
     # Add data rows
-    for _, row in df.iterrows():
-        row_text = " | ".join(
-            str(cell) if pd.notna(cell) and str(cell).strip() else ""
-            for cell in row
-        )
-        sheet_content.append(row_text)
+    sheet_content.extend(render_table_lines(df))
 
     return sheet_content
 
 
-def process_excel(filepath):
+def select_excel_sheets(sheet_names, sheet_selectors=None):
     """
-    Process Excel file (.xls, .xlsx) and extract structured content
+    Resolve requested sheets by name or 1-based position
+
+    Args:
+        sheet_names (list): Sheet names in workbook order
+        sheet_selectors (list): Requested sheet names or positions, None for all sheets
+
+    Returns:
+        tuple: (selected, unknown) where selected holds (sheet_idx, sheet_name) in
+        workbook order and unknown lists selectors that match no sheet
+    """
+    if not sheet_selectors:
+        return list(enumerate(sheet_names)), []
+
+    selected_indexes = set()
+    unknown = []
+    for selector in sheet_selectors:
+        if selector in sheet_names:
+            selected_indexes.add(sheet_names.index(selector))
+        elif selector.isdigit() and 1 <= int(selector) <= len(sheet_names):
+            selected_indexes.add(int(selector) - 1)
+        else:
+            unknown.append(selector)
+    return [(idx, sheet_names[idx]) for idx in sorted(selected_indexes)], unknown
+
+
+def open_excel_workbook(source):
+    """
+    Open an Excel workbook without loading sheet data
+    .xlsx files use openpyxl in read-only mode, which streams rows from the archive
+
+    Args:
+        source: Path to the Excel file or the in-memory upload
+
+    Returns:
+        tuple: (workbook, sheet_names) where workbook is an openpyxl Workbook or pd.ExcelFile
+    """
+    if isinstance(source, str):
+        is_xlsx = source.lower().endswith('.xlsx')
+    else:
+        # No filename to go by: .xlsx is a zip archive, legacy .xls is not
+        source = to_binary_stream(source)
+        is_xlsx = zipfile.is_zipfile(source)
+        source.seek(0)
+
+    if is_xlsx:
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+        return workbook, list(workbook.sheetnames)
+    excel_file = pd.ExcelFile(source)
+    return excel_file, list(excel_file.sheet_names)
+
+
+def build_excel_header(header_cells):
+    """
+    Name header columns the way pandas.read_excel does
+
+    Args:
+        header_cells (list): Values of the first sheet row
+
+    Returns:
+        list: Unique column names ('Unnamed: n' for blanks, '.n' suffix for duplicates)
+    """
+    header = []
+    for column_idx, cell in enumerate(header_cells):
+        name = f'Unnamed: {column_idx}' if cell is None or str(cell) == '' else str(cell)
+        unique_name, duplicate_count = name, 0
+        while unique_name in header:
+            duplicate_count += 1
+            unique_name = f'{name}.{duplicate_count}'
+        header.append(unique_name)
+    return header
+
+
+def format_excel_cell(cell):
+    """
+    Convert an openpyxl cell value to the string pandas.read_excel(dtype=str) gives
+    Whole-number floats print as integers (1e20 as 100000000000000000000, 2.0 as 2)
+
+    Args:
+        cell: Cell value from openpyxl
+
+    Returns:
+        str: Cell string, empty for blank cells
+    """
+    if cell is None:
+        return ''
+    if isinstance(cell, float) and cell.is_integer():
+        return str(int(cell))
+    return str(cell)
+
+
+def read_excel_sheet_window(workbook, sheet_name):
+    """
+    Read at most EXCEL_MAX_ROWS rows and EXCEL_MAX_COLUMNS columns of one sheet
+    The original size is what was read; only for a truncated sheet, whose remaining
+    rows or columns are never read, it comes from the sheet's dimension metadata
+
+    Args:
+        workbook: Workbook returned by open_excel_workbook()
+        sheet_name (str): Name of the sheet to read
+
+    Returns:
+        tuple: (DataFrame of cell strings, original (rows, cols) excluding the header row)
+    """
+    if isinstance(workbook, pd.ExcelFile):
+        # Legacy .xls: pandas still parses the sheet, but only the window is kept
+        df = pd.read_excel(workbook, sheet_name=sheet_name, dtype=str,
+                           keep_default_na=False, nrows=config.EXCEL_MAX_ROWS + 1)
+        original_size = df.shape
+        return df.head(config.EXCEL_MAX_ROWS).iloc[:, :config.EXCEL_MAX_COLUMNS], original_size
+
+    worksheet = workbook[sheet_name]
+    # Header row, the displayed rows and one extra row and column that reveal truncation
+    rows = []
+    for row in worksheet.iter_rows(max_row=config.EXCEL_MAX_ROWS + 2,
+                                   max_col=config.EXCEL_MAX_COLUMNS + 1, values_only=True):
+        cells = [format_excel_cell(cell) for cell in row]
+        # Drop trailing blank cells; rows are padded to a common width below
+        while cells and not cells[-1]:
+            cells.pop()
+        rows.append(cells)
+
+    # Drop trailing blank rows like pandas does
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows:
+        return pd.DataFrame(), (0, 0)
+
+    width = max(len(cells) for cells in rows)
+    rows = [cells + [''] * (width - len(cells)) for cells in rows]
+    df = pd.DataFrame(rows[1:], columns=build_excel_header(rows[0]))
+
+    # Dimension metadata also counts formatted empty cells, so it is only used to size
+    # the part of a truncated sheet that was not read (sheets without it report None)
+    original_rows, original_columns = df.shape
+    if original_rows > config.EXCEL_MAX_ROWS:
+        original_rows = max(original_rows, (worksheet.max_row or 0) - 1)
+    if original_columns > config.EXCEL_MAX_COLUMNS:
+        original_columns = max(original_columns, worksheet.max_column or 0)
+    window = df.head(config.EXCEL_MAX_ROWS).iloc[:, :config.EXCEL_MAX_COLUMNS]
+    return window, (original_rows, original_columns)
+
+
+def process_excel_sheet(workbook, sheet_idx, sheet_name, table_rows=False):
+    """
+    Read and format one sheet, reporting errors in the output instead of raising
+
+    Args:
+        workbook: Workbook returned by open_excel_workbook()
+        sheet_idx (int): Index of the sheet in the workbook
+        sheet_name (str): Name of the sheet
+        table_rows (bool): Also build the sheet's rows as structured JSON
+
+    Returns:
+        tuple: (formatted content lines, table records or None)
+    """
+    try:
+        # Read the bounded window of the sheet
+        df, original_size = read_excel_sheet_window(workbook, sheet_name)
+
+        # Format sheet data using helper function
+        sheet_content = format_excel_sheet_data(df, sheet_name, sheet_idx, original_size)
+        sheet_table = {'sheet': sheet_name, **build_table_records(df)} if table_rows else None
+        return sheet_content, sheet_table
+
+    except (pd.errors.ParserError, ValueError, KeyError, TypeError) as sheet_error:
+        return [f"Error processing sheet '{sheet_name}': {str(sheet_error)}"], None
+
+
+def process_excel_sheet_from_file(filepath, sheet_idx, sheet_name, table_rows=False):
+    """
+    Open a workbook and process one of its sheets (runs in a worker process)
 
     Args:
         filepath (str): Path to the Excel file
+        sheet_idx (int): Index of the sheet in the workbook
+        sheet_name (str): Name of the sheet
+        table_rows (bool): Also build the sheet's rows as structured JSON
 
     Returns:
-        dict: Structured Excel data as text with sheet information
+        tuple: (formatted content lines, table records or None)
     """
+    workbook, _ = open_excel_workbook(filepath)
     try:
-        # Read Excel file and get all sheet names
-        excel_file = pd.ExcelFile(filepath)
-        sheet_names = excel_file.sheet_names
+        return process_excel_sheet(workbook, sheet_idx, sheet_name, table_rows)
+    finally:
+        workbook.close()
 
-        formatted_content = []
-        formatted_content.append(f"Excel File Content ({len(sheet_names)} sheet(s))")
-        formatted_content.append("=" * 60)
 
-        # Process each sheet
-        for sheet_idx, sheet_name in enumerate(sheet_names):
-            try:
-                # Read and limit sheet data
-                df = pd.read_excel(
-                    excel_file,
-                    sheet_name=sheet_name,
-                    dtype=str,
-                    keep_default_na=False
-                )
+def should_parse_sheets_in_parallel(sheet_count):
+    """
+    Decide whether a workbook's sheets are worth parsing in the worker process pool
+    Every worker reopens the workbook, so this only pays off for many sheets
 
-                original_size = df.shape
-                df = df.head(config.EXCEL_MAX_ROWS)
-                df = df.iloc[:, :config.EXCEL_MAX_COLUMNS]
+    Args:
+        sheet_count (int): Number of selected sheets
 
-                # Format sheet data using helper function
-                sheet_content = format_excel_sheet_data(df, sheet_name, sheet_idx, original_size)
-                formatted_content.extend(sheet_content)
+    Returns:
+        bool: True if sheets should be parsed concurrently
+    """
+    return (0 < config.EXCEL_PARALLEL_MIN_SHEETS <= sheet_count
+            and get_ocr_worker_count() > 1)
 
-            except (pd.errors.ParserError, ValueError, KeyError) as sheet_error:
-                formatted_content.append(
-                    f"Error processing sheet '{sheet_name}': {str(sheet_error)}"
-                )
 
-        return {
+def run_excel_sheets_in_pool(filepath, selected_sheets, table_rows=False):
+    """
+    Parse sheets concurrently in the shared worker process pool
+
+    Args:
+        filepath (str): Path to the Excel file
+        selected_sheets (list): (sheet_idx, sheet_name) tuples in workbook order
+        table_rows (bool): Also build each sheet's rows as structured JSON
+
+    Returns:
+        list: (formatted content lines, table records or None) per sheet, in workbook order
+    """
+    executor = get_ocr_executor()
+    sheet_futures = [
+        executor.submit(process_excel_sheet_from_file, filepath, sheet_idx, sheet_name,
+                        table_rows)
+        for sheet_idx, sheet_name in selected_sheets
+    ]
+    try:
+        return [sheet_future.result() for sheet_future in sheet_futures]
+    except BrokenProcessPool as e:
+        reset_ocr_executor()
+        raise RuntimeError(f"Excel worker process terminated unexpectedly: {str(e)}") from e
+    finally:
+        # Do not leave queued sheets running after a failure
+        for sheet_future in sheet_futures:
+            sheet_future.cancel()
+
+
+@timing.measured('process_excel')
+def process_excel(source, table_rows=False, sheet_selectors=None):
+    """
+    Process Excel file (.xls, .xlsx) and extract structured content
+
+    Args:
+        source: Path to the Excel file or the in-memory upload
+        table_rows (bool): Also return each sheet's rows as structured JSON under 'tables'
+        sheet_selectors (list): Sheet names or 1-based positions to process, None for all
+
+    Returns:
+        dict: Structured Excel data as text with sheet information
+    """
+    try:
+        # Open the workbook and resolve the requested sheets without loading any rows
+        workbook, sheet_names = open_excel_workbook(source)
+        selected_sheets, unknown_sheets = select_excel_sheets(sheet_names, sheet_selectors)
+
+        sheet_tables = []
+        if sheet_selectors:
+            sheet_count = f"{len(selected_sheets)} of {len(sheet_names)}"
+        else:
+            sheet_count = f"{len(sheet_names)}"
+        formatted_content = [f"Excel File Content ({sheet_count} sheet(s))", "=" * 60]
+        formatted_content.extend(f"Sheet '{selector}' not found" for selector in unknown_sheets)
+
+        # Process each selected sheet, concurrently for saved workbooks with many sheets
+        # (workers reopen the file, so in-memory uploads are parsed here)
+        try:
+            if isinstance(source, str) and should_parse_sheets_in_parallel(len(selected_sheets)):
+                sheet_outputs = run_excel_sheets_in_pool(source, selected_sheets, table_rows)
+            else:
+                sheet_outputs = [
+                    process_excel_sheet(workbook, sheet_idx, sheet_name, table_rows)
+                    for sheet_idx, sheet_name in selected_sheets
+                ]
+        finally:
+            workbook.close()
+
+        # Assemble the output in workbook order
+        for sheet_content, sheet_table in sheet_outputs:
+            formatted_content.extend(sheet_content)
+            if sheet_table is not None:
+                sheet_tables.append(sheet_table)
+
+        result = {
             'data': {'text_only': '\n'.join(formatted_content)},
             'file_type': 'excel',
             'sheets': len(sheet_names),
-            'sheet_names': sheet_names
+            'sheet_names': sheet_names,
+            'selected_sheets': [sheet_name for _, sheet_name in selected_sheets]
         }
+        if table_rows:
+            result['tables'] = sheet_tables
+        return result
 
     except FileNotFoundError as e:
         raise ValueError(f"Excel file not found: {str(e)}") from e
@@ -774,6 +1968,45 @@ def process_excel(filepath):
         raise ValueError(f"Excel processing failed: {str(e)}") from e
 
 
+@app.before_request
+def track_request_start():
+    """
+    Count the request as in flight and record uploaded bytes
+    """
+    metrics.increment('docusense_requests_in_flight')
+    if request.method == 'POST' and request.content_length:
+        metrics.increment('docusense_upload_bytes_total', request.content_length,
+                          endpoint=request.endpoint or 'unknown')
+
+
+@app.after_request
+def track_request_result(response):
+    """
+    Count the finished request by endpoint, file type and status code
+
+    Args:
+        response (Response): Outgoing response
+
+    Returns:
+        Response: The unchanged response
+    """
+    metrics.increment('docusense_requests_total', endpoint=request.endpoint or 'unknown',
+                      file_type=g.get('file_type', 'none'), status=response.status_code)
+    return response
+
+
+@app.teardown_request
+def track_request_end(_error):
+    """
+    Remove the request from the in-flight gauge once its context is torn down
+    (for streamed responses this happens after the last chunk is sent)
+
+    Args:
+        _error (Exception): Unhandled exception, if any
+    """
+    metrics.increment('docusense_requests_in_flight', -1)
+
+
 @app.route('/')
 def index():
     """
@@ -801,13 +2034,83 @@ def validate_upload_request():
                       'message': 'Please select a valid file'}, 400)
 
     if not allowed_file(file.filename):
+        g.file_type = 'unsupported'
         supported_formats = ", ".join(config.ALLOWED_EXTENSIONS).upper()
         return None, ({'error': 'Invalid file type',
                       'message': f'Supported formats: {supported_formats}'}, 400)
 
+    # Remember the file type for request metrics
+    g.file_type = file.filename.rsplit('.', 1)[1].lower()
     return file, None
 
 
+def build_upload_path(original_filename):
+    """
+    Build a unique, sanitized storage path (inside its shard directory) for an uploaded file
+
+    Args:
+        original_filename (str): Client-supplied filename
+
+    Returns:
+        tuple: (filename, file_path, file_extension)
+
+    Raises:
+        ValueError: If the filename has no extension
+    """
+    if '.' not in original_filename:
+        raise ValueError(f'File type of {original_filename} is not supported')
+
+    # Generate unique filename to avoid conflicts
+    file_extension = original_filename.rsplit('.', 1)[1].lower()
+    safe_filename = secure_filename(original_filename)
+    # Names made only of non-ASCII characters lose their stem and dot when sanitized
+    # (e.g. 'файл.txt' becomes 'txt'), so keep the extension from the original name
+    if not safe_filename.lower().endswith(f'.{file_extension}'):
+        safe_filename = f'upload.{file_extension}'
+    unique_id = str(uuid.uuid4())[:8]  # Short unique ID
+    filename = f"{unique_id}_{safe_filename}"
+    file_path = storage.get_storage_path(filename, create=True)
+    return filename, file_path, file_extension
+
+
+def save_uploaded_file(file):
+    """
+    Save an uploaded file under a unique name in the upload folder
+
+    Args:
+        file (FileStorage): Validated uploaded file
+
+    Returns:
+        tuple: (filename, file_path, file_extension)
+    """
+    filename, file_path, file_extension = build_upload_path(file.filename)
+
+    # Save file with unique name
+    file.save(file_path)
+    storage.note_stored_file(file_path)
+    return filename, file_path, file_extension
+
+
+def receive_upload(file, ephemeral=False):
+    """
+    Save an uploaded file, or read it into memory without touching disk
+
+    Args:
+        file (FileStorage): Validated uploaded file
+        ephemeral (bool): Keep the upload in memory instead of saving it
+
+    Returns:
+        tuple: (filename, source, file_extension) where source is the saved file's path,
+        or a memoryview over the uploaded bytes and filename is None in ephemeral mode
+    """
+    if not ephemeral:
+        return save_uploaded_file(file)
+
+    # Taken from the validated original name: sanitizing drops non-ASCII names entirely
+    file_extension = file.filename.rsplit('.', 1)[1].lower()
+    return None, memoryview(file.read()), file_extension
+
+
 def extract_and_validate_ocr_settings():
     """
     Extract and validate OCR settings from form data
@@ -833,38 +2136,338 @@ def extract_and_validate_ocr_settings():
     if settings['psm_mode'] not in config.PAGE_SEGMENTATION_MODES:
         settings['psm_mode'] = config.DEFAULT_PSM_MODE
 
-    return settings
+    return settings
+
+
+def get_form_flag(name, default):
+    """
+    Read a boolean flag from form data
+
+    Args:
+        name (str): Form field name
+        default (bool): Value used when the field is missing
+
+    Returns:
+        bool: Parsed flag value
+    """
+    value = request.form.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ('false', '0', 'no', 'off')
+
+
+def get_form_page_number(name):
+    """
+    Read a 1-based page number from form data
+
+    Args:
+        name (str): Form field name
+
+    Returns:
+        int: Page number, or None when missing or not a positive integer
+    """
+    try:
+        page_number = int(request.form.get(name, ''))
+    except ValueError:
+        return None
+    return page_number if page_number >= 1 else None
+
+
+def extract_processing_options(ephemeral=False):
+    """
+    Extract non-OCR processing options from form data
+
+    Args:
+        ephemeral (bool): Whether the upload is processed in ephemeral mode
+
+    Returns:
+        dict: Processing options for process_file_by_type
+    """
+    return {
+        # PDF page previews are only needed by clients that display them, and would
+        # be written to the upload folder, so ephemeral requests never get them
+        'include_images': get_form_flag('include_images', True) and not ephemeral,
+        # Optional 1-based inclusive PDF page range
+        'first_page': get_form_page_number('first_page'),
+        'last_page': get_form_page_number('last_page'),
+        # CSV and Excel rows as structured JSON in addition to the text table
+        'table_rows': get_form_flag('table_rows', False),
+        # Optional comma-separated Excel sheet names or 1-based positions
+        'sheets': [selector.strip() for selector in request.form.get('sheets', '').split(',')
+                   if selector.strip()] or None
+    }
+
+
+def extract_response_options():
+    """
+    Extract and validate the response format and encoding from form data
+
+    Returns:
+        tuple: (response_options, error_response) where error_response is None if valid
+    """
+    response_options = {
+        'format': request.form.get('format', 'records').strip().lower(),
+        'encoding': request.form.get('encoding', 'json').strip().lower()
+    }
+
+    for name, allowed_values in (('format', config.RESPONSE_FORMATS),
+                                 ('encoding', config.RESPONSE_ENCODINGS)):
+        if response_options[name] not in allowed_values:
+            return None, ({'error': f'Invalid {name}',
+                           'message': f"{name} must be one of: {', '.join(allowed_values)}"}, 400)
+
+    if response_options['encoding'] == 'msgpack' and not MSGPACK_AVAILABLE:
+        return None, ({'error': 'Invalid encoding',
+                       'message': 'MessagePack encoding requires the msgpack package'}, 400)
+
+    return response_options, None
+
+
+def build_columnar_data(entries):
+    """
+    Convert OCR word entries into parallel arrays
+
+    Args:
+        entries (list): OCR entries with text, confidence and bounding box
+
+    Returns:
+        dict: Field name to list of values; 'page' is included for PDF results
+    """
+    fields = list(COLUMNAR_FIELDS)
+    if entries and 'page' in entries[0]:
+        fields.append('page')
+    return {field: [entry[field] for entry in entries] for field in fields}
+
+
+def is_cache_requested():
+    """
+    Check whether the client allows cached results for this request
+    Clients bypass the result cache by sending use_cache=false
+
+    Returns:
+        bool: True if the result cache may be used
+    """
+    return config.RESULT_CACHE_ENABLED and get_form_flag('use_cache', True)
+
+
+def is_ephemeral_requested():
+    """
+    Check whether the upload must be processed in memory and never persisted
+    Enabled for every request by EPHEMERAL_UPLOADS, or per request with ephemeral=true
+
+    Returns:
+        bool: True for ephemeral (zero-disk) processing
+    """
+    return config.EPHEMERAL_UPLOADS or get_form_flag('ephemeral', False)
+
+
+def get_cache_fingerprint():
+    """
+    Get the code version and server configuration that influence every result
+
+    Returns:
+        dict: Fingerprint to include in the cache key
+    """
+    if _CODE_DIGEST['value'] is None:
+        digest = hashlib.sha256()
+        for module_path in (__file__, ocr_engines.__file__):
+            digest.update(result_cache.compute_file_digest(module_path).encode('ascii'))
+        _CODE_DIGEST['value'] = digest.hexdigest()
+
+    return {
+        'code': _CODE_DIGEST['value'],
+        'tesseract_version': get_tesseract_info()['version'],
+        'ocr_backend': ocr_engines.get_backend_name(),
+        'config': {name: getattr(config, name) for name in CACHE_FINGERPRINT_SETTINGS}
+    }
+
+
+def get_cache_settings(file_extension, ocr_settings, processing_options):
+    """
+    Get the normalized settings that influence the result for a file type
+
+    Args:
+        file_extension (str): File extension
+        ocr_settings (dict): Validated OCR settings
+        processing_options (dict): Processing options
+
+    Returns:
+        dict: Settings to include in the cache key
+    """
+    # OCR settings only matter for file types that can go through Tesseract; the
+    # language is keyed as used, since a missing language pack falls back to English
+    if file_extension in ['png', 'jpg', 'jpeg', 'pdf']:
+        ocr_settings = {**ocr_settings, 'language': get_tesseract_config(
+            ocr_settings['engine_mode'], ocr_settings['psm_mode'], ocr_settings['language']
+        )[0]}
+    if file_extension in ['png', 'jpg', 'jpeg']:
+        return ocr_settings
+    if file_extension == 'pdf':
+        return {**ocr_settings,
+                **{option: processing_options.get(option)
+                   for option in ('include_images', 'first_page', 'last_page')}}
+    if file_extension == 'csv':
+        return {'table_rows': processing_options.get('table_rows', False)}
+    if file_extension in ['xls', 'xlsx']:
+        return {'table_rows': processing_options.get('table_rows', False),
+                'sheets': processing_options.get('sheets')}
+    return {}
+
+
+def cached_result_is_valid(entry):
+    """
+    Check that files referenced by a cached result still exist on disk
+
+    Args:
+        entry (dict): Cached entry with 'result' and 'message'
+
+    Returns:
+        bool: True if the cached result can be served
+    """
+    converted_images = entry['result'].get('converted_images', [])
+    return all(
+        storage.resolve_stored_file(image_name) is not None
+        for image_name in converted_images
+    )
+
+
+def process_file_with_cache(source, file_extension, ocr_settings,
+                            processing_options=None, use_cache=True):
+    """
+    Process a file, serving and storing results through the persistent result cache
+    In-memory (ephemeral) uploads are never cached, so their results stay off disk
+
+    Args:
+        source: Path to the uploaded file or the in-memory upload
+        file_extension (str): File extension
+        ocr_settings (dict): OCR processing settings
+        processing_options (dict): Non-OCR processing options
+        use_cache (bool): Whether the result cache may be used
+
+    Returns:
+        tuple: (result, message, cache_hit)
+    """
+    processing_options = processing_options or {}
+    if not use_cache or not isinstance(source, str):
+        result, message = process_file_by_type(
+            source, file_extension, ocr_settings, processing_options
+        )
+        return result, message, False
+
+    with timing.measure('cache_lookup'):
+        file_digest = result_cache.compute_file_digest(source)
+        cache_key = result_cache.build_cache_key(
+            file_digest, file_extension,
+            get_cache_settings(file_extension, ocr_settings, processing_options),
+            get_cache_fingerprint()
+        )
+        cached_entry = result_cache.get_cached_result(cache_key, is_valid=cached_result_is_valid)
+    if cached_entry is not None:
+        return cached_entry['result'], cached_entry['message'], True
+
+    result, message = process_file_by_type(
+        source, file_extension, ocr_settings, processing_options
+    )
+
+    # Demo-mode placeholders must not outlive a Tesseract installation
+    if is_ocr_available():
+        try:
+            with timing.measure('cache_store'):
+                result_cache.store_result(cache_key, {'result': result, 'message': message})
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Unable to cache result: {str(e)}")
+
+    return result, message, False
+
+
+def process_file_by_type(source, file_extension, ocr_settings, processing_options=None):
+    """
+    Process file based on its type, timing the whole processing step
+
+    Args:
+        source: Path to the uploaded file, or the upload's bytes (memoryview, bytes or
+                binary file-like object) in ephemeral mode
+        file_extension (str): File extension
+        ocr_settings (dict): OCR processing settings
+        processing_options (dict): Non-OCR processing options (e.g. include_images)
+
+    Returns:
+        tuple: (result, message) or raises ValueError for unsupported types
+    """
+    with timing.measure('processing'):
+        return dispatch_file_processing(source, file_extension, ocr_settings,
+                                        processing_options or {})
 
 
-def process_file_by_type(file_path, file_extension, ocr_settings):
+def dispatch_file_processing(source, file_extension, ocr_settings, processing_options):
     """
-    Process file based on its type
+    Route a file to the processor for its type
 
     Args:
-        file_path (str): Path to the uploaded file
+        source: Path to the uploaded file or the in-memory upload
         file_extension (str): File extension
         ocr_settings (dict): OCR processing settings
+        processing_options (dict): Non-OCR processing options (e.g. include_images)
 
     Returns:
         tuple: (result, message) or raises ValueError for unsupported types
     """
     if file_extension in ['png', 'jpg', 'jpeg']:
-        return (process_image(file_path, **ocr_settings), 'Image processed successfully')
+        result = process_image(source, **ocr_settings)
+        metrics.increment('docusense_pages_ocr_total')
+        return (result, 'Image processed successfully')
     if file_extension == 'pdf':
-        return (process_pdf(file_path, **ocr_settings), 'PDF processed successfully')
+        return (process_pdf(source,
+                            include_images=processing_options.get('include_images', True),
+                            page_range=(processing_options.get('first_page'),
+                                        processing_options.get('last_page')),
+                            **ocr_settings),
+                'PDF processed successfully')
     if file_extension == 'docx':
-        return (process_docx(file_path), 'DOCX processed successfully')
+        return (process_docx(source), 'DOCX processed successfully')
     if file_extension == 'txt':
-        return (process_txt(file_path), 'TXT processed successfully')
+        return (process_txt(source), 'TXT processed successfully')
     if file_extension == 'csv':
-        return (process_csv(file_path), 'CSV processed successfully')
+        return (process_csv(source, table_rows=processing_options.get('table_rows', False)),
+                'CSV processed successfully')
     if file_extension in ['xls', 'xlsx']:
-        return (process_excel(file_path), 'Excel processed successfully')
+        return (process_excel(source,
+                              table_rows=processing_options.get('table_rows', False),
+                              sheet_selectors=processing_options.get('sheets')),
+                'Excel processed successfully')
 
     raise ValueError(f'File type {file_extension} is not supported')
 
 
+def build_timed_response(result, status_code=200, encoding='json'):
+    """
+    Serialize a result to JSON and attach the request's stage timings
+
+    Args:
+        result (dict): Non-empty JSON-serializable result
+        status_code (int): HTTP status code
+        encoding (str): 'json', or 'msgpack' for a MessagePack body
+
+    Returns:
+        Response: JSON (or MessagePack) response with a 'timings' block
+    """
+    collector = timing.current_collector()
+    if encoding == 'msgpack':
+        # Binary bodies cannot be spliced, so timings stop before serialization here
+        body = msgpack.packb({'timings': timing.summarize(collector), **result})
+        return app.response_class(body, status=status_code, mimetype='application/msgpack')
+
+    with timing.measure('json_serialization'):
+        body = app.json.dumps(result)
+    timings_json = app.json.dumps(timing.summarize(collector))
+
+    # Splice the timings block into the serialized result instead of serializing twice
+    body = f'{{"timings": {timings_json}, {body[1:]}'
+    return app.response_class(body, status=status_code, mimetype='application/json')
+
+
 @app.route('/upload', methods=['POST'])
+@timing.timed
 def upload_file():
     """
     Handle file upload and processing requests
@@ -882,23 +2485,23 @@ def upload_file():
         # Extract and validate OCR settings
         ocr_settings = extract_and_validate_ocr_settings()
 
-        # Generate unique filename to avoid conflicts
-        original_filename = secure_filename(file.filename)
-        file_extension = original_filename.rsplit('.', 1)[1].lower()
-        unique_id = str(uuid.uuid4())[:8]  # Short unique ID
-        filename = f"{unique_id}_{original_filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-
-        # Save file with unique name
-        file.save(file_path)
+        # Save file with a unique name to avoid conflicts, or keep it in memory
+        ephemeral = is_ephemeral_requested()
+        with timing.measure('upload_read' if ephemeral else 'upload_save'):
+            filename, source, file_extension = receive_upload(file, ephemeral)
 
-        # Process file based on type
-        result, message = process_file_by_type(file_path, file_extension, ocr_settings)
+        # Process file based on type (served from the result cache when possible)
+        result, message, cache_hit = process_file_with_cache(
+            source, file_extension, ocr_settings,
+            extract_processing_options(ephemeral), use_cache=is_cache_requested()
+        )
 
         # Add metadata to result
         result['filename'] = filename
         result['message'] = message
-        return jsonify(result), 200
+        result['cached'] = cache_hit
+        result['ephemeral'] = ephemeral
+        return build_timed_response(result)
 
     except ValueError as e:
         error_message = str(e)
@@ -934,13 +2537,17 @@ def uploaded_file(filename):
         filename (str): The name of the file to serve
 
     Returns:
-        File response for the requested file
+        File response for the requested file (404 if it does not exist or was swept)
     """
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    file_path = storage.resolve_stored_file(filename)
+    if file_path is None:
+        abort(404)
+    return send_from_directory(os.path.dirname(file_path), filename)
 
 
 # REST API Endpoints - Version 1
 @app.route('/api/v1/ocr', methods=['POST'])
+@timing.timed
 def api_ocr():
     """
     REST API endpoint for OCR processing
@@ -954,30 +2561,39 @@ def api_ocr():
     if error_response:
         return jsonify(error_response[0]), error_response[1]
 
+    response_options, error_response = extract_response_options()
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
     # Extract and validate OCR settings (reuse existing validation)
     ocr_settings = extract_and_validate_ocr_settings()
 
     try:
-        # Generate unique filename to avoid conflicts
-        original_filename = secure_filename(file.filename)
-        file_extension = original_filename.rsplit('.', 1)[1].lower()
-        unique_id = str(uuid.uuid4())[:8]  # Short unique ID
-        filename = f"{unique_id}_{original_filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-
-        # Save file with unique name
-        file.save(file_path)
+        # Save file with a unique name to avoid conflicts, or keep it in memory
+        ephemeral = is_ephemeral_requested()
+        with timing.measure('upload_read' if ephemeral else 'upload_save'):
+            filename, source, file_extension = receive_upload(file, ephemeral)
+
+        # Process file and return results (served from the result cache when possible)
+        result, message, cache_hit = process_file_with_cache(
+            source, file_extension, ocr_settings,
+            extract_processing_options(ephemeral), use_cache=is_cache_requested()
+        )
 
-        # Process file and return results
-        result, message = process_file_by_type(file_path, file_extension, ocr_settings)
+        # Word boxes as parallel arrays; text-only results have no boxes to convert
+        if response_options['format'] == 'columnar' and isinstance(result.get('data'), list):
+            result['data'] = build_columnar_data(result['data'])
+        result['format'] = response_options['format']
 
         # Add API-specific metadata
         result['filename'] = filename
         result['message'] = message
+        result['cached'] = cache_hit
+        result['ephemeral'] = ephemeral
         result['api_version'] = 'v1'
-        result['processing_time'] = None  # Could be enhanced later with timing
+        result['processing_time'] = timing.summarize(timing.current_collector())['total_ms'] / 1000
 
-        return jsonify(result), 200
+        return build_timed_response(result, encoding=response_options['encoding'])
 
     except ValueError as e:
         error_message = str(e)
@@ -991,6 +2607,379 @@ def api_ocr():
         }), 500
 
 
+def describe_processing_error(error):
+    """
+    Map a processing exception to an API error body and status code
+
+    Args:
+        error (Exception): Exception raised while saving or processing
+
+    Returns:
+        tuple: (error_body, status_code)
+    """
+    error_message = str(error) or type(error).__name__
+    if isinstance(error, OSError):
+        return {'error': 'File save failed',
+                'message': f'Unable to save file: {error_message}'}, 500
+    if 'not supported' in error_message:
+        return {'error': 'Unsupported file type', 'message': error_message}, 400
+    return {'error': 'Processing failed', 'message': error_message}, 422
+
+
+def collect_batch_uploads(ephemeral=False):
+    """
+    Save every file of a batch request, expanding zip archives into their members
+    Nothing is left in the upload folder when the batch is rejected
+
+    Args:
+        ephemeral (bool): Keep files and archive members in memory instead of saving them
+
+    Returns:
+        list: Batch items with index, original name, and either file info or an error
+
+    Raises:
+        ValueError: If the batch has more than config.BATCH_MAX_FILES files
+        OSError: If a file cannot be saved
+    """
+    uploads = request.files.getlist('files') + request.files.getlist('file')
+    too_many_message = f'Batches are limited to {config.BATCH_MAX_FILES} files'
+    # Reject oversized batches before writing anything
+    if len(uploads) > config.BATCH_MAX_FILES:
+        raise ValueError(too_many_message)
+
+    batch_items = []
+
+    def add_item(original_name, **fields):
+        batch_items.append({'index': len(batch_items), 'original_filename': original_name,
+                            **fields})
+
+    try:
+        for file in uploads:
+            if file.filename.lower().endswith('.zip'):
+                extract_zip_batch(file, add_item, ephemeral)
+            elif not allowed_file(file.filename):
+                add_item(file.filename, error=f'File type of {file.filename} is not supported')
+            else:
+                try:
+                    filename, source, file_extension = receive_upload(file, ephemeral)
+                except ValueError as e:
+                    add_item(file.filename, error=str(e))
+                    continue
+                add_item(file.filename, filename=filename, source=source,
+                         file_extension=file_extension)
+        # Archives are only counted once expanded
+        if len(batch_items) > config.BATCH_MAX_FILES:
+            raise ValueError(too_many_message)
+    except (ValueError, OSError):
+        discard_batch_uploads(batch_items)
+        raise
+
+    return batch_items
+
+
+def discard_batch_uploads(batch_items):
+    """
+    Delete the saved files of a rejected batch
+
+    Args:
+        batch_items (list): Items from collect_batch_uploads
+    """
+    for batch_item in batch_items:
+        # In-memory (ephemeral) items have nothing on disk
+        if isinstance(batch_item.get('source'), str):
+            try:
+                os.remove(batch_item['source'])
+            except OSError:
+                pass
+
+
+def extract_zip_batch(file, add_item, ephemeral=False):
+    """
+    Extract supported members of an uploaded zip archive into the upload folder
+
+    Args:
+        file (FileStorage): Uploaded zip archive
+        add_item (callable): Callback registering each member as a batch item
+        ephemeral (bool): Read members into memory instead of extracting them
+    """
+    try:
+        with zipfile.ZipFile(file.stream) as archive:
+            members = [member for member in archive.infolist()
+                       if not member.is_dir() and not member.filename.startswith('__MACOSX/')]
+
+            # Refuse archives that would expand beyond the configured limits
+            if len(members) > config.BATCH_MAX_FILES:
+                raise ValueError(f'Archive has more than {config.BATCH_MAX_FILES} files')
+            if sum(member.file_size for member in members) > config.BATCH_MAX_UNCOMPRESSED_BYTES:
+                raise ValueError('Archive expands beyond the allowed batch size')
+
+            for member in members:
+                member_name = os.path.basename(member.filename)
+                if not allowed_file(member_name) or not secure_filename(member_name):
+                    add_item(member.filename,
+                             error=f'File type of {member.filename} is not supported')
+                    continue
+                if ephemeral:
+                    add_item(member.filename, filename=None,
+                             source=memoryview(archive.read(member)),
+                             file_extension=member_name.rsplit('.', 1)[1].lower())
+                    continue
+                try:
+                    filename, file_path, file_extension = build_upload_path(member_name)
+                except ValueError as e:
+                    add_item(member.filename, error=str(e))
+                    continue
+                with archive.open(member) as source, open(file_path, 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                storage.note_stored_file(file_path)
+                add_item(member.filename, filename=filename, source=file_path,
+                         file_extension=file_extension)
+    except (zipfile.BadZipFile, ValueError) as e:
+        add_item(file.filename, error=f'Invalid zip archive: {str(e)}')
+
+
+def process_batch_item(batch_item, ocr_settings, processing_options, use_cache):
+    """
+    Process one file of a batch and report its outcome without raising
+
+    Args:
+        batch_item (dict): Item from collect_batch_uploads
+        ocr_settings (dict): Shared OCR settings
+        processing_options (dict): Shared processing options
+        use_cache (bool): Whether the result cache may be used
+
+    Returns:
+        dict: Per-file result line with status 'success' or 'error'
+    """
+    line = {'index': batch_item['index'], 'original_filename': batch_item['original_filename']}
+    if 'error' in batch_item:
+        line.update(status='error', status_code=400, error='Unsupported file type',
+                    message=batch_item['error'])
+        return line
+
+    try:
+        with timing.collect() as file_timings:
+            result, message, cache_hit = process_file_with_cache(
+                batch_item['source'], batch_item['file_extension'], ocr_settings,
+                processing_options, use_cache=use_cache
+            )
+            result['timings'] = timing.summarize(file_timings)
+        result['filename'] = batch_item['filename']
+        result['message'] = message
+        result['cached'] = cache_hit
+        result['ephemeral'] = not isinstance(batch_item['source'], str)
+        line.update(status='success', status_code=200, result=result)
+    # Any exception (e.g. BadZipFile from a corrupt workbook) is reported on this
+    # file's line; letting it escape would end the stream for the whole batch
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        error_body, status_code = describe_processing_error(e)
+        line.update(status='error', status_code=status_code, **error_body)
+    return line
+
+
+@app.route('/api/v1/ocr/batch', methods=['POST'])
+def api_ocr_batch():
+    """
+    REST API endpoint for processing many files in one request
+    Accepts several 'files' fields and/or zip archives sharing one set of OCR settings,
+    and streams one JSON line per file (NDJSON) as each file finishes
+
+    Returns:
+        Streaming NDJSON response, or a JSON error if no files were provided
+    """
+    if not request.files.getlist('files') and not request.files.getlist('file'):
+        return jsonify({'error': 'No file provided',
+                        'message': 'Attach files as "files" fields or a zip archive'}), 400
+
+    g.file_type = 'batch'
+    ocr_settings = extract_and_validate_ocr_settings()
+    ephemeral = is_ephemeral_requested()
+    processing_options = extract_processing_options(ephemeral)
+    use_cache = is_cache_requested()
+
+    # Uploads must be saved (or read) while the request body is still available
+    try:
+        batch_items = collect_batch_uploads(ephemeral)
+    except ValueError as e:
+        return jsonify({'error': 'Too many files', 'message': str(e)}), 400
+    except OSError as e:
+        error_body, status_code = describe_processing_error(e)
+        return jsonify(error_body), status_code
+
+    def generate_results():
+        succeeded = 0
+        with ThreadPoolExecutor(max_workers=max(1, config.BATCH_WORKER_THREADS),
+                                thread_name_prefix='docusense-batch') as executor:
+            futures = [
+                executor.submit(process_batch_item, batch_item, ocr_settings,
+                                processing_options, use_cache)
+                for batch_item in batch_items
+            ]
+            for future in as_completed(futures):
+                line = future.result()
+                succeeded += line['status'] == 'success'
+                yield json.dumps(line) + '\n'
+
+        yield json.dumps({'summary': {'total': len(batch_items), 'succeeded': succeeded,
+                                      'failed': len(batch_items) - succeeded},
+                          'api_version': 'v1'}) + '\n'
+
+    return Response(stream_with_context(generate_results()), mimetype='application/x-ndjson')
+
+
+@app.route('/api/v1/jobs', methods=['POST'])
+# pylint: disable-next=too-many-return-statements
+def api_create_job():
+    """
+    REST API endpoint for asynchronous OCR processing
+    Saves the upload, queues it for background processing and returns a job ID immediately
+
+    Returns:
+        JSON response with the job ID (202), or an error when the queue is full (429)
+    """
+    # Validate request, settings and callback before accepting any work
+    file, error_response = validate_upload_request()
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    # Queued jobs keep their upload and result on disk until a worker has finished them
+    if is_ephemeral_requested():
+        return jsonify({
+            'error': 'Ephemeral mode not supported',
+            'message': 'Jobs store their upload and result; use POST /api/v1/ocr instead'
+        }), 400
+
+    ocr_settings = extract_and_validate_ocr_settings()
+    processing_options = extract_processing_options()
+    use_cache = is_cache_requested()
+
+    callback_url = request.form.get('callback_url', '').strip() or None
+    if callback_url:
+        callback_error = jobs.validate_callback_url(callback_url)
+        if callback_error:
+            return jsonify({'error': 'Invalid callback URL', 'message': callback_error}), 400
+
+    try:
+        filename, file_path, file_extension = save_uploaded_file(file)
+    except OSError as e:
+        return jsonify({
+            'error': 'File save failed',
+            'message': f'Unable to save file: {str(e)}'
+        }), 500
+
+    def run_ocr_job():
+        # Same processing and metadata as the synchronous /api/v1/ocr endpoint
+        with timing.collect() as job_timings:
+            result, message, cache_hit = process_file_with_cache(
+                file_path, file_extension, ocr_settings, processing_options, use_cache=use_cache
+            )
+            result['timings'] = timing.summarize(job_timings)
+        result['filename'] = filename
+        result['message'] = message
+        result['api_version'] = 'v1'
+        result['cached'] = cache_hit
+        result['processing_time'] = result['timings']['total_ms'] / 1000
+        return result
+
+    try:
+        job_id = jobs.submit_job(run_ocr_job, callback_url, metadata={'filename': filename})
+    except queue.Full:
+        os.remove(file_path)
+        response = jsonify({
+            'error': 'Too many queued jobs',
+            'message': f'Job queue is full ({config.JOB_QUEUE_MAX_DEPTH} jobs), retry later'
+        })
+        response.headers['Retry-After'] = '5'
+        return response, 429
+    except OSError as e:
+        os.remove(file_path)
+        return jsonify({
+            'error': 'Job store failed',
+            'message': f'Unable to register job: {str(e)}'
+        }), 500
+
+    return jsonify({
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': url_for('api_get_job', job_id=job_id),
+        'api_version': 'v1'
+    }), 202
+
+
+@app.route('/api/v1/jobs/<job_id>', methods=['GET'])
+def api_get_job(job_id):
+    """
+    REST API endpoint to check the status of an asynchronous OCR job
+
+    Args:
+        job_id (str): Job ID returned by POST /api/v1/jobs
+
+    Returns:
+        JSON response with job status, page progress and the result once completed
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found',
+                        'message': f'No job with ID {job_id}', 'api_version': 'v1'}), 404
+
+    job['api_version'] = 'v1'
+    return jsonify(job), 200
+
+
+@app.route('/api/v1/csv/<filename>/rows', methods=['GET'])
+def api_csv_rows(filename):
+    """
+    REST API endpoint to page through all rows of an uploaded CSV file
+    Cursors are byte offsets: each page seeks to its first row and parses only its
+    own rows, so time and memory depend on the page size, not the position
+
+    Args:
+        filename (str): Stored filename returned by /api/v1/ocr or /upload
+
+    Returns:
+        JSON response with column names, rows and the cursor of the next page
+    """
+    safe_filename = secure_filename(filename)
+    file_path = storage.resolve_stored_file(safe_filename)
+    if not safe_filename.lower().endswith('.csv') or file_path is None:
+        return jsonify({'error': 'File not found',
+                        'message': f'No uploaded CSV file named {filename}',
+                        'api_version': 'v1'}), 404
+
+    try:
+        cursor = max(0, int(request.args.get('cursor', 0)))
+        limit = int(request.args.get('limit', config.CSV_PAGE_SIZE))
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor',
+                        'message': 'cursor and limit must be integers', 'api_version': 'v1'}), 400
+    limit = min(max(1, limit), config.CSV_MAX_PAGE_SIZE)
+
+    try:
+        csv_format = sniff_csv_format(file_path)
+        page = read_csv_page(file_path, csv_format, cursor, limit)
+    except pd.errors.EmptyDataError:
+        page = (pd.DataFrame(), None)
+        csv_format = {'encoding': None, 'delimiter': None}
+    except (pd.errors.ParserError, UnicodeDecodeError, ValueError) as e:
+        return jsonify({'error': 'Processing failed', 'message': f'CSV parsing failed: {str(e)}',
+                        'api_version': 'v1'}), 422
+    if page is None:
+        return jsonify({'error': 'Invalid cursor',
+                        'message': 'cursor must be 0 or a next_cursor returned by this API',
+                        'api_version': 'v1'}), 400
+
+    df, next_cursor = page
+    return jsonify({
+        'filename': safe_filename,
+        **build_table_records(df),
+        'cursor': cursor,
+        'next_cursor': next_cursor,
+        'encoding': csv_format['encoding'],
+        'delimiter': csv_format['delimiter'],
+        'api_version': 'v1'
+    }), 200
+
+
 @app.route('/api/v1/formats', methods=['GET'])
 def api_formats():
     """
@@ -1069,6 +3058,24 @@ def api_languages():
         }), 500
 
 
+@app.route('/api/v1/languages/refresh', methods=['POST'])
+def api_languages_refresh():
+    """
+    REST API endpoint to re-probe Tesseract for installed languages and version
+    Use after installing or removing language packs without restarting the service
+
+    Returns:
+        JSON response with the refreshed Tesseract metadata
+    """
+    tesseract_info = get_tesseract_info(refresh=True)
+    return jsonify({
+        'languages': tesseract_info['languages'],
+        'installed_count': len(tesseract_info['languages']),
+        'version': tesseract_info['version'],
+        'api_version': 'v1'
+    }), 200
+
+
 @app.route('/api/v1/health', methods=['GET'])
 def api_health():
     """
@@ -1078,30 +3085,34 @@ def api_health():
         JSON response with service status and capabilities
     """
     try:
-        # Check OCR availability
-        ocr_status = 'available' if OCR_AVAILABLE else 'unavailable'
+        # Check OCR availability without waiting for Tesseract discovery
+        ocr_available = is_ocr_available(wait=False)
+        if OCR_LIBRARIES_INSTALLED and not _TESSERACT_DISCOVERY['done']:
+            ocr_status = 'discovering'
+        else:
+            ocr_status = 'available' if ocr_available else 'unavailable'
 
         # Get basic system info
         health_info = {
             'status': 'healthy',
             'api_version': 'v1',
             'ocr_engine': {
-                'available': OCR_AVAILABLE,
-                'status': ocr_status
+                'available': ocr_available,
+                'status': ocr_status,
+                'backend': ocr_engines.get_backend_name()
             },
             'supported_formats': len(config.ALLOWED_EXTENSIONS),
             'pdf_processing': PDF_TEXT_EXTRACTION_AVAILABLE,
             'upload_folder': os.path.exists(config.UPLOAD_FOLDER),
-            'max_file_size_mb': config.MAX_CONTENT_LENGTH // (1024 * 1024)
+            'upload_storage': storage.get_storage_stats(),
+            'max_file_size_mb': config.MAX_CONTENT_LENGTH // (1024 * 1024),
+            'result_cache': result_cache.get_cache_stats(),
+            'job_queue': jobs.get_queue_stats()
         }
 
-        # Add Tesseract version if available
-        if OCR_AVAILABLE:
-            try:
-                tesseract_version = pytesseract.get_tesseract_version()
-                health_info['ocr_engine']['version'] = str(tesseract_version)
-            except (pytesseract.TesseractNotFoundError, RuntimeError):
-                health_info['ocr_engine']['version'] = 'unknown'
+        # Add Tesseract version if available (found by discovery, no subprocess)
+        if ocr_available:
+            health_info['ocr_engine']['version'] = _TESSERACT_DISCOVERY['version']
 
         return jsonify(health_info), 200
 
@@ -1113,6 +3124,48 @@ def api_health():
         }), 500
 
 
+@app.route('/api/v1/timings', methods=['GET'])
+def api_timings():
+    """
+    REST API endpoint for aggregated stage latency histograms
+
+    Returns:
+        JSON response with per-stage histograms collected since startup
+    """
+    return jsonify({
+        'histograms': timing.get_histograms(),
+        'bucket_unit': 'ms',
+        'api_version': 'v1'
+    }), 200
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """
+    Prometheus scrape endpoint
+    Reports request counts, in-flight requests, uploaded bytes, OCR'd pages, stage latency
+    histograms, result cache, job queue and upload storage figures without spawning any
+    subprocess
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    metrics_text = metrics.render_metrics(*collect_metric_sources())
+    return Response(metrics_text, mimetype='text/plain; version=0.0.4')
+
+
+def collect_metric_sources():
+    """
+    Gather the metric figures owned by other modules
+
+    Returns:
+        tuple: (stage_histograms, cache_stats, queue_stats, storage_stats) for
+               metrics.render_metrics() and metrics.build_snapshot()
+    """
+    return (timing.get_histograms(), result_cache.get_cache_stats(), jobs.get_queue_stats(),
+            storage.get_storage_stats())
+
+
 @app.route('/api/v1/docs', methods=['GET'])
 def api_docs():
     """
@@ -1160,14 +3213,81 @@ def api_docs():
                         'required': False,
                         'default': 'auto',
                         'description': 'Page segmentation mode'
+                    },
+                    'include_images': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': True,
+                        'description': 'Set to false to skip writing PDF page preview images'
+                    },
+                    'use_cache': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': True,
+                        'description': 'Set to false to bypass the result cache'
+                    },
+                    'ephemeral': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': config.EPHEMERAL_UPLOADS,
+                        'description': ('Process the upload in memory and never save it; '
+                                        'no previews, no result cache, filename is null')
+                    },
+                    'table_rows': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': False,
+                        'description': ('CSV/Excel: also return rows as JSON (table, or tables '
+                                        'per sheet)')
+                    },
+                    'sheets': {
+                        'type': 'string',
+                        'required': False,
+                        'default': 'all sheets',
+                        'description': 'Excel: comma-separated sheet names or 1-based positions'
+                    },
+                    'first_page': {
+                        'type': 'integer',
+                        'required': False,
+                        'default': 1,
+                        'description': 'First PDF page to process (1-based)'
+                    },
+                    'last_page': {
+                        'type': 'integer',
+                        'required': False,
+                        'default': 'last page',
+                        'description': ('Last PDF page to process; at most MAX_PDF_PAGES pages '
+                                        'are processed from first_page')
+                    },
+                    'format': {
+                        'type': 'string',
+                        'required': False,
+                        'default': 'records',
+                        'options': config.RESPONSE_FORMATS,
+                        'description': ('columnar returns data as parallel arrays (text, '
+                                        'confidence, left, top, width, height, page)')
+                    },
+                    'encoding': {
+                        'type': 'string',
+                        'required': False,
+                        'default': 'json',
+                        'options': config.RESPONSE_ENCODINGS,
+                        'description': 'msgpack returns an application/msgpack body'
                     }
                 },
                 'response': {
                     'success': {
                         'data': 'OCR results with text and bounding boxes',
+                        'format': 'Layout of data (records or columnar)',
+                        'pages': ('Mixed PDFs only: every page with its method '
+                                  '(text_extraction or ocr) and text'),
                         'filename': 'Original filename',
                         'message': 'Processing status message',
-                        'ocr_settings': 'Applied OCR settings'
+                        'ocr_settings': 'Applied OCR settings',
+                        'cached': 'True if the result was served from the result cache',
+                        'ephemeral': 'True if the upload was processed in memory only',
+                        'processing_time': 'Seconds spent handling the request',
+                        'timings': 'Per-stage (and per-page) wall time in milliseconds'
                     },
                     'error': {
                         'error': 'Error type',
@@ -1181,6 +3301,100 @@ def api_docs():
                     '500': 'Internal Server Error - Server error'
                 }
             },
+            'POST /api/v1/ocr/batch': {
+                'description': 'Process many files in one request with shared OCR settings',
+                'parameters': {
+                    'files': {
+                        'type': 'file[]',
+                        'required': True,
+                        'description': 'Files to process; zip archives are expanded'
+                    },
+                    'ephemeral': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': config.EPHEMERAL_UPLOADS,
+                        'description': ('Process files and archive members in memory; '
+                                        'no previews, no result cache, filename is null')
+                    }
+                },
+                'response': ('NDJSON stream: one line per file as it completes with index, '
+                             'original_filename, status, status_code and result or error, '
+                             'followed by a summary line'),
+                'status_codes': {
+                    '200': 'Success - Results streamed (per-file errors are reported inline)',
+                    '400': 'Bad Request - No files or too many files'
+                }
+            },
+            'POST /api/v1/jobs': {
+                'description': 'Queue a file for asynchronous OCR processing',
+                'parameters': {
+                    'file': {
+                        'type': 'file',
+                        'required': True,
+                        'description': 'File to process (same options as POST /api/v1/ocr)'
+                    },
+                    'callback_url': {
+                        'type': 'string',
+                        'required': False,
+                        'description': 'URL that receives the finished job as a JSON POST'
+                    }
+                },
+                'response': {
+                    'job_id': 'Identifier for polling the job',
+                    'status': 'Initial job status (queued)',
+                    'status_url': 'URL of the job status endpoint'
+                },
+                'status_codes': {
+                    '202': 'Accepted - Job queued',
+                    '400': ('Bad Request - Invalid file, file type or callback URL, or '
+                            'ephemeral mode (jobs always store their upload)'),
+                    '429': 'Too Many Requests - Job queue is full, retry later',
+                    '500': 'Internal Server Error - Server error'
+                }
+            },
+            'GET /api/v1/jobs/<job_id>': {
+                'description': 'Get status, page progress and result of an OCR job',
+                'parameters': {},
+                'response': {
+                    'status': 'queued, running, completed or failed',
+                    'progress': 'Pages done and total pages',
+                    'result': 'OCR result once completed (same shape as POST /api/v1/ocr)',
+                    'error': 'Error details if the job failed'
+                },
+                'status_codes': {
+                    '200': 'Success - Job status retrieved',
+                    '404': 'Not Found - Unknown or expired job ID'
+                }
+            },
+            'GET /api/v1/csv/<filename>/rows': {
+                'description': 'Page through every row of an uploaded CSV file',
+                'parameters': {
+                    'cursor': {
+                        'type': 'integer',
+                        'required': False,
+                        'default': 0,
+                        'description': ('Byte offset of the first row: 0, or the '
+                                        'next_cursor of the previous page')
+                    },
+                    'limit': {
+                        'type': 'integer',
+                        'required': False,
+                        'default': config.CSV_PAGE_SIZE,
+                        'description': f'Rows per page (max {config.CSV_MAX_PAGE_SIZE})'
+                    }
+                },
+                'response': {
+                    'columns': 'Column names',
+                    'rows': 'Rows as lists of strings',
+                    'next_cursor': 'Cursor of the next page, null on the last page'
+                },
+                'status_codes': {
+                    '200': 'Success - Rows retrieved',
+                    '400': 'Bad Request - cursor or limit is invalid',
+                    '404': 'Not Found - No uploaded CSV file with that name',
+                    '422': 'Unprocessable Entity - CSV parsing failed'
+                }
+            },
             'GET /api/v1/formats': {
                 'description': 'Get supported file formats',
                 'parameters': {},
@@ -1205,21 +3419,46 @@ def api_docs():
                     '500': 'Internal Server Error - Language detection failed'
                 }
             },
+            'POST /api/v1/languages/refresh': {
+                'description': 'Re-probe Tesseract for installed languages and version',
+                'parameters': {},
+                'response': {
+                    'languages': 'List of installed language codes',
+                    'installed_count': 'Number of installed language packs',
+                    'version': 'Tesseract version'
+                },
+                'status_codes': {
+                    '200': 'Success - Tesseract metadata refreshed'
+                }
+            },
             'GET /api/v1/health': {
                 'description': 'Check service health and capabilities',
                 'parameters': {},
                 'response': {
                     'status': 'Service health status',
-                    'ocr_engine': 'OCR engine availability and version',
+                    'ocr_engine': ('OCR engine availability and version; status is '
+                                   'discovering while Tesseract is still being probed'),
                     'supported_formats': 'Number of supported formats',
                     'pdf_processing': 'PDF processing capability',
-                    'upload_folder': 'Upload folder status'
+                    'upload_folder': 'Upload folder status',
+                    'upload_storage': 'Upload folder usage, retention, quota and sweeper counters',
+                    'result_cache': 'Result cache hit/miss counters and disk usage'
                 },
                 'status_codes': {
                     '200': 'Success - Service is healthy',
                     '500': 'Internal Server Error - Service has issues'
                 }
             },
+            'GET /api/v1/timings': {
+                'description': 'Get per-stage latency histograms aggregated since startup',
+                'parameters': {},
+                'response': {
+                    'histograms': 'Stage name to cumulative bucket counts, count and sum in ms'
+                },
+                'status_codes': {
+                    '200': 'Success - Histograms retrieved'
+                }
+            },
             'GET /api/v1/docs': {
                 'description': 'Get API documentation',
                 'parameters': {},
@@ -1233,6 +3472,7 @@ def api_docs():
             'curl_upload': ('curl -X POST -F "file=@document.pdf" -F "language=eng" '
                            '-F "dpi_setting=medium" http://localhost:5000/api/v1/ocr'),
             'curl_health': 'curl http://localhost:5000/api/v1/health',
+            'curl_metrics': 'curl http://localhost:5000/metrics',
             'curl_formats': 'curl http://localhost:5000/api/v1/formats',
             'curl_languages': 'curl http://localhost:5000/api/v1/languages'
         },
@@ -1266,9 +3506,34 @@ def api_test_interface():
     </body></html>'''
 
 
+def create_app(discover_in_background=None):
+    """
+    Application factory: prepare the app for serving and return it
+    Importing this module loads no heavy libraries and spawns no process; Tesseract is
+    discovered here, on a background thread by default so health checks are answered
+    (with OCR status 'discovering') while the binary is probed
+
+    Args:
+        discover_in_background (bool): Probe Tesseract on a background thread instead
+                                       of before returning (default from config)
+
+    Returns:
+        Flask: The configured WSGI application
+    """
+    # Worker processes snapshot their metrics when a shared metrics folder is configured
+    metrics.set_snapshot_sources(collect_metric_sources)
+    if discover_in_background is None:
+        discover_in_background = config.TESSERACT_DISCOVERY_IN_BACKGROUND
+    if discover_in_background:
+        start_tesseract_discovery()
+    else:
+        get_tesseract_info()
+    return app
+
+
 if __name__ == '__main__':
     # Run the Flask application in development mode
-    app.run(
+    create_app().run(
         debug=config.DEBUG,
         threaded=config.THREADED,
         host=config.HOST,
@@ -0,0 +1,368 @@
+"""
+Docusense OCR Prototype - Document Processing Benchmark
+
+Generates the deterministic synthetic corpus from synthetic_corpus.py and runs
+every document through the processing pipeline, either directly through
+app.process_file_by_type or as an upload to /api/v1/ocr through the Flask test
+client. Image and scanned PDF documents are run once per dpi_setting. Each case
+runs in a freshly spawned process, so peak memory includes the libraries its file
+type imports and can be attributed to that case alone.
+
+The JSON report lists p50/p95/p99 latency, pages per second (workbooks count one
+page per sheet, CSV and DOCX files one page each), mean stage timings and peak RSS
+per case, together with the corpus manifest and the environment, so
+reports from different commits or machines can be compared. Where Tesseract is
+not installed, OCR-dependent cases measure the demo-mode response and are marked
+with "demo_mode": true.
+
+Usage:
+    python benchmarks/document_benchmark.py [--runs 10] [--warmup 1] [--seed 1234]
+        [--drivers direct,http] [--dpi-settings low,medium,high]
+        [--file-types png,jpeg,pdf_text,pdf_scanned,csv,xlsx,docx] [--output report.json]
+"""
+
+import argparse
+import datetime
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+import app  # pylint: disable=wrong-import-position
+import config  # pylint: disable=wrong-import-position
+import timing  # pylint: disable=wrong-import-position
+import synthetic_corpus  # pylint: disable=wrong-import-position,wrong-import-order
+
+# resource is only available on Unix; peak memory is reported as None elsewhere
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# File types whose scan resolution depends on the dpi_setting
+DPI_SENSITIVE_FILE_TYPES = {'png', 'jpeg', 'pdf_scanned'}
+
+# File types that return a demo-mode placeholder when Tesseract is missing
+OCR_FILE_TYPES = {'png', 'jpeg', 'pdf_text', 'pdf_scanned', 'docx'}
+
+DRIVERS = ('direct', 'http')
+
+# Previews are not requested: they measure disk writes rather than processing
+PROCESSING_OPTIONS = {'include_images': False, 'first_page': None, 'last_page': None,
+                      'table_rows': False, 'sheets': None}
+
+
+def get_peak_rss_kb():
+    """
+    Get the peak resident set size of the current process
+
+    Returns:
+        int: Peak RSS in kilobytes, or None if unavailable
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def percentile(sorted_values, fraction):
+    """
+    Get a percentile of sorted samples with linear interpolation
+
+    Args:
+        sorted_values (list): Samples in ascending order
+        fraction (float): Percentile as a fraction (0.95 = p95)
+
+    Returns:
+        float: Interpolated percentile
+    """
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def build_ocr_settings(dpi_setting):
+    """
+    Build OCR settings as extract_and_validate_ocr_settings would for a form
+
+    Args:
+        dpi_setting (str): Key in config.DPI_PRESETS, or None for the default
+
+    Returns:
+        dict: OCR settings for app.process_file_by_type
+    """
+    return {
+        'dpi_setting': dpi_setting or config.DEFAULT_DPI_SETTING,
+        'language': config.DEFAULT_LANGUAGE,
+        'engine_mode': config.DEFAULT_OCR_ENGINE_MODE,
+        'psm_mode': config.DEFAULT_PSM_MODE
+    }
+
+
+def run_direct(document, ocr_settings):
+    """
+    Process a document with app.process_file_by_type
+
+    Args:
+        document (dict): Corpus document description
+        ocr_settings (dict): OCR processing settings
+
+    Returns:
+        dict: Stage name to elapsed milliseconds
+    """
+    with timing.collect() as collector:
+        app.process_file_by_type(document['path'], document['extension'], ocr_settings,
+                                 dict(PROCESSING_OPTIONS))
+    return {stage: seconds * 1000 for stage, seconds in timing.stage_totals(collector).items()}
+
+
+def run_http(client, document, content, ocr_settings):
+    """
+    Upload a document to /api/v1/ocr through the Flask test client
+
+    Args:
+        client (FlaskClient): Test client of the app
+        document (dict): Corpus document description
+        content (bytes): Document file content
+        ocr_settings (dict): OCR processing settings
+
+    Returns:
+        dict: Stage name to elapsed milliseconds, as reported in the response
+    """
+    response = client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(content), document['name']),
+        'use_cache': 'false',
+        'include_images': 'false',
+        **ocr_settings
+    })
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.get_data(as_text=True)}")
+    return response.get_json()['timings']['stages_ms']
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
+def run_case(document, driver, dpi_setting, runs, warmup, upload_folder):
+    """
+    Benchmark one document, driver and dpi_setting in the current (fresh) process
+
+    Args:
+        document (dict): Corpus document description
+        driver (str): 'direct' or 'http'
+        dpi_setting (str): Key in config.DPI_PRESETS, or None if not DPI-sensitive
+        runs (int): Timed repetitions
+        warmup (int): Untimed repetitions run first
+        upload_folder (str): Upload folder for the http driver
+
+    Returns:
+        dict: Latency, throughput, stage and memory figures for the case
+    """
+    config.UPLOAD_FOLDER = upload_folder
+    flask_app = app.create_app(discover_in_background=False)
+    ocr_settings = build_ocr_settings(dpi_setting)
+    rss_baseline_kb = get_peak_rss_kb()
+
+    if driver == 'http':
+        client = flask_app.test_client()
+        with open(document['path'], 'rb') as document_file:
+            content = document_file.read()
+
+        def process():
+            return run_http(client, document, content, ocr_settings)
+    else:
+        def process():
+            return run_direct(document, ocr_settings)
+
+    for _ in range(warmup):
+        process()
+
+    latencies_ms = []
+    stage_samples = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        stages_ms = process()
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        for stage, elapsed_ms in stages_ms.items():
+            stage_samples.setdefault(stage, []).append(elapsed_ms)
+
+    latencies_ms.sort()
+    rss_peak_kb = get_peak_rss_kb()
+    return {
+        'file_type': document['file_type'],
+        'document': document['name'],
+        'driver': driver,
+        'dpi_setting': dpi_setting,
+        'dpi': config.DPI_PRESETS[ocr_settings['dpi_setting']] if dpi_setting else None,
+        'pages': document['pages'],
+        'demo_mode': (document['file_type'] in OCR_FILE_TYPES
+                      and not app.is_ocr_available()),
+        'p50_ms': round(percentile(latencies_ms, 0.50), 2),
+        'p95_ms': round(percentile(latencies_ms, 0.95), 2),
+        'p99_ms': round(percentile(latencies_ms, 0.99), 2),
+        'mean_ms': round(statistics.fmean(latencies_ms), 2),
+        'pages_per_second': round(document['pages'] * runs * 1000 / sum(latencies_ms), 3),
+        'stages_mean_ms': {stage: round(statistics.fmean(samples), 2)
+                           for stage, samples in sorted(stage_samples.items())},
+        'peak_rss_kb': rss_peak_kb,
+        'peak_rss_increase_kb': (rss_peak_kb - rss_baseline_kb
+                                 if rss_baseline_kb is not None else None)
+    }
+
+
+def build_cases(documents, drivers, dpi_settings):
+    """
+    Combine corpus documents with drivers and, where relevant, dpi_settings
+
+    Args:
+        documents (list): Corpus document descriptions
+        drivers (list): Driver names
+        dpi_settings (list): Keys in config.DPI_PRESETS
+
+    Returns:
+        list: (document, driver, dpi_setting) tuples
+    """
+    cases = []
+    for document in documents:
+        settings = dpi_settings if document['file_type'] in DPI_SENSITIVE_FILE_TYPES else [None]
+        for dpi_setting in settings:
+            for driver in drivers:
+                cases.append((document, driver, dpi_setting))
+    return cases
+
+
+def get_git_commit():
+    """
+    Get the commit the benchmark runs against
+
+    Returns:
+        str: Commit hash, or None outside a git checkout
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def describe_environment():
+    """
+    Describe the machine and configuration the benchmark runs on
+
+    Returns:
+        dict: Versions, CPU count, OCR availability and the commit under test
+    """
+    app.discover_tesseract()
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': get_git_commit(),
+        'ocr_available': app.is_ocr_available(),
+        'tesseract_version': app.get_tesseract_info().get('version'),
+        'ocr_backend': app.ocr_engines.get_backend_name(),
+        'ocr_worker_processes': config.OCR_WORKER_PROCESSES
+    }
+
+
+def parse_list(value):
+    """
+    Split a comma-separated command line value
+
+    Args:
+        value (str): Comma-separated items
+
+    Returns:
+        list: Non-empty, stripped items
+    """
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+# pylint: disable-next=too-many-locals
+def main():
+    """
+    Generate the corpus, run every case in its own process and print a JSON report
+    """
+    corpus_options = synthetic_corpus.DEFAULT_CORPUS_OPTIONS
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--drivers', type=parse_list, default=list(DRIVERS))
+    parser.add_argument('--dpi-settings', type=parse_list, default=list(config.DPI_PRESETS))
+    parser.add_argument('--file-types', type=parse_list, default=None)
+    parser.add_argument('--image-dpis', type=parse_list,
+                        default=[str(dpi) for dpi in corpus_options['image_dpis']])
+    parser.add_argument('--pdf-pages', type=int, default=corpus_options['pdf_pages'])
+    parser.add_argument('--csv-rows', type=int, default=corpus_options['csv_rows'])
+    parser.add_argument('--xlsx-sheets', type=int, default=corpus_options['xlsx_sheets'])
+    parser.add_argument('--xlsx-rows', type=int, default=corpus_options['xlsx_rows'])
+    parser.add_argument('--docx-paragraphs', type=int,
+                        default=corpus_options['docx_paragraphs'])
+    parser.add_argument('--output', help='write the report to this file instead of stdout')
+    args = parser.parse_args()
+
+    unknown = ([driver for driver in args.drivers if driver not in DRIVERS]
+               + [dpi for dpi in args.dpi_settings if dpi not in config.DPI_PRESETS])
+    if unknown:
+        parser.error(f"unknown driver or dpi setting: {', '.join(unknown)}")
+
+    options = {
+        'image_dpis': [int(dpi) for dpi in args.image_dpis],
+        'pdf_pages': args.pdf_pages,
+        'csv_rows': args.csv_rows,
+        'xlsx_sheets': args.xlsx_sheets,
+        'xlsx_rows': args.xlsx_rows,
+        'docx_paragraphs': args.docx_paragraphs
+    }
+
+    with tempfile.TemporaryDirectory(prefix='docusense-benchmark-') as work_dir:
+        documents = synthetic_corpus.write_corpus(
+            os.path.join(work_dir, 'corpus'), args.seed, options,
+            set(args.file_types) if args.file_types else None
+        )
+        upload_folder = os.path.join(work_dir, 'uploads')
+
+        # Spawn instead of fork so every case starts from a cold interpreter
+        spawn_context = multiprocessing.get_context('spawn')
+        results = []
+        for document, driver, dpi_setting in build_cases(documents, args.drivers,
+                                                         args.dpi_settings):
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn_context) as executor:
+                try:
+                    results.append(executor.submit(
+                        run_case, document, driver, dpi_setting, args.runs, args.warmup,
+                        upload_folder
+                    ).result())
+                except (RuntimeError, ValueError, OSError) as e:
+                    results.append({'file_type': document['file_type'],
+                                    'document': document['name'], 'driver': driver,
+                                    'dpi_setting': dpi_setting, 'error': str(e)})
+
+    report = {
+        'generated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'seed': args.seed,
+        'runs': args.runs,
+        'warmup': args.warmup,
+        'environment': describe_environment(),
+        'corpus': [{key: value for key, value in document.items() if key != 'path'}
+                   for document in documents],
+        'results': results
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Docusense OCR Prototype - Image Enhancement Benchmark
+
+Compares the single-pass grayscale enhancement in app.enhance_image_for_ocr with
+the previous three-pass RGB ImageEnhance pipeline on a synthetic A4 page. Each
+pipeline runs in its own process so peak memory can be attributed to it.
+
+Usage:
+    python benchmarks/preprocess_benchmark.py [--runs 5] [--width 2480 --height 3508]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageChops, ImageDraw, ImageEnhance, ImageStat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app  # pylint: disable=wrong-import-position
+
+# resource is only available on Unix; peak memory is reported as None elsewhere
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def legacy_enhance_image_for_ocr(image):
+    """
+    Previous enhancement pipeline: RGB conversion followed by three ImageEnhance passes
+
+    Args:
+        image (PIL.Image): The input image
+
+    Returns:
+        PIL.Image: Enhanced RGB image
+    """
+    image = image.convert('RGB')
+    image = ImageEnhance.Sharpness(image).enhance(1.2)
+    image = ImageEnhance.Contrast(image).enhance(1.1)
+    return ImageEnhance.Brightness(image).enhance(1.05)
+
+
+PIPELINES = {
+    'legacy_rgb_three_pass': legacy_enhance_image_for_ocr,
+    'grayscale_single_pass': app.enhance_image_for_ocr
+}
+
+
+def build_test_page(width, height):
+    """
+    Draw a deterministic document-like RGB page
+
+    Args:
+        width (int): Page width in pixels
+        height (int): Page height in pixels
+
+    Returns:
+        PIL.Image: Synthetic page with rows of dark text on an off-white background
+    """
+    page = Image.new('RGB', (width, height), (235, 230, 220))
+    draw = ImageDraw.Draw(page)
+    for row, top in enumerate(range(50, height - 60, 40)):
+        draw.text((60, top), f'Invoice {row:05d} total amount due EUR {row * 7.31:.2f} ' * 3,
+                  fill=(20, 20, 40))
+    return page
+
+
+def get_peak_rss_kb():
+    """
+    Get the peak resident set size of the current process
+
+    Returns:
+        int: Peak RSS in kilobytes, or None if unavailable
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_pipeline(name, width, height, runs):
+    """
+    Time one pipeline in the current (fresh) process
+
+    Args:
+        name (str): Key in PIPELINES
+        width (int): Page width in pixels
+        height (int): Page height in pixels
+        runs (int): Timed repetitions
+
+    Returns:
+        dict: Timing and memory figures for the pipeline
+    """
+    page = build_test_page(width, height)
+    enhance = PIPELINES[name]
+    rss_before_kb = get_peak_rss_kb()
+
+    durations_ms = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        enhanced = enhance(page)
+        durations_ms.append((time.perf_counter() - started) * 1000)
+
+    rss_after_kb = get_peak_rss_kb()
+    return {
+        'pipeline': name,
+        'median_ms': round(statistics.median(durations_ms), 2),
+        'min_ms': round(min(durations_ms), 2),
+        'output_mode': enhanced.mode,
+        'output_bytes': len(enhanced.tobytes()),
+        'peak_rss_increase_kb': (rss_after_kb - rss_before_kb
+                                 if rss_before_kb is not None else None)
+    }
+
+
+def measure_output_difference(width, height):
+    """
+    Compare the grayscale output of both pipelines
+
+    Args:
+        width (int): Page width in pixels
+        height (int): Page height in pixels
+
+    Returns:
+        dict: Mean and maximum absolute gray level difference
+    """
+    page = build_test_page(width, height)
+    legacy = legacy_enhance_image_for_ocr(page).convert('L')
+    current = app.enhance_image_for_ocr(page)
+    difference = ImageChops.difference(legacy, current)
+    return {
+        'mean_abs_level_difference': round(ImageStat.Stat(difference).mean[0], 3),
+        'max_abs_level_difference': difference.getextrema()[1]
+    }
+
+
+def main():
+    """
+    Run every pipeline in its own process and print a JSON report
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--width', type=int, default=2480)
+    parser.add_argument('--height', type=int, default=3508)
+    args = parser.parse_args()
+
+    results = []
+    for name in PIPELINES:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(
+                executor.submit(run_pipeline, name, args.width, args.height, args.runs).result()
+            )
+
+    baseline, current = results[0], results[-1]
+    report = {
+        'image_size': [args.width, args.height],
+        'runs': args.runs,
+        'pipelines': results,
+        'speedup': round(baseline['median_ms'] / current['median_ms'], 2),
+        'output_difference': measure_output_difference(args.width, args.height)
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,460 @@
+"""
+Docusense OCR Prototype - Synthetic Document Corpus
+
+Deterministically generates benchmark inputs for every supported file type:
+rendered-text PNG and JPEG pages at several scan resolutions, multi-page PDFs with
+a text layer and image-only (scanned) PDFs, large CSV files, multi-sheet XLSX
+workbooks and DOCX documents. Every document draws its content from its own
+random generator seeded with the corpus seed and the document name, so the same
+seed always produces the same text, tables and page layouts.
+
+Usage:
+    python benchmarks/synthetic_corpus.py OUTPUT_FOLDER [--seed 1234]
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import json
+import os
+import random
+import re
+import zipfile
+
+from PIL import Image, ImageDraw, ImageFont
+
+# A4 page in inches and the page margin used for rendered text
+PAGE_SIZE_INCHES = (8.27, 11.69)
+PAGE_MARGIN_INCHES = 0.8
+
+# Rendered text size in points (converted to pixels for each scan resolution)
+FONT_SIZE_POINTS = 11
+
+# Fixed timestamp written into DOCX and XLSX metadata so output does not vary by date
+DOCUMENT_TIMESTAMP = datetime.datetime(2024, 1, 1)
+
+# Modification time in a document's core properties (docProps/core.xml)
+MODIFIED_PROPERTY_PATTERN = re.compile(rb'(<dcterms:modified[^>]*>)[^<]*(</dcterms:modified>)')
+
+VOCABULARY = [
+    'invoice', 'total', 'amount', 'due', 'payment', 'customer', 'order', 'delivery',
+    'account', 'balance', 'reference', 'date', 'quantity', 'price', 'tax', 'net',
+    'shipping', 'address', 'contract', 'service', 'period', 'statement', 'credit',
+    'discount', 'receipt', 'supplier', 'product', 'number', 'terms', 'report'
+]
+
+# Columns of the generated CSV and worksheet tables
+TABLE_HEADER = ['order_id', 'date', 'customer', 'product', 'quantity', 'unit_price', 'note']
+
+# Default corpus sizes, overridable per call
+DEFAULT_CORPUS_OPTIONS = {
+    'image_dpis': [150, 300],
+    'pdf_pages': 4,
+    'scan_dpi': 200,
+    'csv_rows': 50000,
+    'xlsx_sheets': 4,
+    'xlsx_rows': 2000,
+    'docx_paragraphs': 400
+}
+
+
+def get_document_random(seed, name):
+    """
+    Create the random generator for one document
+
+    Args:
+        seed (int): Corpus seed
+        name (str): Document name
+
+    Returns:
+        random.Random: Generator whose sequence depends only on seed and name
+    """
+    return random.Random(f'{seed}:{name}')
+
+
+def generate_sentence(rng, min_words=6, max_words=14):
+    """
+    Generate a document-like line of words and figures
+
+    Args:
+        rng (random.Random): Document random generator
+        min_words (int): Minimum number of words
+        max_words (int): Maximum number of words
+
+    Returns:
+        str: Capitalized sentence ending in an amount
+    """
+    words = [rng.choice(VOCABULARY) for _ in range(rng.randint(min_words, max_words))]
+    words.append(f'{rng.randint(1, 99999) / 100:.2f}')
+    return ' '.join(words).capitalize()
+
+
+def load_font(size_px):
+    """
+    Load the built-in font at a pixel size
+
+    Args:
+        size_px (int): Font size in pixels
+
+    Returns:
+        ImageFont: Scalable default font, or the bitmap default on older Pillow
+    """
+    try:
+        return ImageFont.load_default(size=size_px)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def render_text_page(rng, dpi, mode='RGB'):
+    """
+    Render a page of text as it would come off a scanner at the given resolution
+
+    Args:
+        rng (random.Random): Document random generator
+        dpi (int): Scan resolution in dots per inch
+        mode (str): PIL image mode ('RGB' or 'L')
+
+    Returns:
+        PIL.Image: A4 page with lines of dark text on an off-white background
+    """
+    width, height = (int(inches * dpi) for inches in PAGE_SIZE_INCHES)
+    margin = int(PAGE_MARGIN_INCHES * dpi)
+    font_px = max(8, FONT_SIZE_POINTS * dpi // 72)
+    page = Image.new('RGB', (width, height), (238, 235, 228))
+    draw = ImageDraw.Draw(page)
+    for top in range(margin, height - margin, int(font_px * 1.6)):
+        draw.text((margin, top), generate_sentence(rng), fill=(25, 25, 35),
+                  font=load_font(font_px))
+    page.info['dpi'] = (dpi, dpi)
+    return page if mode == 'RGB' else page.convert(mode)
+
+
+def build_image(rng, dpi, image_format):
+    """
+    Encode a rendered text page as an image file
+
+    Args:
+        rng (random.Random): Document random generator
+        dpi (int): Scan resolution in dots per inch
+        image_format (str): 'PNG' or 'JPEG'
+
+    Returns:
+        bytes: Encoded image
+    """
+    buffer = io.BytesIO()
+    save_args = {'dpi': (dpi, dpi)}
+    if image_format == 'JPEG':
+        save_args['quality'] = 85
+    render_text_page(rng, dpi).save(buffer, image_format, **save_args)
+    return buffer.getvalue()
+
+
+def escape_pdf_text(text):
+    """
+    Escape a string for use in a PDF literal string
+
+    Args:
+        text (str): Plain text
+
+    Returns:
+        str: Text with backslashes and parentheses escaped
+    """
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def build_pdf(page_streams, media_box=(595, 842)):
+    """
+    Assemble a PDF whose pages draw Helvetica text from the given content streams
+
+    Args:
+        page_streams (list): Content stream of each page, empty for a page without a
+                             text layer
+        media_box (tuple): Page (width, height) in points, A4 by default
+
+    Returns:
+        bytes: PDF file
+    """
+    # Object 1 is the catalog, 2 the page tree, 3 the font, then a page and a
+    # content stream object per page
+    page_refs = ' '.join(f'{4 + 2 * index} 0 R' for index in range(len(page_streams)))
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{page_refs}] /Count {len(page_streams)} >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+    ]
+    for index, stream in enumerate(page_streams):
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {media_box[0]} '
+                       f'{media_box[1]}] /Resources << /Font << /F1 3 0 R >> >> '
+                       f'/Contents {5 + 2 * index} 0 R >>')
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref_offset = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('ascii')
+    for offset in offsets:
+        output += f'{offset:010d} 00000 n \n'.encode('ascii')
+    output += (f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+               f'startxref\n{xref_offset}\n%%EOF\n').encode('ascii')
+    return bytes(output)
+
+
+def build_text_pdf(rng, pages, lines_per_page=45):
+    """
+    Build a multi-page PDF with a text layer (as exported by a word processor)
+
+    Args:
+        rng (random.Random): Document random generator
+        pages (int): Number of pages
+        lines_per_page (int): Text lines on each page
+
+    Returns:
+        bytes: PDF file
+    """
+    page_streams = []
+    for _ in range(pages):
+        lines = ' T* '.join(f'({escape_pdf_text(generate_sentence(rng))}) Tj'
+                            for _ in range(lines_per_page))
+        page_streams.append(f'BT /F1 10 Tf 14 TL 50 790 Td {lines} ET')
+    return build_pdf(page_streams)
+
+
+def build_scanned_pdf(rng, pages, dpi):
+    """
+    Build an image-only PDF of grayscale page scans (no text layer)
+
+    Args:
+        rng (random.Random): Document random generator
+        pages (int): Number of pages
+        dpi (int): Scan resolution in dots per inch
+
+    Returns:
+        bytes: PDF file
+    """
+    page_images = [render_text_page(rng, dpi, mode='L') for _ in range(pages)]
+    buffer = io.BytesIO()
+    page_images[0].save(buffer, 'PDF', save_all=True, append_images=page_images[1:],
+                        resolution=dpi, creationDate=DOCUMENT_TIMESTAMP.timetuple(),
+                        modDate=DOCUMENT_TIMESTAMP.timetuple())
+    return buffer.getvalue()
+
+
+def generate_table_row(rng, row_number):
+    """
+    Generate one row of an order table
+
+    Args:
+        rng (random.Random): Document random generator
+        row_number (int): 1-based row number
+
+    Returns:
+        list: Order id, date, customer, product, quantity, unit price and note
+    """
+    return [
+        f'ORD-{row_number:07d}',
+        f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+        f'{rng.choice(VOCABULARY).capitalize()} {rng.choice(VOCABULARY).capitalize()} Ltd',
+        rng.choice(VOCABULARY),
+        rng.randint(1, 500),
+        round(rng.uniform(0.5, 999.0), 2),
+        generate_sentence(rng, 2, 6)
+    ]
+
+
+def build_csv(rng, rows):
+    """
+    Build a large comma-separated order table
+
+    Args:
+        rng (random.Random): Document random generator
+        rows (int): Number of data rows
+
+    Returns:
+        bytes: UTF-8 CSV file with a header row
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(TABLE_HEADER)
+    for row_number in range(1, rows + 1):
+        writer.writerow(generate_table_row(rng, row_number))
+    return buffer.getvalue().encode('utf-8')
+
+
+def normalize_zip_timestamps(content):
+    """
+    Rewrite a ZIP-based document with fixed member timestamps
+    XLSX and DOCX writers stamp members (and openpyxl the 'modified' document property)
+    with the current time, which would make otherwise identical documents differ byte
+    for byte between runs
+
+    Args:
+        content (bytes): XLSX or DOCX file
+
+    Returns:
+        bytes: The same document with every member and modification time dated
+               DOCUMENT_TIMESTAMP
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(content)) as source, \
+            zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+        for member in source.infolist():
+            normalized = zipfile.ZipInfo(member.filename, DOCUMENT_TIMESTAMP.timetuple()[:6])
+            normalized.compress_type = zipfile.ZIP_DEFLATED
+            member_content = source.read(member)
+            if member.filename == 'docProps/core.xml':
+                member_content = MODIFIED_PROPERTY_PATTERN.sub(
+                    rb'\g<1>' + DOCUMENT_TIMESTAMP.strftime('%Y-%m-%dT%H:%M:%SZ').encode()
+                    + rb'\g<2>',
+                    member_content
+                )
+            target.writestr(normalized, member_content)
+    return buffer.getvalue()
+
+
+def build_xlsx(rng, sheets, rows):
+    """
+    Build a multi-sheet workbook with one order table per sheet
+
+    Args:
+        rng (random.Random): Document random generator
+        sheets (int): Number of worksheets
+        rows (int): Data rows per worksheet
+
+    Returns:
+        bytes: XLSX file
+    """
+    import openpyxl  # pylint: disable=import-outside-toplevel
+
+    workbook = openpyxl.Workbook(write_only=True)
+    # openpyxl restamps 'modified' on save; normalize_zip_timestamps pins it afterwards
+    workbook.properties.created = DOCUMENT_TIMESTAMP
+    for sheet_number in range(1, sheets + 1):
+        worksheet = workbook.create_sheet(f'Region {sheet_number}')
+        worksheet.append(TABLE_HEADER)
+        for row_number in range(1, rows + 1):
+            worksheet.append(generate_table_row(rng, row_number))
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return normalize_zip_timestamps(buffer.getvalue())
+
+
+def build_docx(rng, paragraphs):
+    """
+    Build a Word document of headed sections
+
+    Args:
+        rng (random.Random): Document random generator
+        paragraphs (int): Number of body paragraphs
+
+    Returns:
+        bytes: DOCX file
+    """
+    import docx  # pylint: disable=import-outside-toplevel
+
+    document = docx.Document()
+    document.core_properties.created = document.core_properties.modified = DOCUMENT_TIMESTAMP
+    for index in range(paragraphs):
+        if index % 10 == 0:
+            document.add_heading(generate_sentence(rng, 2, 4), level=1)
+        document.add_paragraph(' '.join(generate_sentence(rng) for _ in range(4)))
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return normalize_zip_timestamps(buffer.getvalue())
+
+
+def build_corpus_plan(options=None):
+    """
+    List the documents of a corpus without generating them
+
+    Args:
+        options (dict): Corpus sizes overriding DEFAULT_CORPUS_OPTIONS
+
+    Returns:
+        list: Document descriptions (name, extension, file_type, pages, render_dpi and
+              the builder arguments)
+    """
+    options = {**DEFAULT_CORPUS_OPTIONS, **(options or {})}
+    plan = []
+    for dpi in options['image_dpis']:
+        plan.append({'name': f'scan_{dpi}dpi.png', 'extension': 'png', 'file_type': 'png',
+                     'pages': 1, 'render_dpi': dpi,
+                     'builder': ('image', {'dpi': dpi, 'image_format': 'PNG'})})
+        plan.append({'name': f'scan_{dpi}dpi.jpg', 'extension': 'jpg', 'file_type': 'jpeg',
+                     'pages': 1, 'render_dpi': dpi,
+                     'builder': ('image', {'dpi': dpi, 'image_format': 'JPEG'})})
+    plan.append({'name': 'text_layer.pdf', 'extension': 'pdf', 'file_type': 'pdf_text',
+                 'pages': options['pdf_pages'], 'render_dpi': None,
+                 'builder': ('text_pdf', {'pages': options['pdf_pages']})})
+    plan.append({'name': 'scanned.pdf', 'extension': 'pdf', 'file_type': 'pdf_scanned',
+                 'pages': options['pdf_pages'], 'render_dpi': options['scan_dpi'],
+                 'builder': ('scanned_pdf', {'pages': options['pdf_pages'],
+                                             'dpi': options['scan_dpi']})})
+    plan.append({'name': 'orders.csv', 'extension': 'csv', 'file_type': 'csv',
+                 'pages': 1, 'render_dpi': None,
+                 'builder': ('csv', {'rows': options['csv_rows']})})
+    plan.append({'name': 'regions.xlsx', 'extension': 'xlsx', 'file_type': 'xlsx',
+                 'pages': options['xlsx_sheets'], 'render_dpi': None,
+                 'builder': ('xlsx', {'sheets': options['xlsx_sheets'],
+                                      'rows': options['xlsx_rows']})})
+    plan.append({'name': 'report.docx', 'extension': 'docx', 'file_type': 'docx',
+                 'pages': 1, 'render_dpi': None,
+                 'builder': ('docx', {'paragraphs': options['docx_paragraphs']})})
+    return plan
+
+
+BUILDERS = {
+    'image': build_image,
+    'text_pdf': build_text_pdf,
+    'scanned_pdf': build_scanned_pdf,
+    'csv': build_csv,
+    'xlsx': build_xlsx,
+    'docx': build_docx
+}
+
+
+def write_corpus(folder, seed, options=None, file_types=None):
+    """
+    Generate the corpus into a folder
+
+    Args:
+        folder (str): Output folder (created if missing)
+        seed (int): Corpus seed
+        options (dict): Corpus sizes overriding DEFAULT_CORPUS_OPTIONS
+        file_types (set): Only generate these file types (None = all)
+
+    Returns:
+        list: Document descriptions with the 'path' and 'size_bytes' of each file
+    """
+    os.makedirs(folder, exist_ok=True)
+    documents = []
+    for entry in build_corpus_plan(options):
+        if file_types and entry['file_type'] not in file_types:
+            continue
+        builder_name, builder_args = entry.pop('builder')
+        content = BUILDERS[builder_name](get_document_random(seed, entry['name']),
+                                         **builder_args)
+        entry['path'] = os.path.join(folder, entry['name'])
+        with open(entry['path'], 'wb') as output_file:
+            output_file.write(content)
+        entry['size_bytes'] = len(content)
+        documents.append(entry)
+    return documents
+
+
+def main():
+    """
+    Generate the corpus into a folder and print its manifest as JSON
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('folder')
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+    print(json.dumps(write_corpus(args.folder, args.seed), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,10 +7,53 @@ THREADED = True
 HOST = '127.0.0.1'
 PORT = 5000
 
+# Production Server Configuration (serve.py)
+SERVE_WORKERS = 0  # Preforked worker processes (0 = one per CPU core)
+SERVE_THREADS = 4  # Request threads per worker process
+SERVE_TIMEOUT = 300  # Seconds a worker may stay silent (e.g. on a long PDF) before it is restarted
+SERVE_OCR_PROCESSES_PER_WORKER = 1  # OCR_WORKER_PROCESSES inside each worker (1 = no nested pool)
+SERVE_PRELOAD_LANGUAGES = ['eng']  # tesserocr engines initialized before workers are forked
+
 # File Upload Configuration
 UPLOAD_FOLDER = 'uploads'
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
 
+# Upload Storage Configuration
+UPLOAD_SHARD_CHARS = 2  # Filename prefix length used as shard subdirectory (0 = flat)
+UPLOAD_RETENTION_SECONDS = 24 * 3600  # Uploads and previews older than this are deleted (0 = keep)
+UPLOAD_MAX_TOTAL_BYTES = 2 * 1024 * 1024 * 1024  # 2GB; oldest files evicted above it (0 = no limit)
+UPLOAD_SWEEP_INTERVAL = 300  # Seconds between background sweeps of the upload folder
+UPLOAD_EVICTION_GRACE_SECONDS = 300  # Files younger than this are never evicted to meet the quota
+# Process /api/v1/ocr and /api/v1/ocr/batch uploads in memory; nothing is saved, previewed
+# or cached, and /api/v1/jobs is refused because queued jobs store their upload and result
+EPHEMERAL_UPLOADS = False
+
+# Result Cache Configuration
+RESULT_CACHE_ENABLED = True  # Reuse results for identical uploads with identical settings
+RESULT_CACHE_FOLDER = 'cache'  # Directory for cached JSON results
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB total before least-recently-used eviction
+RESULT_CACHE_RESCAN_INTERVAL = 300  # Seconds before the cache folder size is recounted
+
+# Background Job Configuration
+JOB_WORKER_THREADS = 2  # Jobs processed concurrently by /api/v1/jobs
+JOB_QUEUE_MAX_DEPTH = 16  # Jobs queued across all workers before submissions get HTTP 429
+JOB_RESULT_TTL = 3600  # Seconds finished jobs stay retrievable
+JOB_STORE_FOLDER = 'jobs'  # Job records shared by all server worker processes
+JOB_CALLBACK_TIMEOUT = 10  # Seconds to wait for a job callback URL to respond
+JOB_CALLBACK_ALLOWED_HOSTS = ['127.0.0.1', 'localhost']  # Callback hosts accepted (empty = any)
+
+# Batch Processing Configuration
+BATCH_WORKER_THREADS = 4  # Files processed concurrently by /api/v1/ocr/batch
+BATCH_MAX_FILES = 500  # Maximum files per batch request (including zip archive members)
+BATCH_MAX_UNCOMPRESSED_BYTES = 256 * 1024 * 1024  # 256MB total extracted size for zip batches
+
+# Timing Instrumentation Configuration
+TIMING_HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+
+# Metrics Configuration
+METRICS_MULTIPROCESS_DIR = None  # Folder shared by worker processes for /metrics (set by serve.py)
+METRICS_SNAPSHOT_INTERVAL = 5  # Seconds between metric snapshots written by each worker
+
 # Supported File Extensions
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'pdf', 'docx', 'txt', 'csv', 'xls', 'xlsx'}
 
@@ -28,14 +71,36 @@ PDF_DPI = 300  # DPI for PDF to image conversion
 PROCESS_FIRST_PAGE_ONLY = False  # Process all pages for enhanced PDF processing
 
 # Enhanced PDF Processing Configuration
-MAX_PDF_PAGES = 10  # Maximum number of pages to process to avoid memory issues
+MAX_PDF_PAGES = 50  # Maximum number of pages to OCR (pages are rasterized one at a time)
 PDF_TEXT_EXTRACTION_FIRST = True  # Try text extraction before OCR for text-based PDFs
 
+# OCR Backend Configuration
+OCR_BACKEND = 'subprocess'  # 'subprocess' (pytesseract CLI) or 'tesserocr' (persistent engines)
+OCR_ENGINE_POOL_SIZE = 2  # Idle tesserocr engines kept per (language, engine mode) in each process
+TESSDATA_PATH = None  # tessdata folder for the tesserocr backend (None = Tesseract default)
+
+# Parallel OCR Configuration
+OCR_WORKER_PROCESSES = 0  # Worker processes for multi-page OCR (0 = one per core, 1 = sequential)
+# How OCR worker processes start: 'forkserver' (falls back to 'spawn' where unavailable) or
+# 'spawn'. A 'fork' of the threaded server can copy a lock another thread holds and hang.
+OCR_POOL_START_METHOD = 'forkserver'
+
+# PDF Page Preview Configuration
+PDF_PREVIEW_THREADS = 2  # Background threads writing page preview PNGs while OCR runs
+PDF_PREVIEW_COMPRESS_LEVEL = 1  # PNG zlib level for previews (1 = fastest, 9 = smallest)
+PDF_PREVIEW_MAX_DIMENSION = 0  # Max preview side in pixels (0 = full size, required by the web UI)
+
 # Spreadsheet Processing Configuration
-CSV_DELIMITER = ','  # Default delimiter for CSV files
-CSV_ENCODING = 'utf-8'  # Default encoding for CSV files
+CSV_DELIMITER = ','  # Delimiter used when it cannot be sniffed from the file
+CSV_ENCODING = 'utf-8'  # Preferred encoding for CSV files
+CSV_FALLBACK_ENCODINGS = ['cp1252', 'latin-1']  # Tried in order if CSV_ENCODING cannot decode
+CSV_SNIFF_BYTES = 64 * 1024  # File prefix used to sniff the CSV encoding and delimiter
+CSV_SNIFF_DELIMITERS = ',;\t|'  # Delimiters the sniffer may choose from
+CSV_PAGE_SIZE = 1000  # Default rows per page for the CSV rows cursor API
+CSV_MAX_PAGE_SIZE = 10000  # Maximum rows per page for the CSV rows cursor API
 EXCEL_MAX_ROWS = 1000  # Maximum rows to process from Excel files
 EXCEL_MAX_COLUMNS = 50  # Maximum columns to process from Excel files
+EXCEL_PARALLEL_MIN_SHEETS = 0  # Parse sheets in the worker pool from this many sheets (0 = never)
 
 # Advanced OCR Configuration - DPI Settings
 DPI_PRESETS = {
@@ -44,6 +109,10 @@ DPI_PRESETS = {
     'high': 600      # Slower processing, higher accuracy
 }
 DEFAULT_DPI_SETTING = 'medium'
+# Longest image side after DPI scaling (0 = no cap), A4 at 300 DPI by default. Larger JPEGs
+# are decoded at 1/2 to 1/8 size (draft mode) when the cap at least halves them. Rasterized
+# PDF pages are not capped, as their size already follows the DPI preset
+OCR_MAX_IMAGE_DIMENSION = 3508
 
 # Advanced OCR Configuration - Language Support
 AVAILABLE_LANGUAGES = {
@@ -62,6 +131,9 @@ AVAILABLE_LANGUAGES = {
     'hin': 'Hindi'
 }
 DEFAULT_LANGUAGE = 'eng'
+TESSERACT_INFO_CACHE_TTL = 3600  # Seconds before languages/version are re-probed (0 = never)
+TESSERACT_PROBE_TIMEOUT = 10  # Seconds to wait for 'tesseract --version' / '--list-langs'
+TESSERACT_DISCOVERY_IN_BACKGROUND = True  # create_app() probes Tesseract off the startup path
 
 # Advanced OCR Configuration - Engine Parameters
 OCR_ENGINE_MODES = {
@@ -88,3 +160,5 @@ DEFAULT_PSM_MODE = 'single_column'  # Better text recognition for ID cards
 
 # Output Configuration
 JSON_FILENAME = 'extracted_data.json'
+RESPONSE_FORMATS = ['records', 'columnar']  # OCR word boxes as objects or as parallel arrays
+RESPONSE_ENCODINGS = ['json', 'msgpack']  # msgpack requires the optional msgpack package
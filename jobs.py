@@ -0,0 +1,459 @@
+"""
+Docusense OCR Prototype - Background Job Queue
+
+Bounded in-process job queue for long-running OCR requests. Jobs are executed by a
+fixed number of worker threads; submissions beyond the configured queue depth are
+rejected so callers can apply backpressure instead of growing threads without limit.
+Job state (status, per-page progress, result) is optionally POSTed to a callback URL
+when the job finishes.
+
+Jobs run in the process that accepted them, but every state change is also written
+to a JSON record in JOB_STORE_FOLDER, so any server worker process can answer a
+status poll. Queued jobs leave a marker file there as well, so the queue depth limit
+counts the jobs waiting in every worker.
+"""
+
+import json
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from urllib import error as urllib_error
+from urllib import parse as urllib_parse
+from urllib import request as urllib_request
+import config
+import metrics
+
+# Job IDs are uuid4 hex strings; anything else never names a record file
+JOB_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+# Subfolder of JOB_STORE_FOLDER holding one '<job_id>.<pid>' marker per queued job
+QUEUED_MARKERS_FOLDER = 'queued'
+
+# Jobs owned by this process and its pending work queue
+_JOBS = {}
+_JOBS_LOCK = threading.Lock()
+_JOB_QUEUE = queue.Queue(maxsize=config.JOB_QUEUE_MAX_DEPTH)
+
+# Worker threads are started on first submission
+_WORKERS = {'threads': []}
+_WORKERS_LOCK = threading.Lock()
+
+# Job currently executed by this worker thread (used for progress reporting)
+_CURRENT_JOB = threading.local()
+
+
+def validate_callback_url(callback_url):
+    """
+    Validate a job callback URL against the configured host allowlist
+
+    Args:
+        callback_url (str): URL to POST the finished job to
+
+    Returns:
+        str: Error message, or None if the URL is acceptable
+    """
+    parsed_url = urllib_parse.urlparse(callback_url)
+    if parsed_url.scheme not in ('http', 'https') or not parsed_url.hostname:
+        return 'Callback URL must be an absolute http(s) URL'
+    allowed_hosts = config.JOB_CALLBACK_ALLOWED_HOSTS
+    if allowed_hosts and parsed_url.hostname not in allowed_hosts:
+        return f"Callback host '{parsed_url.hostname}' is not allowed"
+    return None
+
+
+def submit_job(task, callback_url=None, metadata=None):
+    """
+    Queue a task for background execution
+
+    Args:
+        task (callable): Zero-argument callable returning a JSON-serializable result
+        callback_url (str): Optional URL that receives the finished job as JSON
+        metadata (dict): Optional extra fields reported with the job
+
+    Returns:
+        str: Job ID
+
+    Raises:
+        queue.Full: If the queue is at its configured depth limit
+        OSError: If the job cannot be registered in the job store
+    """
+    _ensure_workers_started()
+    _prune_finished_jobs()
+
+    job_id = uuid.uuid4().hex
+    job = {
+        'job_id': job_id,
+        'status': 'queued',
+        'created_at': time.time(),
+        'started_at': None,
+        'finished_at': None,
+        'progress': {'pages_done': 0, 'pages_total': None},
+        'result': None,
+        'error': None,
+        'callback_url': callback_url,
+        'callback_status': None,
+        **(metadata or {})
+    }
+
+    _claim_queue_slot(job_id)
+    with _JOBS_LOCK:
+        _JOBS[job_id] = job
+        _store_job(job)
+    try:
+        _JOB_QUEUE.put_nowait((job_id, task))
+    except queue.Full:
+        with _JOBS_LOCK:
+            del _JOBS[job_id]
+        _remove_job_files(job_id)
+        raise
+
+    return job_id
+
+
+def get_job(job_id):
+    """
+    Get a snapshot of a job's state, from this process or from the shared job store
+
+    Args:
+        job_id (str): Job ID
+
+    Returns:
+        dict: Copy of the job state, or None if unknown or expired
+    """
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+        if job is not None:
+            snapshot = dict(job)
+            snapshot['progress'] = dict(job['progress'])
+            return snapshot
+    return _load_job(job_id)
+
+
+def get_queue_stats():
+    """
+    Get queue depth and job counts by status
+
+    Returns:
+        dict: Queue statistics
+    """
+    with _JOBS_LOCK:
+        statuses = [job['status'] for job in _JOBS.values()]
+    return {
+        'queued': statuses.count('queued'),
+        'running': statuses.count('running'),
+        'completed': statuses.count('completed'),
+        'failed': statuses.count('failed'),
+        'queue_depth': _JOB_QUEUE.qsize(),
+        'max_queue_depth': config.JOB_QUEUE_MAX_DEPTH,
+        'workers': config.JOB_WORKER_THREADS
+    }
+
+
+def set_progress(pages_done=None, pages_total=None):
+    """
+    Update progress of the job running on the current thread
+    Does nothing when called outside a background job
+
+    Args:
+        pages_done (int): Number of pages finished so far
+        pages_total (int): Total number of pages to process
+    """
+    job_id = getattr(_CURRENT_JOB, 'job_id', None)
+    if job_id is None:
+        return
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+        if job is None:
+            return
+        if pages_done is not None:
+            job['progress']['pages_done'] = pages_done
+        if pages_total is not None:
+            job['progress']['pages_total'] = pages_total
+        _store_job(job)
+
+
+def advance_progress():
+    """
+    Mark one more page as finished for the job running on the current thread
+    """
+    job_id = getattr(_CURRENT_JOB, 'job_id', None)
+    if job_id is None:
+        return
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+        if job is not None:
+            job['progress']['pages_done'] += 1
+            _store_job(job)
+
+
+def _update_job(job_id, **fields):
+    """
+    Update fields of a registered job
+
+    Args:
+        job_id (str): Job ID
+        **fields: Job fields to set
+    """
+    with _JOBS_LOCK:
+        if job_id in _JOBS:
+            _JOBS[job_id].update(fields)
+            _store_job(_JOBS[job_id])
+
+
+def _ensure_workers_started():
+    """
+    Start the worker threads that are not running yet
+    """
+    with _WORKERS_LOCK:
+        # Replace any worker that has died so the queue never stalls
+        _WORKERS['threads'] = [worker for worker in _WORKERS['threads'] if worker.is_alive()]
+        for worker_num in range(len(_WORKERS['threads']), max(1, config.JOB_WORKER_THREADS)):
+            worker = threading.Thread(
+                target=_worker_loop, name=f'docusense-job-{worker_num + 1}', daemon=True
+            )
+            worker.start()
+            _WORKERS['threads'].append(worker)
+
+
+def _worker_loop():
+    """
+    Execute queued jobs forever
+    """
+    while True:
+        job_id, task = _JOB_QUEUE.get()
+        try:
+            _run_job(job_id, task)
+        finally:
+            _JOB_QUEUE.task_done()
+
+
+def _run_job(job_id, task):
+    """
+    Execute one job and record its outcome
+
+    Args:
+        job_id (str): Job ID
+        task (callable): Zero-argument callable returning the job result
+    """
+    _release_queue_slot(job_id)
+    _update_job(job_id, status='running', started_at=time.time())
+    _CURRENT_JOB.job_id = job_id
+    try:
+        result = task()
+        with _JOBS_LOCK:
+            job = _JOBS.get(job_id)
+            if job is not None:
+                job.update(status='completed', result=result, finished_at=time.time())
+                # Single-pass files never report pages, so completion means 1 of 1
+                if job['progress']['pages_total'] is None:
+                    job['progress'] = {'pages_done': 1, 'pages_total': 1}
+                _store_job(job)
+    # Any exception (e.g. BadZipFile from a corrupt workbook) fails only this job;
+    # letting it escape would kill the worker thread and stall the queue
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        _update_job(job_id, status='failed', finished_at=time.time(),
+                    error={'error': 'Processing failed', 'message': str(e) or type(e).__name__})
+    finally:
+        _CURRENT_JOB.job_id = None
+
+    job = get_job(job_id)
+    if job is not None and job['callback_url']:
+        _update_job(job_id, callback_status=_send_callback(job))
+
+
+def _send_callback(job):
+    """
+    POST the finished job state to its callback URL
+
+    Args:
+        job (dict): Job snapshot
+
+    Returns:
+        str: Callback outcome ('delivered (<status>)' or a failure description)
+    """
+    payload = json.dumps(job).encode('utf-8')
+    callback_request = urllib_request.Request(
+        job['callback_url'], data=payload, method='POST',
+        headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib_request.urlopen(callback_request,
+                                    timeout=config.JOB_CALLBACK_TIMEOUT) as response:
+            return f'delivered ({response.status})'
+    except (urllib_error.URLError, OSError, ValueError) as e:
+        return f'failed ({str(e)})'
+
+
+def _prune_finished_jobs():
+    """
+    Forget finished jobs older than the configured retention period
+    Records in the job store are pruned by age too, whichever process wrote them
+    """
+    cutoff = time.time() - config.JOB_RESULT_TTL
+    with _JOBS_LOCK:
+        expired = [
+            job_id for job_id, job in _JOBS.items()
+            if job['finished_at'] is not None and job['finished_at'] < cutoff
+        ]
+        for job_id in expired:
+            del _JOBS[job_id]
+        unfinished = {job_id for job_id, job in _JOBS.items() if job['finished_at'] is None}
+
+    try:
+        with os.scandir(config.JOB_STORE_FOLDER) as scanner:
+            for dir_entry in scanner:
+                # A finished job's record is not written again, so its age is the job's age
+                job_id = dir_entry.name[:-len('.json')]
+                if (not dir_entry.name.endswith('.json') or job_id in unfinished
+                        or dir_entry.stat().st_mtime >= cutoff):
+                    continue
+                os.remove(dir_entry.path)
+    except OSError:
+        pass
+
+
+def _job_path(job_id):
+    """
+    Get the path of a job's record in the job store
+
+    Args:
+        job_id (str): Job ID
+
+    Returns:
+        str: Path of the JSON record, or None if the ID is malformed
+    """
+    if not JOB_ID_PATTERN.fullmatch(job_id):
+        return None
+    return os.path.join(config.JOB_STORE_FOLDER, f'{job_id}.json')
+
+
+def _store_job(job):
+    """
+    Write a job's state to the job store
+    Caller must hold _JOBS_LOCK, so writes of one job never overtake each other
+
+    Args:
+        job (dict): Job state owned by this process
+    """
+    job_path = _job_path(job['job_id'])
+    # Worker processes share the folder, so the process ID keeps temporary names unique
+    temp_path = f"{job_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(config.JOB_STORE_FOLDER, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as record_file:
+            json.dump({**job, 'worker_pid': os.getpid()}, record_file)
+        os.replace(temp_path, job_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"⚠️ Unable to store job {job['job_id']}: {str(e)}")
+
+
+def _load_job(job_id):
+    """
+    Read a job written by any worker process from the job store
+
+    Args:
+        job_id (str): Job ID
+
+    Returns:
+        dict: Job state, or None if unknown or expired
+    """
+    job_path = _job_path(job_id)
+    if job_path is None:
+        return None
+    try:
+        with open(job_path, 'r', encoding='utf-8') as record_file:
+            job = json.load(record_file)
+    except (OSError, ValueError):
+        return None
+
+    # A job whose process exited before finishing it will never finish
+    worker_pid = job.pop('worker_pid', None)
+    if (job['status'] in ('queued', 'running') and worker_pid is not None
+            and not metrics.is_process_alive(worker_pid)):
+        job.update(status='failed', error={
+            'error': 'Processing failed',
+            'message': 'The worker process running this job exited before it finished'
+        })
+    return job
+
+
+def _claim_queue_slot(job_id):
+    """
+    Leave a queued marker for a new job, unless the queues of all workers are full
+
+    Args:
+        job_id (str): Job ID
+
+    Raises:
+        queue.Full: If JOB_QUEUE_MAX_DEPTH jobs are already queued across all workers
+    """
+    markers_folder = os.path.join(config.JOB_STORE_FOLDER, QUEUED_MARKERS_FOLDER)
+    os.makedirs(markers_folder, exist_ok=True)
+    marker_path = os.path.join(markers_folder, f'{job_id}.{os.getpid()}')
+    with open(marker_path, 'w', encoding='utf-8'):
+        pass
+    # Counting after claiming means concurrent submissions can both back off, never both pass
+    if _count_queued_jobs(markers_folder) > config.JOB_QUEUE_MAX_DEPTH:
+        os.remove(marker_path)
+        raise queue.Full
+
+
+def _count_queued_jobs(markers_folder):
+    """
+    Count the jobs queued by live worker processes, removing markers of exited ones
+
+    Args:
+        markers_folder (str): Folder of queued markers
+
+    Returns:
+        int: Number of queued jobs across all workers
+    """
+    queued = 0
+    alive_by_pid = {}
+    with os.scandir(markers_folder) as scanner:
+        for dir_entry in scanner:
+            pid_text = dir_entry.name.rpartition('.')[2]
+            if not pid_text.isdigit():
+                continue
+            pid = int(pid_text)
+            if pid not in alive_by_pid:
+                alive_by_pid[pid] = metrics.is_process_alive(pid)
+            if alive_by_pid[pid]:
+                queued += 1
+                continue
+            try:
+                os.remove(dir_entry.path)
+            except OSError:
+                pass
+    return queued
+
+
+def _release_queue_slot(job_id):
+    """
+    Remove the queued marker of a job that has left this process's queue
+
+    Args:
+        job_id (str): Job ID
+    """
+    try:
+        os.remove(os.path.join(config.JOB_STORE_FOLDER, QUEUED_MARKERS_FOLDER,
+                               f'{job_id}.{os.getpid()}'))
+    except OSError:
+        pass
+
+
+def _remove_job_files(job_id):
+    """
+    Remove the record and queued marker of a job that was never queued
+
+    Args:
+        job_id (str): Job ID
+    """
+    _release_queue_slot(job_id)
+    try:
+        os.remove(_job_path(job_id))
+    except OSError:
+        pass
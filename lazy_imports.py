@@ -0,0 +1,43 @@
+"""
+Docusense OCR Prototype - Deferred Imports
+
+Heavy libraries (pandas, numpy, openpyxl, python-docx, PyPDF2, pdf2image and
+pytesseract, which itself imports pandas) are bound to module proxies that import
+the real module on first attribute access. Importing the app therefore only pays
+for the libraries a request actually uses, when that request arrives.
+"""
+
+import importlib
+import importlib.util
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access
+    """
+
+    def __init__(self, module_name):
+        self._module_name = module_name
+
+    def __getattr__(self, name):
+        # import_module is thread-safe and only a sys.modules lookup once loaded
+        return getattr(importlib.import_module(self._module_name), name)
+
+    def __repr__(self):
+        return f"<lazy module '{self._module_name}'>"
+
+
+def is_installed(module_name):
+    """
+    Check whether a module can be imported, without importing it
+
+    Args:
+        module_name (str): Top-level module name
+
+    Returns:
+        bool: True if the module is installed
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
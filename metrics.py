@@ -0,0 +1,535 @@
+"""
+Docusense OCR Prototype - Prometheus Metrics
+
+In-process counters and gauges rendered in the Prometheus text exposition format.
+Stage latency histograms come from the timing module; result cache, job queue and
+upload storage figures are read from their own modules at scrape time, so scraping
+never spawns a subprocess.
+
+When several worker processes serve the app (METRICS_MULTIPROCESS_DIR is set), each
+worker writes a snapshot of its figures to that folder every few seconds, and the
+worker answering a scrape merges its live figures with the other workers' snapshots.
+Snapshot files are named after a per-process worker ID, so a new worker that reuses
+the PID of an exited one never overwrites its figures. Live workers fold the
+counters of exited workers into one cumulative file and remove their snapshots, so
+totals never go backwards; gauges only count live workers.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+import config
+
+# fcntl is Unix-only, like the multi-worker server that needs the folder lock
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Metric families: name -> (type, help text)
+METRIC_FAMILIES = {
+    'docusense_requests_total': (
+        'counter', 'HTTP requests by endpoint, file type and status code'),
+    'docusense_upload_bytes_total': (
+        'counter', 'Bytes received in upload request bodies by endpoint'),
+    'docusense_requests_in_flight': (
+        'gauge', 'Requests currently being handled'),
+    'docusense_pages_ocr_total': (
+        'counter', 'Images and PDF pages processed with OCR'),
+    'docusense_stage_duration_seconds': (
+        'histogram', 'Wall time of processing stages and process_* functions'),
+    'docusense_result_cache_lookups_total': (
+        'counter', 'Result cache lookups by outcome'),
+    'docusense_result_cache_hit_ratio': (
+        'gauge', 'Result cache hits divided by lookups since startup'),
+    'docusense_result_cache_size_bytes': (
+        'gauge', 'Disk space used by the result cache'),
+    'docusense_result_cache_evictions_total': (
+        'counter', 'Result cache entries evicted to stay within the size limit'),
+    'docusense_job_queue_depth': (
+        'gauge', 'Jobs waiting in the background job queue'),
+    'docusense_jobs': (
+        'gauge', 'Known background jobs by status'),
+    'docusense_upload_storage_bytes': (
+        'gauge', 'Disk space used by uploads and page previews as of the last sweep'),
+    'docusense_upload_storage_files': (
+        'gauge', 'Files in the upload folder as of the last sweep'),
+    'docusense_upload_storage_removed_total': (
+        'counter', 'Upload files removed by the sweeper by reason'),
+}
+
+# Gauges describing a running process; values of exited workers are not merged
+LIVE_ONLY_METRICS = {'docusense_requests_in_flight'}
+
+# Files in the shared metrics folder: counters folded from exited workers, and the
+# lock that keeps scrapes from reading a half-done fold
+EXITED_WORKERS_FILE = 'exited-workers.json'
+FOLDER_LOCK_FILE = 'metrics.lock'
+
+# Counter and gauge values keyed by (name, sorted label items)
+_VALUES = {}
+_VALUES_LOCK = threading.Lock()
+
+# Snapshot writer of this process; restarted with a new worker ID after a fork (pid changes)
+_SNAPSHOTS = {'pid': None, 'worker_id': None, 'started_at': None, 'sources': None}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def increment(name, value=1, **labels):
+    """
+    Add to a counter or gauge
+
+    Args:
+        name (str): Metric name from METRIC_FAMILIES
+        value (float): Amount to add (negative values decrement gauges)
+        **labels: Label names and values
+    """
+    key = (name, tuple(sorted((label, str(label_value)) for label, label_value in labels.items())))
+    with _VALUES_LOCK:
+        _VALUES[key] = _VALUES.get(key, 0) + value
+    ensure_snapshot_writer_started()
+
+
+def set_snapshot_sources(sources):
+    """
+    Register where snapshots get the figures owned by other modules
+
+    Args:
+        sources (callable): Returns (stage_histograms, cache_stats, queue_stats,
+                            storage_stats), the arguments of render_metrics()
+    """
+    _SNAPSHOTS['sources'] = sources
+
+
+def ensure_snapshot_writer_started():
+    """
+    Start this process's snapshot writer thread when running with several workers
+    """
+    if not config.METRICS_MULTIPROCESS_DIR or _SNAPSHOTS['sources'] is None:
+        return
+    if _SNAPSHOTS['pid'] == os.getpid():
+        return
+    with _SNAPSHOTS_LOCK:
+        if _SNAPSHOTS['pid'] == os.getpid():
+            return
+        _SNAPSHOTS.update(pid=os.getpid(), worker_id=f'{os.getpid()}-{uuid.uuid4().hex[:8]}',
+                          started_at=time.time())
+        threading.Thread(target=_snapshot_writer_loop, args=(_SNAPSHOTS['sources'],),
+                         name='docusense-metrics-snapshot', daemon=True).start()
+
+
+def build_snapshot(stage_histograms, cache_stats, queue_stats, storage_stats):
+    """
+    Capture this process's figures
+
+    Args:
+        stage_histograms (dict): Output of timing.get_histograms()
+        cache_stats (dict): Output of result_cache.get_cache_stats()
+        queue_stats (dict): Output of jobs.get_queue_stats()
+        storage_stats (dict): Output of storage.get_storage_stats()
+
+    Returns:
+        dict: JSON-serializable snapshot
+    """
+    with _VALUES_LOCK:
+        values = [[name, label_items, value] for (name, label_items), value in _VALUES.items()]
+    return {
+        'pid': os.getpid(), 'worker_id': _SNAPSHOTS['worker_id'],
+        # Before the writer starts, this process is still the latest to own its PID
+        'started_at': _SNAPSHOTS['started_at'] or time.time(), 'written_at': time.time(),
+        'values': values,
+        'histograms': stage_histograms, 'cache': cache_stats, 'queue': queue_stats,
+        'storage': storage_stats
+    }
+
+
+def write_snapshot(snapshot):
+    """
+    Write a snapshot of this process to the shared metrics folder
+
+    Args:
+        snapshot (dict): Output of build_snapshot()
+    """
+    snapshot_path = os.path.join(config.METRICS_MULTIPROCESS_DIR,
+                                 f"worker-{snapshot['worker_id']}.json")
+    # Write and rename so a scrape never reads a half-written snapshot
+    with open(snapshot_path + '.tmp', 'w', encoding='utf-8') as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+    os.replace(snapshot_path + '.tmp', snapshot_path)
+
+
+def render_metrics(stage_histograms, cache_stats, queue_stats, storage_stats):
+    """
+    Render all metrics in the Prometheus text exposition format
+    With several worker processes, the figures of every worker are merged
+
+    Args:
+        stage_histograms (dict): Output of timing.get_histograms()
+        cache_stats (dict): Output of result_cache.get_cache_stats()
+        queue_stats (dict): Output of jobs.get_queue_stats()
+        storage_stats (dict): Output of storage.get_storage_stats()
+
+    Returns:
+        str: Metrics text ending with a newline
+    """
+    if config.METRICS_MULTIPROCESS_DIR:
+        # Live figures of this process, file snapshots of the other workers
+        with _folder_lock(exclusive=False):
+            snapshots = [snapshot for snapshot in _read_snapshots()
+                         if snapshot['worker_id'] != _SNAPSHOTS['worker_id']]
+        snapshots.append(build_snapshot(stage_histograms, cache_stats, queue_stats, storage_stats))
+        values, stage_histograms, cache_stats, queue_stats, storage_stats = _merge_snapshots(
+            snapshots, cache_stats, storage_stats
+        )
+    else:
+        with _VALUES_LOCK:
+            values = dict(_VALUES)
+
+    samples = {name: [] for name in METRIC_FAMILIES}
+    for (name, label_items), value in sorted(values.items()):
+        samples[name].append((dict(label_items), value))
+    # Unlabelled series are always reported, starting at zero
+    for name in ('docusense_requests_in_flight', 'docusense_pages_ocr_total'):
+        samples[name] = samples[name] or [({}, 0)]
+
+    # Values owned by other modules are read at scrape time
+    samples['docusense_result_cache_lookups_total'] = [
+        ({'outcome': 'hit'}, cache_stats['hits']),
+        ({'outcome': 'miss'}, cache_stats['misses'])
+    ]
+    samples['docusense_result_cache_hit_ratio'] = [({}, cache_stats['hit_ratio'])]
+    samples['docusense_result_cache_size_bytes'] = [({}, cache_stats['size_bytes'])]
+    samples['docusense_result_cache_evictions_total'] = [({}, cache_stats['evictions'])]
+    samples['docusense_job_queue_depth'] = [({}, queue_stats['queue_depth'])]
+    samples['docusense_jobs'] = [
+        ({'status': status}, queue_stats[status])
+        for status in ('queued', 'running', 'completed', 'failed')
+    ]
+    samples['docusense_upload_storage_bytes'] = [({}, storage_stats['size_bytes'])]
+    samples['docusense_upload_storage_files'] = [({}, storage_stats['files'])]
+    samples['docusense_upload_storage_removed_total'] = [
+        ({'reason': 'expired'}, storage_stats['expired']),
+        ({'reason': 'quota'}, storage_stats['evicted'])
+    ]
+
+    lines = []
+    for name, (metric_type, help_text) in METRIC_FAMILIES.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        if metric_type == 'histogram':
+            lines.extend(_render_histograms(name, stage_histograms))
+            continue
+        for labels, value in samples[name]:
+            lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def _snapshot_writer_loop(sources):
+    """
+    Write a snapshot of this process every snapshot interval
+
+    Args:
+        sources (callable): Callable registered with set_snapshot_sources()
+    """
+    while True:
+        time.sleep(config.METRICS_SNAPSHOT_INTERVAL)
+        try:
+            write_snapshot(build_snapshot(*sources()))
+            fold_exited_workers()
+        except OSError as e:
+            print(f"Metrics snapshot failed: {str(e)}")
+
+
+def fold_exited_workers():
+    """
+    Fold the counters of exited workers into the cumulative exited-workers file and
+    remove their snapshots
+    The IDs of folded workers are recorded, so a fold interrupted before the snapshots
+    are removed never counts them twice
+    """
+    if fcntl is None:
+        return
+    with _folder_lock(exclusive=True):
+        snapshots = _read_snapshots()
+        exited = _find_exited_workers(snapshots)
+        if not exited:
+            return
+
+        folded = next((snapshot for snapshot in snapshots if snapshot['pid'] is None), None)
+        if folded is None:
+            folded = {'pid': None, 'worker_id': 'exited', 'started_at': 0, 'values': [],
+                      'histograms': {}, 'cache': {'hits': 0, 'misses': 0, 'evictions': 0},
+                      'queue': {}, 'storage': {'expired': 0, 'evicted': 0}, 'folded': []}
+        # Only workers whose snapshots are still on disk can be seen again
+        on_disk = {snapshot['worker_id'] for snapshot in snapshots}
+        folded['folded'] = [worker_id for worker_id in folded['folded'] if worker_id in on_disk]
+
+        values = {(name, tuple(tuple(label_item) for label_item in label_items)): value
+                  for name, label_items, value in folded['values']}
+        for snapshot in snapshots:
+            if snapshot['worker_id'] in exited and snapshot['worker_id'] not in folded['folded']:
+                _fold_snapshot(folded, values, snapshot)
+        folded['values'] = [[name, label_items, value]
+                            for (name, label_items), value in values.items()]
+
+        exited_path = os.path.join(config.METRICS_MULTIPROCESS_DIR, EXITED_WORKERS_FILE)
+        with open(exited_path + '.tmp', 'w', encoding='utf-8') as exited_file:
+            json.dump(folded, exited_file)
+        os.replace(exited_path + '.tmp', exited_path)
+        for worker_id in exited:
+            try:
+                os.remove(os.path.join(config.METRICS_MULTIPROCESS_DIR, f'worker-{worker_id}.json'))
+            except OSError:
+                pass
+
+
+def _fold_snapshot(folded, values, snapshot):
+    """
+    Add the counters of one exited worker to the folded counters
+
+    Args:
+        folded (dict): Folded counters of exited workers, updated in place
+        values (dict): Folded counter values keyed by (name, label items), updated in place
+        snapshot (dict): Snapshot of the exited worker
+    """
+    for name, label_items, value in snapshot['values']:
+        if name not in LIVE_ONLY_METRICS:
+            key = (name, tuple(tuple(label_item) for label_item in label_items))
+            values[key] = values.get(key, 0) + value
+    for stage, histogram in snapshot['histograms'].items():
+        _add_histogram(folded['histograms'], stage, histogram)
+    for counter in ('hits', 'misses', 'evictions'):
+        folded['cache'][counter] += snapshot['cache'][counter]
+    for counter in ('expired', 'evicted'):
+        folded['storage'][counter] += snapshot['storage'][counter]
+    folded['folded'].append(snapshot['worker_id'])
+
+
+@contextmanager
+def _folder_lock(exclusive):
+    """
+    Hold the shared metrics folder lock while reading or folding snapshots
+    Does nothing where fcntl is unavailable
+
+    Args:
+        exclusive (bool): Take the lock exclusively (folding) instead of shared (reading)
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = os.path.join(config.METRICS_MULTIPROCESS_DIR, FOLDER_LOCK_FILE)
+    with open(lock_path, 'a', encoding='utf-8') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_snapshots():
+    """
+    Read the snapshots of every worker, and the folded counters of exited workers,
+    from the shared metrics folder
+
+    Returns:
+        list: Snapshot dicts; unreadable files are skipped
+    """
+    snapshots = []
+    try:
+        snapshot_names = os.listdir(config.METRICS_MULTIPROCESS_DIR)
+    except OSError:
+        return snapshots
+    for snapshot_name in sorted(snapshot_names):
+        is_worker_snapshot = snapshot_name.startswith('worker-') and snapshot_name.endswith('.json')
+        if not is_worker_snapshot and snapshot_name != EXITED_WORKERS_FILE:
+            continue
+        try:
+            with open(os.path.join(config.METRICS_MULTIPROCESS_DIR, snapshot_name),
+                      encoding='utf-8') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        except (OSError, ValueError):
+            continue
+        if is_worker_snapshot:
+            snapshot['worker_id'] = snapshot_name[len('worker-'):-len('.json')]
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def _find_exited_workers(snapshots):
+    """
+    Find the workers whose snapshots were left by processes that have exited
+
+    Args:
+        snapshots (list): Output of _read_snapshots()
+
+    Returns:
+        set: Worker IDs of exited workers
+    """
+    latest_by_pid = {}
+    for snapshot in snapshots:
+        if snapshot['pid'] is None:
+            continue
+        latest = latest_by_pid.get(snapshot['pid'])
+        if latest is None or (snapshot.get('started_at') or 0) > (latest.get('started_at') or 0):
+            latest_by_pid[snapshot['pid']] = snapshot
+    # Only the latest worker started with a PID can still own it
+    return {
+        snapshot['worker_id'] for snapshot in snapshots
+        if snapshot['pid'] is not None and (
+            latest_by_pid[snapshot['pid']] is not snapshot
+            or not is_process_alive(snapshot['pid'])
+        )
+    }
+
+
+# pylint: disable-next=too-many-locals
+def _merge_snapshots(snapshots, local_cache_stats, local_storage_stats):
+    """
+    Combine the snapshots of all workers into one set of render_metrics() inputs
+    Counters and histograms are summed over every worker, including the folded counters
+    of exited workers; gauges over live workers.
+    Disk usage of the shared cache and upload folders is taken from this process.
+
+    Args:
+        snapshots (list): Output of _read_snapshots()
+        local_cache_stats (dict): This process's result cache stats
+        local_storage_stats (dict): This process's upload storage stats
+
+    Returns:
+        tuple: (values, stage_histograms, cache_stats, queue_stats, storage_stats)
+    """
+    values = {}
+    histograms = {}
+    cache_stats = dict(local_cache_stats, hits=0, misses=0, evictions=0)
+    queue_stats = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0, 'queue_depth': 0}
+    storage_stats = dict(local_storage_stats, expired=0, evicted=0)
+
+    exited = _find_exited_workers(snapshots)
+    folded = {worker_id for snapshot in snapshots if snapshot['pid'] is None
+              for worker_id in snapshot['folded']}
+    for snapshot in snapshots:
+        if snapshot['worker_id'] in folded:
+            continue
+        alive = snapshot['pid'] is not None and snapshot['worker_id'] not in exited
+        for name, label_items, value in snapshot['values']:
+            if name in LIVE_ONLY_METRICS and not alive:
+                continue
+            key = (name, tuple(tuple(label_item) for label_item in label_items))
+            values[key] = values.get(key, 0) + value
+
+        for stage, histogram in snapshot['histograms'].items():
+            _add_histogram(histograms, stage, histogram)
+
+        for counter in ('hits', 'misses', 'evictions'):
+            cache_stats[counter] += snapshot['cache'][counter]
+        for counter in ('expired', 'evicted'):
+            storage_stats[counter] += snapshot['storage'][counter]
+        if alive:
+            for gauge in queue_stats:
+                queue_stats[gauge] += snapshot['queue'][gauge]
+
+    lookups = cache_stats['hits'] + cache_stats['misses']
+    cache_stats['hit_ratio'] = round(cache_stats['hits'] / lookups, 4) if lookups else 0.0
+    return values, dict(sorted(histograms.items())), cache_stats, queue_stats, storage_stats
+
+
+def _add_histogram(histograms, stage, histogram):
+    """
+    Add one worker's stage histogram to the merged histograms
+
+    Args:
+        histograms (dict): Merged histograms, updated in place
+        stage (str): Stage name
+        histogram (dict): Histogram in the timing.get_histograms() layout
+    """
+    merged = histograms.setdefault(stage, {
+        'buckets_ms': dict.fromkeys(histogram['buckets_ms'], 0), 'count': 0, 'sum_ms': 0.0
+    })
+    for bound, count in histogram['buckets_ms'].items():
+        merged['buckets_ms'][bound] = merged['buckets_ms'].get(bound, 0) + count
+    merged['count'] += histogram['count']
+    merged['sum_ms'] += histogram['sum_ms']
+
+
+def is_process_alive(pid):
+    """
+    Check whether a worker process is still running
+
+    Args:
+        pid (int): Process ID
+
+    Returns:
+        bool: True if the process exists
+    """
+    if pid == os.getpid():
+        return True
+    # Only Unix servers run several worker processes; on Windows os.kill(pid, 0) is no probe
+    if os.name == 'nt':
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _render_histograms(name, stage_histograms):
+    """
+    Render stage histograms as Prometheus histogram samples in seconds
+
+    Args:
+        name (str): Histogram metric name
+        stage_histograms (dict): Output of timing.get_histograms()
+
+    Returns:
+        list: Sample lines
+    """
+    lines = []
+    bounds = [f'{bound / 1000:g}' for bound in config.TIMING_HISTOGRAM_BUCKETS_MS] + ['+Inf']
+    for stage, histogram in stage_histograms.items():
+        for bound, count in zip(bounds, histogram['buckets_ms'].values()):
+            labels = _format_labels({'stage': stage, 'le': bound})
+            lines.append(f'{name}_bucket{labels} {count}')
+        stage_labels = _format_labels({'stage': stage})
+        lines.append(f"{name}_sum{stage_labels} {_format_value(histogram['sum_ms'] / 1000)}")
+        lines.append(f"{name}_count{stage_labels} {histogram['count']}")
+    return lines
+
+
+def _format_labels(labels):
+    """
+    Format a label set as {name="value",...}
+
+    Args:
+        labels (dict): Label names and values
+
+    Returns:
+        str: Formatted label set, empty when there are no labels
+    """
+    if not labels:
+        return ''
+    formatted = []
+    for label, value in labels.items():
+        # Backslashes, quotes and newlines must be escaped inside label values
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        formatted.append(f'{label}="{escaped}"')
+    return '{' + ','.join(formatted) + '}'
+
+
+def _format_value(value):
+    """
+    Format a sample value
+
+    Args:
+        value (float): Sample value
+
+    Returns:
+        str: Value in Prometheus number syntax
+    """
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,172 @@
+"""
+Docusense OCR Prototype - Persistent Tesseract Engines
+
+Optional in-process OCR backend built on tesserocr (Python bindings for the
+libtesseract C API). Engines are initialized once per (language, engine mode) and
+reused, so recognition no longer pays for a process spawn, a temporary image file
+and a traineddata load on every call. Results are returned in the same column
+layout as pytesseract.image_to_data(output_type=Output.DICT).
+"""
+
+import threading
+import config
+
+# tesserocr is optional: without it the subprocess backend is used
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# TSV columns produced by Tesseract, in order
+TSV_COLUMNS = ['level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+               'left', 'top', 'width', 'height', 'conf', 'text']
+
+# Idle engines keyed by (language, oem); an engine is used by one thread at a time
+_IDLE_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def is_persistent_backend_enabled():
+    """
+    Check whether OCR should run on persistent in-process engines
+
+    Returns:
+        bool: True if the tesserocr backend is selected and installed
+    """
+    return config.OCR_BACKEND == 'tesserocr' and TESSEROCR_AVAILABLE
+
+
+def get_backend_name():
+    """
+    Get the name of the OCR backend actually in use
+
+    Returns:
+        str: 'tesserocr' or 'subprocess'
+    """
+    return 'tesserocr' if is_persistent_backend_enabled() else 'subprocess'
+
+
+def _create_engine(language, oem):
+    """
+    Initialize a new Tesseract engine (loads the traineddata model)
+
+    Args:
+        language (str): Tesseract language code
+        oem (int): OCR engine mode
+
+    Returns:
+        tesserocr.PyTessBaseAPI: Initialized engine
+    """
+    engine_args = {'lang': language, 'oem': tesserocr.OEM(oem)}
+    if config.TESSDATA_PATH:
+        engine_args['path'] = config.TESSDATA_PATH
+    return tesserocr.PyTessBaseAPI(**engine_args)
+
+
+def _acquire_engine(language, oem):
+    """
+    Take an idle engine for (language, oem), creating one if none is idle
+
+    Args:
+        language (str): Tesseract language code
+        oem (int): OCR engine mode
+
+    Returns:
+        tesserocr.PyTessBaseAPI: Engine reserved for the caller
+    """
+    with _ENGINES_LOCK:
+        idle_engines = _IDLE_ENGINES.get((language, oem))
+        if idle_engines:
+            return idle_engines.pop()
+    return _create_engine(language, oem)
+
+
+def _release_engine(language, oem, engine):
+    """
+    Return an engine to the idle pool, or shut it down if the pool is full
+
+    Args:
+        language (str): Tesseract language code
+        oem (int): OCR engine mode
+        engine (tesserocr.PyTessBaseAPI): Engine to release
+    """
+    engine.Clear()
+    with _ENGINES_LOCK:
+        idle_engines = _IDLE_ENGINES.setdefault((language, oem), [])
+        if len(idle_engines) < config.OCR_ENGINE_POOL_SIZE:
+            idle_engines.append(engine)
+            return
+    engine.End()
+
+
+def preload_engines(languages, oem):
+    """
+    Initialize one idle engine per language ahead of the first request
+
+    Args:
+        languages (list): Tesseract language codes
+        oem (int): OCR engine mode
+    """
+    if not is_persistent_backend_enabled():
+        return
+    for language in languages:
+        _release_engine(language, oem, _acquire_engine(language, oem))
+
+
+def image_to_data(image, language, oem, psm):
+    """
+    Run OCR on a PIL image with a persistent engine
+
+    Args:
+        image (PIL.Image): Image to recognize
+        language (str): Tesseract language code
+        oem (int): OCR engine mode
+        psm (int): Page segmentation mode
+
+    Returns:
+        dict: Column name to list of values, like pytesseract's Output.DICT
+    """
+    # Hand Tesseract the raw pixel buffer instead of an encoded image file
+    if image.mode not in ('L', 'RGB'):
+        image = image.convert('RGB')
+    bytes_per_pixel = 1 if image.mode == 'L' else 3
+
+    engine = _acquire_engine(language, oem)
+    try:
+        engine.SetPageSegMode(tesserocr.PSM(psm))
+        engine.SetImageBytes(image.tobytes(), image.width, image.height,
+                             bytes_per_pixel, bytes_per_pixel * image.width)
+        image_dpi = image.info.get('dpi')
+        if image_dpi:
+            engine.SetSourceResolution(int(image_dpi[0]))
+        if not engine.Recognize():
+            raise RuntimeError('Tesseract recognition failed')
+        tsv_text = engine.GetTSVText(0)
+    finally:
+        _release_engine(language, oem, engine)
+
+    return parse_tsv(tsv_text)
+
+
+def parse_tsv(tsv_text):
+    """
+    Parse Tesseract TSV output (without header) into columns
+
+    Args:
+        tsv_text (str): TSV text returned by the engine
+
+    Returns:
+        dict: Column name to list of values; numeric columns are converted to numbers
+    """
+    columns = {column: [] for column in TSV_COLUMNS}
+    for line in tsv_text.splitlines():
+        fields = line.split('\t', len(TSV_COLUMNS) - 1)
+        if len(fields) < len(TSV_COLUMNS) - 1:
+            continue
+        fields += [''] * (len(TSV_COLUMNS) - len(fields))
+        for column, value in zip(TSV_COLUMNS[:-2], fields[:-2]):
+            columns[column].append(int(value))
+        columns['conf'].append(float(fields[-2]))
+        columns['text'].append(fields[-1])
+    return columns
@@ -0,0 +1,233 @@
+"""
+Docusense OCR Prototype - Persistent Result Cache
+
+Content-addressed on-disk cache for processing results. Entries are keyed by a
+digest of the uploaded file bytes plus the normalized processing settings, stored
+as JSON files, and evicted least-recently-used first once the cache exceeds its
+configured size limit. The folder size is tracked as a running total and only
+rescanned when it gets old or the cache is over its limit.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import config
+
+# Hashing chunk size for uploaded files (1MB)
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# Bump when the layout of cached entries changes
+CACHE_FORMAT_VERSION = 1
+
+# Hit/miss counters shared by all request threads
+_CACHE_STATS = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+_CACHE_LOCK = threading.Lock()
+
+# Running size of the cache folder, so stores and stats do not rescan it; other
+# worker processes also write to the folder, so it is rescanned once it gets old
+_CACHE_SIZE = {'folder': None, 'entries': 0, 'size_bytes': 0, 'scanned_at': 0.0}
+
+
+def compute_file_digest(file_path):
+    """
+    Compute the SHA-256 digest of a file's contents
+
+    Args:
+        file_path (str): Path to the file
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_cache_key(file_digest, file_extension, settings, fingerprint=None):
+    """
+    Build a cache key from the file digest and normalized processing settings
+
+    Args:
+        file_digest (str): Hex digest of the uploaded file
+        file_extension (str): File extension (determines the processing path)
+        settings (dict): Per-request settings that influence the result
+        fingerprint (dict): Code version and server configuration that influence the result
+
+    Returns:
+        str: Hex cache key
+    """
+    key_material = json.dumps(
+        {'version': CACHE_FORMAT_VERSION, 'digest': file_digest, 'extension': file_extension,
+         'settings': settings, 'fingerprint': fingerprint},
+        sort_keys=True
+    )
+    return hashlib.sha256(key_material.encode('utf-8')).hexdigest()
+
+
+def _entry_path(cache_key):
+    """
+    Get the on-disk path of a cache entry
+
+    Args:
+        cache_key (str): Cache key
+
+    Returns:
+        str: Path to the JSON entry file
+    """
+    return os.path.join(config.RESULT_CACHE_FOLDER, f"{cache_key}.json")
+
+
+def get_cached_result(cache_key, is_valid=None):
+    """
+    Look up a cached result and mark it as recently used
+
+    Args:
+        cache_key (str): Cache key
+        is_valid (callable): Optional check that rejects stale entries
+
+    Returns:
+        dict: Cached entry, or None on a miss
+    """
+    entry_path = _entry_path(cache_key)
+    entry = None
+    try:
+        with open(entry_path, 'r', encoding='utf-8') as entry_file:
+            entry = json.load(entry_file)
+        if is_valid is not None and not is_valid(entry):
+            entry = None
+        else:
+            # Refresh modification time so LRU eviction keeps this entry
+            os.utime(entry_path)
+    except (OSError, ValueError):
+        entry = None
+
+    with _CACHE_LOCK:
+        _CACHE_STATS['hits' if entry is not None else 'misses'] += 1
+    return entry
+
+
+def store_result(cache_key, entry):
+    """
+    Store a result in the cache and evict old entries if over the size limit
+
+    Args:
+        cache_key (str): Cache key
+        entry (dict): JSON-serializable entry to store
+    """
+    os.makedirs(config.RESULT_CACHE_FOLDER, exist_ok=True)
+    entry_path = _entry_path(cache_key)
+    # Worker processes share the folder, so the process ID keeps temporary names unique
+    temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    # Write to a temporary file first so readers never see a partial entry
+    with open(temp_path, 'w', encoding='utf-8') as entry_file:
+        json.dump(entry, entry_file)
+        entry_size = entry_file.tell()
+
+    with _CACHE_LOCK:
+        _refresh_size_totals()
+        try:
+            replaced_size = os.stat(entry_path).st_size
+        except OSError:
+            replaced_size = None
+        os.replace(temp_path, entry_path)
+
+        if replaced_size is None:
+            _CACHE_SIZE['entries'] += 1
+            _CACHE_SIZE['size_bytes'] += entry_size
+        else:
+            _CACHE_SIZE['size_bytes'] += entry_size - replaced_size
+        _CACHE_STATS['stores'] += 1
+        if _CACHE_SIZE['size_bytes'] > config.RESULT_CACHE_MAX_BYTES:
+            _evict_to_size_limit()
+
+
+def _list_entries():
+    """
+    List cache entries with their size and last-use time
+
+    Returns:
+        list: (mtime, size, path) tuples for every entry
+    """
+    entries = []
+    try:
+        with os.scandir(config.RESULT_CACHE_FOLDER) as scanner:
+            for dir_entry in scanner:
+                if not dir_entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _refresh_size_totals(force=False):
+    """
+    Rescan the cache folder when the running size totals are missing or old
+    Caller must hold _CACHE_LOCK
+
+    Args:
+        force (bool): Rescan regardless of the age of the totals
+
+    Returns:
+        list: (mtime, size, path) tuples if the folder was scanned, otherwise None
+    """
+    age = time.monotonic() - _CACHE_SIZE['scanned_at']
+    if (not force and _CACHE_SIZE['folder'] == config.RESULT_CACHE_FOLDER
+            and age < config.RESULT_CACHE_RESCAN_INTERVAL):
+        return None
+
+    entries = _list_entries()
+    _CACHE_SIZE.update(folder=config.RESULT_CACHE_FOLDER, entries=len(entries),
+                       size_bytes=sum(size for _, size, _ in entries),
+                       scanned_at=time.monotonic())
+    return entries
+
+
+def _evict_to_size_limit():
+    """
+    Remove least-recently-used entries until the cache fits its size limit
+    Only runs a full scan once the running total is over the limit
+    Caller must hold _CACHE_LOCK
+    """
+    entries = _refresh_size_totals(force=True)
+    if _CACHE_SIZE['size_bytes'] <= config.RESULT_CACHE_MAX_BYTES:
+        return
+
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        _CACHE_SIZE['entries'] -= 1
+        _CACHE_SIZE['size_bytes'] -= size
+        _CACHE_STATS['evictions'] += 1
+        if _CACHE_SIZE['size_bytes'] <= config.RESULT_CACHE_MAX_BYTES:
+            break
+
+
+def get_cache_stats():
+    """
+    Get cache counters and current disk usage
+
+    Returns:
+        dict: Hit/miss counters, hit ratio, entry count and size
+    """
+    with _CACHE_LOCK:
+        _refresh_size_totals()
+        stats = dict(_CACHE_STATS)
+        stats['entries'] = _CACHE_SIZE['entries']
+        stats['size_bytes'] = _CACHE_SIZE['size_bytes']
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+    stats['max_size_bytes'] = config.RESULT_CACHE_MAX_BYTES
+    stats['enabled'] = config.RESULT_CACHE_ENABLED
+    return stats
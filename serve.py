@@ -0,0 +1,154 @@
+"""
+Docusense OCR Prototype - Production Server
+
+Runs the Flask app under gunicorn with preforked worker processes and a pool of
+request threads in each. The app is imported and Tesseract metadata and persistent
+OCR engines are loaded once in the master process before forking, so every worker
+starts warm and CPU-bound OCR scales across cores through the worker processes.
+
+Workers write their metrics to a shared folder so /metrics reports the totals of
+all workers whichever worker answers the scrape. With the gunicorn CLI this needs
+--preload (or METRICS_MULTIPROCESS_DIR set in config.py), so the folder is created
+once in the master.
+
+gunicorn only runs on Unix-like systems. Where it is not installed, the app is
+served by Werkzeug's threaded server with debug mode off instead.
+
+Usage:
+    python serve.py [--bind 0.0.0.0:8000] [--workers 4] [--threads 4] [--timeout 300]
+
+    or with the gunicorn CLI:
+    gunicorn --preload --workers 4 --threads 4 'serve:create_app()'
+"""
+
+import argparse
+import atexit
+import os
+import shutil
+import tempfile
+import config
+import app
+
+# gunicorn is optional: without it the Werkzeug server is used
+try:
+    from gunicorn.app.base import BaseApplication
+    GUNICORN_AVAILABLE = True
+except ImportError:
+    GUNICORN_AVAILABLE = False
+
+
+def create_app():
+    """
+    gunicorn-compatible app factory
+    Switches off debug mode, sizes the per-worker OCR pool and warms the OCR state
+
+    Returns:
+        Flask: The configured WSGI application
+    """
+    config.DEBUG = False
+    app.app.debug = False
+    # Worker processes already spread requests over the cores; a full OCR pool in
+    # every worker would oversubscribe them
+    config.OCR_WORKER_PROCESSES = config.SERVE_OCR_PROCESSES_PER_WORKER
+    if GUNICORN_AVAILABLE and not config.METRICS_MULTIPROCESS_DIR:
+        config.METRICS_MULTIPROCESS_DIR = tempfile.mkdtemp(prefix='docusense-metrics-')
+        atexit.register(remove_metrics_folder, config.METRICS_MULTIPROCESS_DIR, os.getpid())
+    # Discover Tesseract before forking so no worker repeats the probe
+    application = app.create_app(discover_in_background=False)
+    app.warm_up_ocr_state()
+    return application
+
+
+def remove_metrics_folder(folder, owner_pid):
+    """
+    Delete the shared metrics folder when the process that created it exits
+    Workers inherit the exit handler when forked, so they must leave the folder alone
+
+    Args:
+        folder (str): Metrics folder
+        owner_pid (int): Process ID of the master that created it
+    """
+    if os.getpid() == owner_pid:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def get_worker_count(requested_workers):
+    """
+    Resolve the number of worker processes to fork
+
+    Args:
+        requested_workers (int): Requested worker count (0 = one per CPU core)
+
+    Returns:
+        int: Number of worker processes (at least 1)
+    """
+    if requested_workers > 0:
+        return requested_workers
+    return os.cpu_count() or 1
+
+
+def run_gunicorn(options):
+    """
+    Run the app under an embedded gunicorn master
+
+    Args:
+        options (dict): gunicorn settings (bind, workers, threads, ...)
+    """
+    class DocusenseServer(BaseApplication):  # pylint: disable=abstract-method
+        """
+        Embedded gunicorn application that hands the app factory to the master
+        """
+
+        def load_config(self):
+            """
+            Apply the launcher's options to gunicorn's settings
+            """
+            for name, value in options.items():
+                self.cfg.set(name, value)
+
+        def load(self):
+            """
+            Build the WSGI app (in the master, before forking, with preload_app)
+
+            Returns:
+                Flask: The configured WSGI application
+            """
+            return create_app()
+
+    DocusenseServer().run()
+
+
+def main():
+    """
+    Parse command line options and run the production server
+    """
+    parser = argparse.ArgumentParser(description='Run the Docusense OCR production server')
+    parser.add_argument('--bind', default=f'{config.HOST}:{config.PORT}',
+                        help='host:port to listen on')
+    parser.add_argument('--workers', type=int, default=config.SERVE_WORKERS,
+                        help='worker processes (0 = one per CPU core)')
+    parser.add_argument('--threads', type=int, default=config.SERVE_THREADS,
+                        help='request threads per worker process')
+    parser.add_argument('--timeout', type=int, default=config.SERVE_TIMEOUT,
+                        help='seconds before a silent worker is restarted')
+    args = parser.parse_args()
+
+    if not GUNICORN_AVAILABLE:
+        print("⚠️ gunicorn is not installed; serving with Werkzeug's threaded server instead")
+        host, port = args.bind.rsplit(':', 1)
+        create_app().run(host=host, port=int(port), debug=False, threaded=True)
+        return
+
+    run_gunicorn({
+        'bind': args.bind,
+        'workers': get_worker_count(args.workers),
+        'threads': max(1, args.threads),
+        'worker_class': 'gthread',
+        'timeout': args.timeout,
+        # Import and warm the app in the master so workers are forked warm
+        'preload_app': True
+    })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Docusense OCR Prototype - Upload Storage Lifecycle
+
+Manages the upload folder that holds uploaded files and PDF page previews. Files
+are spread over shard subdirectories named after the leading characters of their
+(random) filename, so no single directory grows without bound. A background
+sweeper deletes files older than the retention period and then evicts the oldest
+files until the folder fits its size quota. Filenames handed to clients stay flat
+(no shard prefix); the shard is derived from the name whenever a path is needed.
+"""
+
+import os
+import threading
+import time
+import config
+
+# Files in the upload root that are never swept
+PROTECTED_FILENAMES = {'.gitkeep'}
+
+# Sweeper counters and the figures of the most recent sweep
+_STORAGE_STATS = {
+    'files': 0, 'size_bytes': 0, 'expired': 0, 'evicted': 0, 'freed_bytes': 0,
+    'sweeps': 0, 'last_sweep_at': None
+}
+_STORAGE_LOCK = threading.Lock()
+
+# Sweeper thread is started on first use; the event wakes it early when over quota
+_SWEEPER = {'thread': None}
+_SWEEPER_WAKE = threading.Event()
+
+
+def get_shard_name(filename):
+    """
+    Get the shard subdirectory a stored filename belongs to
+
+    Args:
+        filename (str): Flat stored filename (e.g. '1a2b3c4d_scan.png')
+
+    Returns:
+        str: Shard directory name, or None when sharding is disabled or the name
+             has no usable prefix
+    """
+    shard = filename[:config.UPLOAD_SHARD_CHARS].lower()
+    if not shard or len(shard) < config.UPLOAD_SHARD_CHARS:
+        return None
+    if not (shard.isascii() and shard.isalnum()):
+        return None
+    return shard
+
+
+def get_storage_path(filename, create=False):
+    """
+    Get the path a stored file is written to
+
+    Args:
+        filename (str): Flat stored filename
+        create (bool): Create the shard directory if it does not exist yet
+
+    Returns:
+        str: Path inside the upload folder
+    """
+    shard = get_shard_name(filename)
+    folder = os.path.join(config.UPLOAD_FOLDER, shard) if shard else config.UPLOAD_FOLDER
+    if create:
+        os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, filename)
+
+
+def resolve_stored_file(filename):
+    """
+    Find an existing stored file by its flat filename
+    Files written before sharding was enabled are found in the upload root
+
+    Args:
+        filename (str): Flat stored filename (must not contain path separators)
+
+    Returns:
+        str: Path to the file, or None if it does not exist
+    """
+    if not filename or os.sep in filename or '/' in filename or filename.startswith('.'):
+        return None
+    for candidate in (get_storage_path(filename), os.path.join(config.UPLOAD_FOLDER, filename)):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def note_stored_file(file_path):
+    """
+    Account for a newly written file and start the sweeper if needed
+    Wakes the sweeper early when the folder has grown past its quota
+
+    Args:
+        file_path (str): Path of the file just written
+    """
+    ensure_sweeper_started()
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        return
+    with _STORAGE_LOCK:
+        _STORAGE_STATS['files'] += 1
+        _STORAGE_STATS['size_bytes'] += size
+        over_quota = 0 < config.UPLOAD_MAX_TOTAL_BYTES < _STORAGE_STATS['size_bytes']
+    if over_quota:
+        _SWEEPER_WAKE.set()
+
+
+def sweep_uploads(now=None):
+    """
+    Delete expired files, then evict the oldest files until the quota is met
+    Files younger than the eviction grace period are kept even when over quota,
+    so uploads and previews of in-flight requests are never removed
+
+    Args:
+        now (float): Current time (defaults to time.time())
+
+    Returns:
+        dict: Files expired and evicted and bytes freed by this sweep
+    """
+    now = time.time() if now is None else now
+    files = _list_stored_files()
+    expired = evicted = freed_bytes = 0
+
+    if config.UPLOAD_RETENTION_SECONDS > 0:
+        cutoff = now - config.UPLOAD_RETENTION_SECONDS
+        kept = []
+        for mtime, size, path in files:
+            if mtime < cutoff and _remove_file(path):
+                expired += 1
+                freed_bytes += size
+            else:
+                kept.append((mtime, size, path))
+        files = kept
+
+    total_size = sum(size for _, size, _ in files)
+    if 0 < config.UPLOAD_MAX_TOTAL_BYTES < total_size:
+        grace_cutoff = now - config.UPLOAD_EVICTION_GRACE_SECONDS
+        for mtime, size, path in sorted(files):
+            if total_size <= config.UPLOAD_MAX_TOTAL_BYTES or mtime >= grace_cutoff:
+                break
+            if _remove_file(path):
+                evicted += 1
+                freed_bytes += size
+                total_size -= size
+
+    with _STORAGE_LOCK:
+        _STORAGE_STATS.update(
+            files=len(files) - evicted, size_bytes=total_size, last_sweep_at=now
+        )
+        _STORAGE_STATS['expired'] += expired
+        _STORAGE_STATS['evicted'] += evicted
+        _STORAGE_STATS['freed_bytes'] += freed_bytes
+        _STORAGE_STATS['sweeps'] += 1
+    return {'expired': expired, 'evicted': evicted, 'freed_bytes': freed_bytes}
+
+
+def get_storage_stats():
+    """
+    Get upload folder usage as of the last sweep plus files stored since
+
+    Returns:
+        dict: File count, size, sweeper counters and the configured limits
+    """
+    with _STORAGE_LOCK:
+        stats = dict(_STORAGE_STATS)
+    stats['max_size_bytes'] = config.UPLOAD_MAX_TOTAL_BYTES
+    stats['retention_seconds'] = config.UPLOAD_RETENTION_SECONDS
+    stats['sweeper_running'] = _SWEEPER['thread'] is not None
+    return stats
+
+
+def ensure_sweeper_started():
+    """
+    Start the background sweeper thread if a retention period or quota is configured
+    """
+    if config.UPLOAD_RETENTION_SECONDS <= 0 and config.UPLOAD_MAX_TOTAL_BYTES <= 0:
+        return
+    with _STORAGE_LOCK:
+        if _SWEEPER['thread'] is not None:
+            return
+        _SWEEPER['thread'] = threading.Thread(
+            target=_sweeper_loop, name='docusense-upload-sweeper', daemon=True
+        )
+        _SWEEPER['thread'].start()
+
+
+def _sweeper_loop():
+    """
+    Sweep the upload folder forever, every sweep interval or when woken early
+    """
+    while True:
+        # Any exception fails only this sweep; letting it escape would end the thread
+        # while _SWEEPER still holds it, so retention and quota would never run again
+        try:
+            sweep_uploads()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"Upload sweep failed: {str(e) or type(e).__name__}")
+        _SWEEPER_WAKE.wait(config.UPLOAD_SWEEP_INTERVAL)
+        _SWEEPER_WAKE.clear()
+
+
+def _list_stored_files():
+    """
+    List stored files in the upload root and its shard directories
+
+    Returns:
+        list: (mtime, size, path) tuples for every stored file
+    """
+    files = []
+    try:
+        with os.scandir(config.UPLOAD_FOLDER) as scanner:
+            root_entries = list(scanner)
+    except FileNotFoundError:
+        return files
+
+    for dir_entry in root_entries:
+        if dir_entry.is_dir(follow_symlinks=False):
+            try:
+                with os.scandir(dir_entry.path) as shard_scanner:
+                    files.extend(_stat_entries(shard_scanner))
+            except OSError:
+                continue
+        else:
+            files.extend(_stat_entries([dir_entry]))
+    return files
+
+
+def _stat_entries(dir_entries):
+    """
+    Collect size and modification time of regular files
+
+    Args:
+        dir_entries (iterable): os.DirEntry objects
+
+    Returns:
+        list: (mtime, size, path) tuples, skipping protected and vanished files
+    """
+    stats = []
+    for dir_entry in dir_entries:
+        if dir_entry.name in PROTECTED_FILENAMES or not dir_entry.is_file(follow_symlinks=False):
+            continue
+        try:
+            stat = dir_entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        stats.append((stat.st_mtime, stat.st_size, dir_entry.path))
+    return stats
+
+
+def _remove_file(path):
+    """
+    Delete a stored file, tolerating files removed concurrently
+
+    Args:
+        path (str): File path
+
+    Returns:
+        bool: True if the file was deleted by this call
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    return True
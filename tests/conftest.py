@@ -0,0 +1,67 @@
+"""
+Shared fixtures for the Docusense OCR test suite
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app  # pylint: disable=wrong-import-position
+import config  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture
+def upload_folder(tmp_path, monkeypatch):
+    """
+    Point uploads, cached results and job records at a temporary folder
+    """
+    folder = tmp_path / 'uploads'
+    folder.mkdir()
+    monkeypatch.setattr(config, 'UPLOAD_FOLDER', str(folder))
+    monkeypatch.setattr(config, 'RESULT_CACHE_FOLDER', str(tmp_path / 'cache'))
+    monkeypatch.setattr(config, 'JOB_STORE_FOLDER', str(tmp_path / 'jobs'))
+    return folder
+
+
+@pytest.fixture
+def client(upload_folder):  # pylint: disable=redefined-outer-name,unused-argument
+    """
+    Flask test client with uploads written to a temporary folder
+    """
+    app.app.config['TESTING'] = True
+    return app.app.test_client()
+
+
+@pytest.fixture
+def make_pdf():
+    """
+    Builder of minimal US Letter PDFs with one Helvetica text line per page
+
+    The builder takes the text of each page, or None for a page without a text layer,
+    and returns the PDF file as bytes
+    """
+    def build(page_texts):
+        # Object 1 is the catalog, 2 the page tree, 3 the font, then each page is
+        # followed by its content stream
+        kids = ' '.join(f'{number} 0 R' for number in range(4, 4 + 2 * len(page_texts), 2))
+        bodies = ['<< /Type /Catalog /Pages 2 0 R >>',
+                  f'<< /Type /Pages /Kids [{kids}] /Count {len(page_texts)} >>',
+                  '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+        for page_text in page_texts:
+            content = f'BT /F1 24 Tf 72 700 Td ({page_text}) Tj ET' if page_text else ''
+            bodies += [f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(bodies) + 2} 0 R >>',
+                       f'<< /Length {len(content)} >>\nstream\n{content}\nendstream']
+
+        pdf = b'%PDF-1.4\n'
+        xref = f'xref\n0 {len(bodies) + 1}\n0000000000 65535 f \n'
+        for number, body in enumerate(bodies, 1):
+            xref += f'{len(pdf):010d} 00000 n \n'
+            pdf += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+        trailer = (f'trailer\n<< /Size {len(bodies) + 1} /Root 1 0 R >>\n'
+                   f'startxref\n{len(pdf)}\n%%EOF\n')
+        return pdf + (xref + trailer).encode('ascii')
+
+    return build
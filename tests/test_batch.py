@@ -0,0 +1,128 @@
+"""
+Tests for the batch OCR endpoint
+"""
+
+import io
+import json
+import zipfile
+
+import app
+import config
+
+
+def post_batch(client, files):
+    """
+    Upload files to POST /api/v1/ocr/batch
+
+    Args:
+        client (FlaskClient): Test client
+        files (list): (filename, content) pairs
+
+    Returns:
+        Response: Test client response
+    """
+    return client.post('/api/v1/ocr/batch', content_type='multipart/form-data', data={
+        'files': [(io.BytesIO(content), filename) for filename, content in files],
+        'use_cache': 'false'
+    })
+
+
+def stored_files(folder):
+    """
+    List the files left in the upload folder
+
+    Args:
+        folder (pathlib.Path): Upload folder
+
+    Returns:
+        list: Paths of stored files, including those in shard directories
+    """
+    return [path for path in folder.rglob('*') if path.is_file()]
+
+
+def test_failing_file_is_reported_inline(client):
+    """
+    A corrupt workbook gets an error line and the remaining files are still processed
+    """
+    response = post_batch(client, [('notes.txt', b'first file'),
+                                   ('broken.xlsx', b'not a zip archive'),
+                                   ('table.csv', b'a,b\n1,2\n')])
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    summary = lines.pop()['summary']
+    assert summary == {'total': 3, 'succeeded': 2, 'failed': 1}
+    by_name = {line['original_filename']: line for line in lines}
+    assert by_name['notes.txt']['status'] == 'success'
+    assert by_name['table.csv']['status'] == 'success'
+    assert by_name['broken.xlsx']['status'] == 'error'
+    assert by_name['broken.xlsx']['error'] == 'Processing failed'
+
+
+def test_too_many_files_saves_nothing(client, upload_folder, monkeypatch):
+    """
+    A batch over the file limit is rejected before any upload is written
+    """
+    monkeypatch.setattr(config, 'BATCH_MAX_FILES', 2)
+    response = post_batch(client, [(f'note{index}.txt', b'text') for index in range(3)])
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Too many files'
+    assert not stored_files(upload_folder)
+
+
+def test_too_many_archive_members_leaves_no_files(client, upload_folder, monkeypatch):
+    """
+    Files saved before archives push the batch over the limit are deleted again
+    """
+    monkeypatch.setattr(config, 'BATCH_MAX_FILES', 3)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zip_file:
+        for index in range(2):
+            zip_file.writestr(f'member{index}.txt', 'text')
+    response = post_batch(client, [('note.txt', b'text'), ('first.zip', archive.getvalue()),
+                                   ('second.zip', archive.getvalue())])
+    assert response.status_code == 400
+    assert not stored_files(upload_folder)
+
+
+def test_non_ascii_names_keep_their_extension(client, upload_folder):
+    """
+    Files and zip members named only with non-ASCII characters are processed, not a 500
+    """
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zip_file:
+        zip_file.writestr('данные.csv', 'a,b\n1,2\n')
+    response = post_batch(client, [('файл.txt', 'привет'.encode('utf-8')),
+                                   ('archive.zip', archive.getvalue())])
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert lines.pop()['summary'] == {'total': 2, 'succeeded': 2, 'failed': 0}
+    by_name = {line['original_filename']: line for line in lines}
+    assert by_name['файл.txt']['result']['filename'].endswith('_upload.txt')
+    assert by_name['данные.csv']['result']['filename'].endswith('_upload.csv')
+    assert sorted(path.suffix for path in stored_files(upload_folder)) == ['.csv', '.txt']
+
+
+def test_upload_path_errors_are_reported_inline(client, upload_folder, monkeypatch):
+    """
+    A name rejected while building its upload path fails only its own line
+    """
+    def reject_second(original_filename, build_path=app.build_upload_path):
+        if original_filename.startswith('second'):
+            raise ValueError(f'File type of {original_filename} is not supported')
+        return build_path(original_filename)
+
+    monkeypatch.setattr(app, 'build_upload_path', reject_second)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zip_file:
+        zip_file.writestr('second member.txt', 'text')
+    response = post_batch(client, [('first.txt', b'text'), ('second.txt', b'text'),
+                                   ('archive.zip', archive.getvalue())])
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert lines.pop()['summary'] == {'total': 3, 'succeeded': 1, 'failed': 2}
+    by_name = {line['original_filename']: line for line in lines}
+    assert by_name['second.txt']['status'] == 'error'
+    assert by_name['second member.txt']['status'] == 'error'
+    assert len(stored_files(upload_folder)) == 1
@@ -0,0 +1,81 @@
+"""
+Tests for the synthetic corpus and the document benchmark
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks import synthetic_corpus
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A corpus small enough to generate in a test
+SMALL_CORPUS_OPTIONS = {'image_dpis': [72], 'pdf_pages': 2, 'scan_dpi': 72, 'csv_rows': 30,
+                        'xlsx_sheets': 2, 'xlsx_rows': 10, 'docx_paragraphs': 5}
+
+
+def read_corpus(documents):
+    """
+    Read the generated files of a corpus
+
+    Args:
+        documents (list): Document descriptions returned by write_corpus
+
+    Returns:
+        dict: Document name to file content
+    """
+    contents = {}
+    for document in documents:
+        with open(document['path'], 'rb') as document_file:
+            contents[document['name']] = document_file.read()
+    return contents
+
+
+def test_corpus_is_reproducible_from_its_seed(tmp_path):
+    """
+    The same seed produces byte-identical files; another seed changes every document
+    """
+    first = synthetic_corpus.write_corpus(str(tmp_path / 'first'), 7, SMALL_CORPUS_OPTIONS)
+    second = synthetic_corpus.write_corpus(str(tmp_path / 'second'), 7, SMALL_CORPUS_OPTIONS)
+    other = synthetic_corpus.write_corpus(str(tmp_path / 'other'), 8, SMALL_CORPUS_OPTIONS)
+
+    assert sorted(document['file_type'] for document in first) == sorted(
+        ['png', 'jpeg', 'pdf_text', 'pdf_scanned', 'csv', 'xlsx', 'docx'])
+    assert read_corpus(first) == read_corpus(second)
+    first_contents, other_contents = read_corpus(first), read_corpus(other)
+    assert all(content != other_contents[name] for name, content in first_contents.items())
+
+
+def test_corpus_can_be_limited_to_some_file_types(tmp_path):
+    """
+    Only the requested file types are generated, with their page counts
+    """
+    documents = synthetic_corpus.write_corpus(str(tmp_path), 7, SMALL_CORPUS_OPTIONS,
+                                              {'xlsx', 'pdf_text'})
+    assert [(document['name'], document['pages']) for document in documents] == [
+        ('text_layer.pdf', 2), ('regions.xlsx', 2)]
+    assert sorted(os.listdir(tmp_path)) == ['regions.xlsx', 'text_layer.pdf']
+
+
+def test_benchmark_reports_latency_per_case(tmp_path):
+    """
+    The benchmark runs each case in a fresh process and writes a JSON report
+    """
+    report_path = tmp_path / 'report.json'
+    subprocess.run([
+        sys.executable, os.path.join(REPO_ROOT, 'benchmarks', 'document_benchmark.py'),
+        '--runs', '2', '--warmup', '0', '--file-types', 'csv,png', '--image-dpis', '72',
+        '--dpi-settings', 'low', '--csv-rows', '30', '--output', str(report_path)
+    ], check=True, capture_output=True, timeout=300)
+
+    report = json.loads(report_path.read_text(encoding='utf-8'))
+    cases = {(result['file_type'], result['driver'], result['dpi_setting'])
+             for result in report['results']}
+    assert cases == {('png', 'direct', 'low'), ('png', 'http', 'low'),
+                     ('csv', 'direct', None), ('csv', 'http', None)}
+    for result in report['results']:
+        assert 'error' not in result
+        assert 0 < result['p50_ms'] <= result['p95_ms'] <= result['p99_ms']
+        assert result['pages_per_second'] > 0
@@ -0,0 +1,85 @@
+"""
+Tests for the CSV rows cursor API
+"""
+
+import csv
+import io
+
+import storage
+
+STORED_FILENAME = 'ab12cd34_orders.csv'
+
+
+def store_csv(content):
+    """
+    Place a CSV file in the upload folder as if it had been uploaded
+
+    Args:
+        content (bytes): CSV file content
+    """
+    with open(storage.get_storage_path(STORED_FILENAME, create=True), 'wb') as csv_file:
+        csv_file.write(content)
+
+
+def fetch_all_pages(client, limit):
+    """
+    Follow next_cursor from the first page to the last
+
+    Args:
+        client (FlaskClient): Test client
+        limit (int): Rows per page
+
+    Returns:
+        tuple: (columns, rows of every page, number of pages)
+    """
+    rows, pages, cursor = [], 0, 0
+    while cursor is not None:
+        response = client.get(f'/api/v1/csv/{STORED_FILENAME}/rows?cursor={cursor}&limit={limit}')
+        assert response.status_code == 200, response.get_json()
+        page = response.get_json()
+        rows.extend(page['rows'])
+        pages += 1
+        cursor = page['next_cursor']
+    return page['columns'], rows, pages
+
+
+def test_pages_cover_every_row_once(client):
+    """
+    Pages split on record boundaries, including quoted fields with line breaks
+    """
+    expected = [[f'{index}', f'name {index}', 'line one\nline two' if index % 3 == 0 else 'x']
+                for index in range(25)]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    writer.writerow(['id', 'name', 'note'])
+    for index, row in enumerate(expected):
+        writer.writerow(row)
+        if index == 10:
+            buffer.write('\r\n')  # Blank lines are skipped
+    store_csv(buffer.getvalue().encode('utf-8'))
+
+    columns, rows, pages = fetch_all_pages(client, limit=4)
+    assert columns == ['id', 'name', 'note']
+    assert rows == expected
+    assert pages == 7
+
+
+def test_exact_multiple_of_the_page_size_has_no_empty_last_page(client):
+    """
+    The last full page reports no next cursor
+    """
+    store_csv(b'a,b\n' + b''.join(f'{index},{index}\n'.encode() for index in range(6)))
+    _, rows, pages = fetch_all_pages(client, limit=3)
+    assert len(rows) == 6
+    assert pages == 2
+
+
+def test_cursor_inside_a_row_is_rejected(client):
+    """
+    Only 0 and offsets returned as next_cursor are accepted
+    """
+    store_csv(b'a,b\n1,2\n3,4\n')
+    for cursor in (2, 6, 1000):
+        response = client.get(f'/api/v1/csv/{STORED_FILENAME}/rows?cursor={cursor}')
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid cursor'
@@ -0,0 +1,138 @@
+"""
+Tests for ephemeral (zero-disk) processing
+"""
+
+import io
+import json
+import zipfile
+
+import openpyxl
+import pytest
+from werkzeug import formparser
+
+import config
+
+DOCUMENTS = {
+    'notes.txt': b'ephemeral text',
+    'файл.txt': 'текст'.encode('utf-8'),
+    'table.csv': b'a,b\n1,2\n'
+}
+
+
+def make_workbook():
+    """
+    Build a one-sheet workbook
+
+    Returns:
+        bytes: .xlsx file
+    """
+    workbook = openpyxl.Workbook()
+    workbook.active.append(['a', 'b'])
+    workbook.active.append([1, 2])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def written_files(tmp_path):
+    """
+    List files written below the temporary upload and cache folders
+
+    Args:
+        tmp_path (pathlib.Path): Test folder
+
+    Returns:
+        list: Paths of all files
+    """
+    return [path for path in tmp_path.rglob('*') if path.is_file()]
+
+
+@pytest.mark.parametrize('filename, content',
+                         [*DOCUMENTS.items(), ('book.xlsx', make_workbook())])
+def test_ephemeral_request_writes_nothing(client, tmp_path, filename, content):
+    """
+    An upload processed with ephemeral=true leaves no upload, preview or cache entry
+    """
+    response = client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(content), filename), 'ephemeral': 'true'
+    })
+    assert response.status_code == 200, response.get_json()
+    result = response.get_json()
+    assert result['ephemeral'] is True
+    assert result['filename'] is None
+    assert not result['cached']
+    assert not written_files(tmp_path)
+
+
+def test_ephemeral_uploads_setting_applies_to_every_request(client, tmp_path, monkeypatch):
+    """
+    EPHEMERAL_UPLOADS processes requests in memory without the form flag, and large
+    file parts are not spooled to a temporary file either
+    """
+    def refuse_spooling(*_args, **_kwargs):
+        raise AssertionError('upload spooled to a temporary file')
+
+    monkeypatch.setattr(config, 'EPHEMERAL_UPLOADS', True)
+    monkeypatch.setattr(formparser, 'SpooledTemporaryFile', refuse_spooling)
+    response = client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(b'x' * (1024 * 1024)), 'large.txt')
+    })
+    assert response.status_code == 200
+    assert response.get_json()['ephemeral'] is True
+    assert not written_files(tmp_path)
+
+
+def make_archive(members):
+    """
+    Build a zip archive
+
+    Args:
+        members (dict): Member name to content
+
+    Returns:
+        bytes: .zip file
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('server_wide', [True, False])
+def test_ephemeral_batch_processes_files_and_archive_members_in_memory(
+        client, tmp_path, monkeypatch, server_wide):
+    """
+    Batch files and zip members are processed from memory, by setting or by form flag
+    """
+    monkeypatch.setattr(config, 'EPHEMERAL_UPLOADS', server_wide)
+    response = client.post('/api/v1/ocr/batch', content_type='multipart/form-data', data={
+        'files': [(io.BytesIO(b'batch text'), 'b.txt'),
+                  (io.BytesIO(make_archive({'docs/a.csv': b'x,y\n1,2\n', 'docs/b.txt': b'b'})),
+                   'docs.zip')],
+        **({} if server_wide else {'ephemeral': 'true'})
+    })
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines.pop()['summary'] == {'total': 3, 'succeeded': 3, 'failed': 0}
+    for line in lines:
+        assert line['status'] == 'success', line
+        assert line['result']['ephemeral'] is True
+        assert line['result']['filename'] is None
+        assert not line['result']['cached']
+    assert not written_files(tmp_path)
+
+
+@pytest.mark.parametrize('server_wide', [True, False])
+def test_jobs_are_refused_in_ephemeral_mode(client, tmp_path, monkeypatch, server_wide):
+    """
+    Queued jobs would store the upload and result, so ephemeral job requests are refused
+    """
+    monkeypatch.setattr(config, 'EPHEMERAL_UPLOADS', server_wide)
+    response = client.post('/api/v1/jobs', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(b'job text'), 'c.txt'),
+        **({} if server_wide else {'ephemeral': 'true'})
+    })
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Ephemeral mode not supported'
+    assert not written_files(tmp_path)
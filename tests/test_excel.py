@@ -0,0 +1,141 @@
+"""
+Tests for Excel processing
+"""
+
+import datetime
+
+import openpyxl
+import pandas as pd
+from openpyxl.styles import Font
+
+import app
+import config
+
+SHEET_ROWS = [['id', 'amount', 'ratio', 'flag', 'date', 'note'],
+              [1, 1e20, 1.5, True, datetime.datetime(2024, 1, 2), 'first'],
+              [2, 2.0, 0.1, False, datetime.datetime(2024, 3, 4, 5, 6), None]]
+
+
+def save_workbook(path, sheets, formatted_rows=0):
+    """
+    Write a workbook with one sheet per entry
+
+    Args:
+        path (pathlib.Path): Destination .xlsx path
+        sheets (dict): Sheet name to list of rows
+        formatted_rows (int): Style empty cells down to this row, as spreadsheet
+                              applications do for formatted but unused rows
+
+    Returns:
+        str: Path to the workbook
+    """
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name, rows in sheets.items():
+        worksheet = workbook.create_sheet(sheet_name)
+        for row in rows:
+            worksheet.append(row)
+        for row_num in range(len(rows) + 1, formatted_rows + 1):
+            worksheet.cell(row=row_num, column=1).font = Font(bold=True)
+    workbook.save(path)
+    return str(path)
+
+
+def test_cells_read_like_pandas(tmp_path):
+    """
+    The bounded openpyxl reader gives the cell strings of pandas.read_excel(dtype=str)
+    """
+    path = save_workbook(tmp_path / 'values.xlsx', {'Data': SHEET_ROWS})
+    expected = pd.read_excel(path, dtype=str, keep_default_na=False)
+
+    workbook, _ = app.open_excel_workbook(path)
+    df, original_size = app.read_excel_sheet_window(workbook, 'Data')
+    workbook.close()
+
+    assert list(df.columns) == list(expected.columns)
+    assert df.values.tolist() == expected.values.tolist()
+    assert df.loc[0, 'amount'] == '100000000000000000000'
+    assert original_size == expected.shape
+
+
+def test_formatted_empty_rows_do_not_count(tmp_path):
+    """
+    Styled but empty rows after the data are not part of the reported size
+    """
+    path = save_workbook(tmp_path / 'styled.xlsx', {'Data': SHEET_ROWS}, formatted_rows=20)
+    text = app.process_excel(path)['data']['text_only']
+    assert 'Original size: 2 rows, 6 columns\n' in text
+    assert 'truncated' not in text
+
+
+def test_truncated_sheet_reports_its_full_size(tmp_path, monkeypatch):
+    """
+    Rows and columns beyond the limits are reported as truncated
+    """
+    monkeypatch.setattr(config, 'EXCEL_MAX_ROWS', 1)
+    monkeypatch.setattr(config, 'EXCEL_MAX_COLUMNS', 4)
+    path = save_workbook(tmp_path / 'large.xlsx', {'Data': SHEET_ROWS})
+    text = app.process_excel(path)['data']['text_only']
+    assert ('Original size: 2 rows, 6 columns (truncated to 1 rows) (truncated to 4 columns)'
+            in text)
+    assert 'id | amount | ratio | flag\n' in text
+
+
+def test_header_counts_sheets_like_before(tmp_path):
+    """
+    The header keeps its wording and only names the selection when sheets are selected
+    """
+    path = save_workbook(tmp_path / 'sheets.xlsx', {'First': SHEET_ROWS, 'Second': SHEET_ROWS})
+    assert app.process_excel(path)['data']['text_only'].startswith(
+        'Excel File Content (2 sheet(s))\n')
+    assert app.process_excel(path, sheet_selectors=['Second'])['data']['text_only'].startswith(
+        'Excel File Content (1 of 2 sheet(s))\n')
+
+
+def test_sheets_parsed_in_the_worker_pool_match_sequential_output(tmp_path, monkeypatch):
+    """
+    Saved workbooks with enough sheets are parsed in the pool, with identical output
+    """
+    sheets = {f'Sheet{index}': [['index', 'value'], *[[row, f'{index}-{row}'] for row in range(5)]]
+              for index in range(4)}
+    path = save_workbook(tmp_path / 'many.xlsx', sheets)
+    sequential = app.process_excel(path, table_rows=True)
+
+    pool_runs = []
+    run_excel_sheets_in_pool = app.run_excel_sheets_in_pool
+
+    def recording_run_excel_sheets_in_pool(*args):
+        pool_runs.append(args[1])
+        return run_excel_sheets_in_pool(*args)
+
+    monkeypatch.setattr(app, 'run_excel_sheets_in_pool', recording_run_excel_sheets_in_pool)
+    monkeypatch.setattr(config, 'EXCEL_PARALLEL_MIN_SHEETS', 3)
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 2)
+    app.reset_ocr_executor()
+    try:
+        parallel = app.process_excel(path, table_rows=True)
+        # Below the threshold, and for in-memory uploads, sheets are parsed in-process
+        app.process_excel(path, sheet_selectors=['1', '2'])
+        with open(path, 'rb') as workbook_file:
+            in_memory = app.process_excel(memoryview(workbook_file.read()), table_rows=True)
+    finally:
+        app.reset_ocr_executor()
+
+    assert pool_runs == [list(enumerate(sheets))]
+    assert parallel == sequential
+    assert in_memory == sequential
+
+
+def test_pool_is_only_used_with_several_workers(monkeypatch):
+    """
+    Parallel parsing needs the sheet threshold and more than one worker process
+    """
+    monkeypatch.setattr(config, 'EXCEL_PARALLEL_MIN_SHEETS', 2)
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 4)
+    assert app.should_parse_sheets_in_parallel(2)
+    assert not app.should_parse_sheets_in_parallel(1)
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 1)
+    assert not app.should_parse_sheets_in_parallel(10)
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 4)
+    monkeypatch.setattr(config, 'EXCEL_PARALLEL_MIN_SHEETS', 0)
+    assert not app.should_parse_sheets_in_parallel(10)
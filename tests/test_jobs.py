@@ -0,0 +1,165 @@
+"""
+Tests for the background job queue
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+import config
+import jobs
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_for_job(client, job_id, timeout=10):
+    """
+    Poll a job until it has finished
+
+    Args:
+        client (FlaskClient): Test client
+        job_id (str): Job ID
+        timeout (float): Seconds to wait
+
+    Returns:
+        dict: Final job state
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f'/api/v1/jobs/{job_id}').get_json()
+        if job['status'] in ('completed', 'failed'):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f'Job {job_id} did not finish: {job}')
+
+
+def submit(client, content, filename):
+    """
+    Submit a file to POST /api/v1/jobs
+
+    Args:
+        client (FlaskClient): Test client
+        content (bytes): File content
+        filename (str): Upload filename
+
+    Returns:
+        str: Job ID
+    """
+    response = client.post('/api/v1/jobs', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(content), filename), 'use_cache': 'false'
+    })
+    assert response.status_code == 202, response.get_json()
+    return response.get_json()['job_id']
+
+
+def test_corrupt_file_fails_job_without_stalling_the_queue(client):
+    """
+    A file that raises outside the usual exception types fails its job only
+    """
+    corrupt_jobs = [submit(client, b'not a zip archive', f'broken{index}.xlsx')
+                    for index in range(2)]
+    valid_job = submit(client, b'hello queue', 'notes.txt')
+
+    for job_id in corrupt_jobs:
+        job = wait_for_job(client, job_id)
+        assert job['status'] == 'failed'
+        assert job['error']['error'] == 'Processing failed'
+
+    job = wait_for_job(client, valid_job)
+    assert job['status'] == 'completed'
+    assert 'hello queue' in str(job['result'])
+    workers = jobs._WORKERS['threads']  # pylint: disable=protected-access
+    assert workers and all(worker.is_alive() for worker in workers)
+
+
+# Submits a job through a second interpreter, prints its ID once finished and keeps the
+# process alive until stdin is closed
+SUBMITTING_PROCESS_SCRIPT = '''
+import io, sys, time
+import app, config
+config.UPLOAD_FOLDER, config.JOB_STORE_FOLDER, config.RESULT_CACHE_FOLDER = sys.argv[1:4]
+client = app.app.test_client()
+job_id = client.post('/api/v1/jobs', content_type='multipart/form-data', data={
+    'file': (io.BytesIO(b'polled from another process'), 'notes.txt'), 'use_cache': 'false'
+}).get_json()['job_id']
+while client.get(f'/api/v1/jobs/{job_id}').get_json()['status'] != 'completed':
+    time.sleep(0.05)
+print(job_id, flush=True)
+sys.stdin.read()
+'''
+
+
+def exited_process_pid():
+    """
+    Get the process ID of a process that has already exited
+
+    Returns:
+        int: Process ID
+    """
+    return int(subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                              capture_output=True, text=True, check=True).stdout)
+
+
+def test_job_created_in_one_process_is_polled_from_another(client, upload_folder):
+    """
+    A job accepted by one worker process can be polled through any other
+    """
+    with subprocess.Popen(
+            [sys.executable, '-c', SUBMITTING_PROCESS_SCRIPT, str(upload_folder),
+             config.JOB_STORE_FOLDER, config.RESULT_CACHE_FOLDER],
+            cwd=REPO_ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True) as worker:
+        job_id = worker.stdout.readline().strip()
+        response = client.get(f'/api/v1/jobs/{job_id}')
+        worker.stdin.close()
+    assert response.status_code == 200
+    job = response.get_json()
+    assert job['status'] == 'completed'
+    assert 'polled from another process' in str(job['result'])
+    assert 'worker_pid' not in job
+
+
+def test_unfinished_job_of_an_exited_worker_is_reported_failed(client):
+    """
+    A job still marked running by a worker process that exited will never finish
+    """
+    job_id = uuid.uuid4().hex
+    os.makedirs(config.JOB_STORE_FOLDER)
+    with open(os.path.join(config.JOB_STORE_FOLDER, f'{job_id}.json'), 'w',
+              encoding='utf-8') as record_file:
+        json.dump({'job_id': job_id, 'status': 'running', 'error': None,
+                   'worker_pid': exited_process_pid()}, record_file)
+
+    job = client.get(f'/api/v1/jobs/{job_id}').get_json()
+    assert job['status'] == 'failed'
+    assert 'exited' in job['error']['message']
+    assert client.get('/api/v1/jobs/' + 'z' * 32).status_code == 404
+
+
+def test_queue_depth_counts_jobs_queued_by_other_workers(client, monkeypatch):
+    """
+    Jobs queued by other live workers count towards the depth limit; markers left by
+    exited workers are cleaned up instead
+    """
+    monkeypatch.setattr(config, 'JOB_QUEUE_MAX_DEPTH', 2)
+    markers_folder = os.path.join(config.JOB_STORE_FOLDER, jobs.QUEUED_MARKERS_FOLDER)
+    os.makedirs(markers_folder)
+    live_markers = [os.path.join(markers_folder, f'{uuid.uuid4().hex}.{os.getppid()}')
+                    for _ in range(2)]
+    for marker_path in live_markers:
+        open(marker_path, 'w', encoding='utf-8').close()  # pylint: disable=consider-using-with
+
+    response = client.post('/api/v1/jobs', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(b'one too many'), 'notes.txt')
+    })
+    assert response.status_code == 429
+
+    dead_pid = exited_process_pid()
+    for marker_path in live_markers:
+        os.replace(marker_path, f"{marker_path.rpartition('.')[0]}.{dead_pid}")
+    job = wait_for_job(client, submit(client, b'room again', 'notes.txt'))
+    assert job['status'] == 'completed'
+    assert not os.listdir(markers_folder)
@@ -0,0 +1,93 @@
+"""
+Tests for deferred imports and the fast-start app factory
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import app
+import config
+import lazy_imports
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that must not be imported until a request needs them
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'docx', 'PyPDF2', 'pdf2image', 'pytesseract']
+
+
+def test_importing_the_app_defers_heavy_libraries():
+    """
+    A fresh interpreter importing the app loads none of the heavy libraries
+    """
+    script = (
+        "import sys, app\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=REPO_ROOT, capture_output=True,
+                            text=True, timeout=60, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_lazy_module_imports_on_first_attribute_access(monkeypatch):
+    """
+    The proxy imports its module only when an attribute is used
+    """
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+    colorsys = lazy_imports.LazyModule('colorsys')
+    assert 'colorsys' not in sys.modules
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert 'colorsys' in sys.modules
+    assert repr(colorsys) == "<lazy module 'colorsys'>"
+
+    with pytest.raises(ImportError):
+        lazy_imports.LazyModule('docusense_missing_module').anything  # pylint: disable=expression-not-assigned
+
+
+def test_is_installed_checks_without_importing(monkeypatch):
+    """
+    Installation checks find modules without importing them and reject bad names
+    """
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+    assert lazy_imports.is_installed('colorsys')
+    assert 'colorsys' not in sys.modules
+    assert not lazy_imports.is_installed('docusense_missing_module')
+    assert not lazy_imports.is_installed('')
+
+
+def test_background_discovery_runs_once_while_health_checks_answer(client, monkeypatch):
+    """
+    The factory probes Tesseract on a background thread; health reports 'discovering'
+    until the single probe finishes
+    """
+    probe_started = threading.Event()
+    release_probe = threading.Event()
+    probes = []
+
+    def slow_find_tesseract_binary():
+        probes.append(True)
+        probe_started.set()
+        release_probe.wait(10)
+        return None, None
+
+    monkeypatch.setattr(app, 'OCR_LIBRARIES_INSTALLED', True)
+    monkeypatch.setattr(app, 'find_tesseract_binary', slow_find_tesseract_binary)
+    monkeypatch.setattr(app, '_TESSERACT_DISCOVERY',
+                        {'done': False, 'cmd': None, 'version': None, 'thread': None})
+    monkeypatch.setattr(app, '_TESSERACT_INFO',
+                        {'languages': None, 'version': None, 'loaded_at': 0.0})
+    monkeypatch.setattr(config, 'TESSERACT_DISCOVERY_IN_BACKGROUND', True)
+
+    assert app.create_app() is app.app
+    assert probe_started.wait(10)
+    assert client.get('/api/v1/health').get_json()['ocr_engine']['status'] == 'discovering'
+    app.create_app()
+
+    release_probe.set()
+    app._TESSERACT_DISCOVERY['thread'].join(10)  # pylint: disable=protected-access
+    assert client.get('/api/v1/health').get_json()['ocr_engine']['status'] == 'unavailable'
+    assert not app.discover_tesseract()
+    assert len(probes) == 1
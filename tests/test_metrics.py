@@ -0,0 +1,161 @@
+"""
+Tests for Prometheus metrics merged across worker processes
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import config
+import metrics
+
+HISTOGRAM_BOUNDS = [str(bound) for bound in config.TIMING_HISTOGRAM_BUCKETS_MS] + ['+Inf']
+
+
+def make_snapshot(pid, requests, in_flight, jobs_running):
+    """
+    Build a worker snapshot in the layout written by metrics.write_snapshot()
+
+    Args:
+        pid (int): Worker process ID
+        requests (int): docusense_requests_total value
+        in_flight (int): docusense_requests_in_flight value
+        jobs_running (int): Running background jobs
+
+    Returns:
+        dict: Snapshot
+    """
+    return {
+        'pid': pid, 'written_at': 0,
+        'values': [['docusense_requests_total',
+                    [['endpoint', 'api_ocr'], ['file_type', 'png'], ['status', '200']], requests],
+                   ['docusense_requests_in_flight', [], in_flight]],
+        'histograms': {'total': {'buckets_ms': dict.fromkeys(HISTOGRAM_BOUNDS, requests),
+                                 'count': requests, 'sum_ms': requests * 2.0}},
+        'cache': {'hits': 1, 'misses': 1, 'evictions': 0},
+        'queue': {'queued': 0, 'running': jobs_running, 'completed': 0, 'failed': 0,
+                  'queue_depth': 0},
+        'storage': {'expired': 1, 'evicted': 0}
+    }
+
+
+def get_exited_pid():
+    """
+    Get the process ID of a process that has already exited
+
+    Returns:
+        int: Process ID
+    """
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])  # pylint: disable=consider-using-with
+    process.wait()
+    return process.pid
+
+
+def render_lines():
+    """
+    Render the merged metrics with fixed figures for the scraping process
+
+    Returns:
+        set: Metric lines
+    """
+    local_histograms = {'total': {'buckets_ms': dict.fromkeys(HISTOGRAM_BOUNDS, 1),
+                                  'count': 1, 'sum_ms': 3.0}}
+    text = metrics.render_metrics(
+        local_histograms,
+        {'hits': 2, 'misses': 0, 'evictions': 0, 'hit_ratio': 1.0, 'size_bytes': 10},
+        {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0, 'queue_depth': 0},
+        {'size_bytes': 100, 'files': 2, 'expired': 0, 'evicted': 0}
+    )
+    return set(text.splitlines())
+
+
+def test_scrape_merges_live_and_exited_workers(tmp_path, monkeypatch):
+    """
+    Counters and histograms include every worker; gauges only live workers
+    """
+    monkeypatch.setattr(config, 'METRICS_MULTIPROCESS_DIR', str(tmp_path))
+    monkeypatch.setattr(metrics, '_VALUES', {})
+    worker_snapshots = (make_snapshot(os.getppid(), 5, 1, 2),
+                        make_snapshot(get_exited_pid(), 7, 3, 4))
+    for snapshot in worker_snapshots:
+        with open(tmp_path / f"worker-{snapshot['pid']}.json", 'w', encoding='utf-8') as file:
+            json.dump(snapshot, file)
+    metrics.increment('docusense_requests_total', endpoint='api_ocr', file_type='png', status=200)
+
+    lines = render_lines()
+
+    assert ('docusense_requests_total{endpoint="api_ocr",file_type="png",status="200"} 13'
+            in lines)
+    assert 'docusense_requests_in_flight 1' in lines
+    assert 'docusense_stage_duration_seconds_count{stage="total"} 13' in lines
+    assert 'docusense_jobs{status="running"} 2' in lines
+    assert 'docusense_result_cache_lookups_total{outcome="hit"} 4' in lines
+    assert 'docusense_result_cache_hit_ratio 0.6667' in lines
+    assert 'docusense_upload_storage_removed_total{reason="expired"} 2' in lines
+    assert 'docusense_upload_storage_bytes 100' in lines
+
+
+def write_worker_snapshot(folder, worker_id, snapshot, started_at):
+    """
+    Write a snapshot file named after its worker ID
+
+    Args:
+        folder (pathlib.Path): Shared metrics folder
+        worker_id (str): Per-process worker ID
+        snapshot (dict): Output of make_snapshot()
+        started_at (float): Start time of the worker process
+    """
+    snapshot = dict(snapshot, worker_id=worker_id, started_at=started_at)
+    with open(folder / f'worker-{worker_id}.json', 'w', encoding='utf-8') as file:
+        json.dump(snapshot, file)
+
+
+def test_reused_pid_keeps_the_exited_workers_counters(tmp_path, monkeypatch):
+    """
+    A new worker that reuses an exited worker's PID writes its own snapshot; the old
+    one keeps counting, and only the newest process with a PID counts for gauges
+    """
+    monkeypatch.setattr(config, 'METRICS_MULTIPROCESS_DIR', str(tmp_path))
+    monkeypatch.setattr(metrics, '_VALUES', {})
+    reused_pid = os.getppid()
+    write_worker_snapshot(tmp_path, f'{reused_pid}-old', make_snapshot(reused_pid, 7, 3, 4), 100)
+    write_worker_snapshot(tmp_path, f'{reused_pid}-new', make_snapshot(reused_pid, 5, 1, 2), 200)
+    metrics.increment('docusense_requests_total', endpoint='api_ocr', file_type='png', status=200)
+
+    lines = render_lines()
+    assert ('docusense_requests_total{endpoint="api_ocr",file_type="png",status="200"} 13'
+            in lines)
+    assert 'docusense_requests_in_flight 1' in lines
+    assert 'docusense_jobs{status="running"} 2' in lines
+
+
+def test_exited_workers_are_folded_into_one_file(tmp_path, monkeypatch):
+    """
+    Folding removes exited workers' snapshots without changing any total, and a fold
+    interrupted before removing a snapshot never counts it twice
+    """
+    monkeypatch.setattr(config, 'METRICS_MULTIPROCESS_DIR', str(tmp_path))
+    monkeypatch.setattr(metrics, '_VALUES', {})
+    live_pid, exited_pid = os.getppid(), get_exited_pid()
+    write_worker_snapshot(tmp_path, f'{exited_pid}-a', make_snapshot(exited_pid, 7, 3, 4), 100)
+    write_worker_snapshot(tmp_path, f'{live_pid}-b', make_snapshot(live_pid, 2, 0, 0), 100)
+    write_worker_snapshot(tmp_path, f'{live_pid}-c', make_snapshot(live_pid, 5, 1, 2), 200)
+    metrics.increment('docusense_requests_total', endpoint='api_ocr', file_type='png', status=200)
+    before = render_lines()
+
+    metrics.fold_exited_workers()
+    assert sorted(path.name for path in tmp_path.glob('worker-*.json')) == [
+        f'worker-{live_pid}-c.json']
+    assert render_lines() == before
+    assert ('docusense_requests_total{endpoint="api_ocr",file_type="png",status="200"} 15'
+            in before)
+    assert 'docusense_stage_duration_seconds_count{stage="total"} 15' in before
+    assert 'docusense_requests_in_flight 1' in before
+
+    # A snapshot left behind by an interrupted fold is skipped, then removed
+    write_worker_snapshot(tmp_path, f'{exited_pid}-a', make_snapshot(exited_pid, 7, 3, 4), 100)
+    assert render_lines() == before
+    metrics.fold_exited_workers()
+    assert render_lines() == before
+    assert not (tmp_path / f'worker-{exited_pid}-a.json').exists()
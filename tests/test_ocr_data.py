@@ -0,0 +1,68 @@
+"""
+Tests for OCR data cleanup and response shapes
+"""
+
+import app
+
+# Word-level image_to_data output: block, paragraph and line rows have no text
+OCR_DATA = {
+    'level': [1, 2, 3, 4, 5, 5, 5, 4, 5, 5],
+    'text': ['', '', '', '', 'Invoice', ' ', 'Nº 42', '', 'Total:', '  €1,250.00 '],
+    'conf': [-1, -1, -1, -1, 96.4, 12.0, 88.9, -1, 91.0, 79.99],
+    'left': [0, 10, 10, 10, 10, 95, 110, 10, 10, 84],
+    'top': [0, 12, 12, 12, 12, 12, 13, 40, 40, 41],
+    'width': [800, 300, 300, 300, 80, 4, 61, 230, 70, 156],
+    'height': [600, 60, 60, 25, 25, 25, 24, 26, 26, 25]
+}
+
+
+def clean_with_loop(ocr_data, dpi_scale_x, dpi_scale_y):
+    """
+    Per-entry cleanup as done before vectorization
+
+    Args:
+        ocr_data (dict): Raw OCR data from Tesseract
+        dpi_scale_x (float): X-axis scaling factor
+        dpi_scale_y (float): Y-axis scaling factor
+
+    Returns:
+        list: Cleaned and scaled OCR data entries
+    """
+    cleaned_data = []
+    for i in range(len(ocr_data['text'])):
+        text = ocr_data['text'][i].strip()
+        if text:
+            cleaned_data.append({
+                'text': text,
+                'confidence': int(ocr_data['conf'][i]),
+                'left': int(ocr_data['left'][i] / dpi_scale_x),
+                'top': int(ocr_data['top'][i] / dpi_scale_y),
+                'width': int(ocr_data['width'][i] / dpi_scale_x),
+                'height': int(ocr_data['height'][i] / dpi_scale_y)
+            })
+    return cleaned_data
+
+
+def test_vectorized_cleanup_matches_the_loop():
+    """
+    NumPy cleanup keeps the same entries, truncation and types as the per-entry loop
+    """
+    for scale_x, scale_y in ((1.0, 1.0), (2.0, 2.0), (0.8, 0.8), (1.37, 0.61)):
+        expected = clean_with_loop(OCR_DATA, scale_x, scale_y)
+        cleaned = app.clean_and_scale_ocr_data(OCR_DATA, scale_x, scale_y)
+        assert cleaned == expected
+        assert all(type(value) is type(expected_value)  # pylint: disable=unidiomatic-typecheck
+                   for entry, expected_entry in zip(cleaned, expected)
+                   for value, expected_value in zip(entry.values(), expected_entry.values()))
+
+    assert [entry['text'] for entry in expected] == ['Invoice', 'Nº 42', 'Total:', '€1,250.00']
+    paged = app.clean_and_scale_ocr_data(OCR_DATA, 1.0, 1.0, page=3)
+    assert paged == [{**entry, 'page': 3} for entry in clean_with_loop(OCR_DATA, 1.0, 1.0)]
+
+
+def test_no_words_gives_no_entries():
+    """
+    Pages without recognized text clean up to an empty list
+    """
+    empty = {key: [] for key in OCR_DATA}
+    assert not app.clean_and_scale_ocr_data(empty, 1.0, 1.0)
@@ -0,0 +1,145 @@
+"""
+Tests for the persistent tesserocr OCR backend
+"""
+
+import types
+
+import pytest
+from PIL import Image
+
+import app
+import config
+import ocr_engines
+
+# Word-level TSV as returned by GetTSVText(0), without a header line
+TSV_TEXT = ('1\t1\t0\t0\t0\t0\t0\t0\t200\t50\t-1\t\n'
+            '5\t1\t1\t1\t1\t1\t10\t12\t80\t25\t96.5\tInvoice\n'
+            '5\t1\t1\t1\t1\t2\t95\t12\t40\t25\t88\tNº 42\n'
+            'truncated line\n')
+
+
+class FakeEngine:
+    """
+    Stand-in for tesserocr.PyTessBaseAPI that records how it is driven
+    """
+    # pylint: disable=invalid-name
+
+    created = []
+
+    def __init__(self, lang, oem, path=None):
+        self.init_args = (lang, oem, path)
+        self.calls = []
+        FakeEngine.created.append(self)
+
+    def SetPageSegMode(self, psm):
+        """Record the page segmentation mode"""
+        self.calls.append(('psm', psm))
+
+    def SetImageBytes(self, data, *layout):
+        """Record the image buffer size and layout"""
+        self.calls.append(('image', len(data), *layout))
+
+    def SetSourceResolution(self, dpi):
+        """Record the source resolution"""
+        self.calls.append(('dpi', dpi))
+
+    def Recognize(self):
+        """Pretend recognition succeeded"""
+        return True
+
+    def GetTSVText(self, _page):
+        """Return the canned TSV output"""
+        return TSV_TEXT
+
+    def Clear(self):
+        """Record that the engine was reset for reuse"""
+        self.calls.append(('clear',))
+
+    def End(self):
+        """Record that the engine was shut down"""
+        self.calls.append(('end',))
+
+
+@pytest.fixture(autouse=True)
+def fake_tesserocr(monkeypatch):
+    """
+    Install a fake tesserocr module and start with an empty engine pool
+    """
+    FakeEngine.created = []
+    monkeypatch.setattr(ocr_engines, 'tesserocr', types.SimpleNamespace(
+        PyTessBaseAPI=FakeEngine, OEM=lambda oem: ('OEM', oem), PSM=lambda psm: ('PSM', psm)
+    ), raising=False)
+    monkeypatch.setattr(ocr_engines, 'TESSEROCR_AVAILABLE', True)
+    monkeypatch.setattr(ocr_engines, '_IDLE_ENGINES', {})
+    monkeypatch.setattr(config, 'OCR_BACKEND', 'tesserocr')
+
+
+def test_tsv_is_parsed_like_pytesseract_output():
+    """
+    Columns match pytesseract's Output.DICT and malformed lines are skipped
+    """
+    data = ocr_engines.parse_tsv(TSV_TEXT)
+    assert list(data) == ocr_engines.TSV_COLUMNS
+    assert data['text'] == ['', 'Invoice', 'Nº 42']
+    assert data['conf'] == [-1.0, 96.5, 88.0]
+    assert data['left'] == [0, 10, 95]
+    assert app.clean_and_scale_ocr_data(data, 1.0, 1.0)[1] == {
+        'text': 'Nº 42', 'confidence': 88, 'left': 95, 'top': 12, 'width': 40, 'height': 25
+    }
+
+
+def test_engines_are_reused_across_calls():
+    """
+    One engine serves consecutive calls; it is cleared between them, never restarted
+    """
+    image = Image.new('L', (30, 20), 255)
+    for _ in range(3):
+        ocr_engines.image_to_data(image, 'eng', 1, 6)
+
+    assert len(FakeEngine.created) == 1
+    engine = FakeEngine.created[0]
+    assert engine.init_args == ('eng', ('OEM', 1), None)
+    assert engine.calls.count(('clear',)) == 3
+    assert ('end',) not in engine.calls
+    assert ('image', 600, 30, 20, 1, 30) in engine.calls
+
+
+def test_pool_keeps_at_most_the_configured_idle_engines(monkeypatch):
+    """
+    Engines beyond OCR_ENGINE_POOL_SIZE are shut down when released
+    """
+    monkeypatch.setattr(config, 'OCR_ENGINE_POOL_SIZE', 1)
+    # pylint: disable=protected-access
+    engines = [ocr_engines._acquire_engine('deu', 1) for _ in range(2)]
+    for engine in engines:
+        ocr_engines._release_engine('deu', 1, engine)
+
+    assert len(ocr_engines._IDLE_ENGINES[('deu', 1)]) == 1
+    assert [('end',) in engine.calls for engine in engines] == [False, True]
+
+
+def test_images_are_passed_as_raw_rgb_or_grayscale():
+    """
+    Images in other modes are converted to RGB; the DPI is forwarded when known
+    """
+    image = Image.new('RGBA', (4, 2))
+    image.info['dpi'] = (300, 300)
+    ocr_engines.image_to_data(image, 'eng', 1, 3)
+    calls = FakeEngine.created[0].calls
+    assert ('image', 24, 4, 2, 3, 12) in calls
+    assert ('dpi', 300) in calls
+
+
+def test_app_uses_the_selected_backend(monkeypatch):
+    """
+    run_ocr_engine uses tesserocr only when selected and installed
+    """
+    image = Image.new('L', (10, 10), 255)
+    assert ocr_engines.get_backend_name() == 'tesserocr'
+    assert app.run_ocr_engine(image, 'eng', '', 'lstm', 'single_column')['text'][1] == 'Invoice'
+    assert FakeEngine.created[0].calls[0] == ('psm', ('PSM', 4))
+
+    monkeypatch.setattr(ocr_engines, 'TESSEROCR_AVAILABLE', False)
+    assert ocr_engines.get_backend_name() == 'subprocess'
+    monkeypatch.setattr(config, 'OCR_BACKEND', 'subprocess')
+    assert not ocr_engines.is_persistent_backend_enabled()
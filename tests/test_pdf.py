@@ -0,0 +1,136 @@
+"""
+Tests for PDF processing
+"""
+
+import io
+
+import pytest
+
+import app
+import config
+
+
+@pytest.fixture(name='ocr_calls')
+def fixture_ocr_calls(monkeypatch):
+    """
+    Replace PDF OCR with a fake that records the pages it was asked to OCR
+    """
+    ocr_calls = []
+
+    def fake_pdf_ocr(_source, *_args, page_numbers=None, **_kwargs):
+        ocr_calls.append(page_numbers)
+        return {'data': [{'text': word, 'confidence': 90, 'left': 10, 'top': 10,
+                          'width': 40, 'height': 12, 'page': page_num}
+                         for page_num in page_numbers for word in ('Scanned', 'words')],
+                'processing_method': 'ocr', 'page_count': len(page_numbers),
+                'converted_images': [f'scan_page_{page_num}.png' for page_num in page_numbers]}
+
+    monkeypatch.setattr(app, 'is_ocr_available', lambda wait=True: True)
+    monkeypatch.setattr(app, 'process_pdf_with_ocr', fake_pdf_ocr)
+    return ocr_calls
+
+
+@pytest.fixture(name='post_pdf')
+def fixture_post_pdf(client, make_pdf):
+    """
+    Upload a generated PDF to POST /api/v1/ocr
+
+    The returned function takes the text of each page (None for a page without a text
+    layer), the expected HTTP status code (200 by default) and extra form fields, and
+    returns the OCR result
+    """
+    def post(page_texts, expected_status=200, **fields):
+        response = client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+            'file': (io.BytesIO(make_pdf(page_texts)), 'mixed.pdf'),
+            'use_cache': 'false', **fields
+        })
+        assert response.status_code == expected_status
+        return response.get_json()
+
+    return post
+
+
+def test_mixed_pdf_result_covers_every_page(post_pdf, ocr_calls):
+    """
+    Text-layer pages of a mixed PDF stay in the result next to the OCR'd page's boxes
+    """
+    result = post_pdf(['First page text', None, 'Third page text'])
+
+    assert ocr_calls == [[2]]
+    assert result['processing_method'] == 'hybrid'
+    assert result['page_count'] == 3
+    assert [(page['page'], page['method']) for page in result['pages']] == [
+        (1, 'text_extraction'), (2, 'ocr'), (3, 'text_extraction')
+    ]
+    assert result['pages'][0]['text'] == 'First page text'
+    assert result['pages'][1]['text'] == 'Scanned words'
+
+    # Boxes and previews belong to the OCR'd page only; result.text has every page
+    assert {entry['page'] for entry in result['data']} == {2}
+    assert result['converted_images'] == ['scan_page_2.png']
+    for page_text in ('First page text', 'Scanned words', 'Third page text'):
+        assert page_text in result['text']
+
+
+def test_mixed_pdf_with_scanned_leading_pages_is_hybrid(post_pdf, ocr_calls):
+    """
+    Leading scanned pages do not hide a text layer further into the document
+    """
+    result = post_pdf([None, None, None, 'Fourth page text'])
+
+    assert ocr_calls == [[1, 2, 3]]
+    assert result['processing_method'] == 'hybrid'
+    assert [page['method'] for page in result['pages']] == ['ocr', 'ocr', 'ocr',
+                                                             'text_extraction']
+
+
+@pytest.fixture(name='extracted_pages')
+def fixture_extracted_pages(monkeypatch):
+    """
+    Record the pages whose text layer is read
+    """
+    extracted_pages = []
+    iter_pdf_page_texts = app.iter_pdf_page_texts
+
+    def recording_iter_pdf_page_texts(pdf_reader, first_page, last_page):
+        for page_num, page_text in iter_pdf_page_texts(pdf_reader, first_page, last_page):
+            extracted_pages.append(page_num)
+            yield page_num, page_text
+
+    monkeypatch.setattr(app, 'iter_pdf_page_texts', recording_iter_pdf_page_texts)
+    return extracted_pages
+
+
+def test_text_is_extracted_from_the_requested_pages_only(post_pdf, ocr_calls, extracted_pages):
+    """
+    Pages outside first_page..last_page are never read
+    """
+    result = post_pdf([f'Page {number} text' for number in range(1, 7)],
+                      first_page='2', last_page='4')
+
+    assert extracted_pages == [2, 3, 4]
+    assert not ocr_calls
+    assert result['processing_method'] == 'text_extraction'
+    assert (result['page_count'], result['page_range']) == (6, [2, 4])
+    assert 'Page 4 text' in result['data']['text_only']
+    assert 'Page 5 text' not in result['data']['text_only']
+
+
+def test_page_limit_bounds_text_extraction(post_pdf, ocr_calls, extracted_pages, monkeypatch):
+    """
+    Without a range, only the first MAX_PDF_PAGES pages are read
+    """
+    monkeypatch.setattr(config, 'MAX_PDF_PAGES', 2)
+    result = post_pdf([f'Page {number} text' for number in range(1, 7)])
+    assert extracted_pages == [1, 2]
+    assert not ocr_calls
+    assert result['page_range'] == [1, 2]
+
+
+@pytest.mark.usefixtures('ocr_calls')
+def test_page_range_outside_the_document_is_rejected(post_pdf):
+    """
+    A range that starts after the last page is reported as an error
+    """
+    result = post_pdf(['Only page'], expected_status=422, first_page='3')
+    assert 'outside the document' in result['message']
@@ -0,0 +1,184 @@
+"""
+Tests for the PDF rasterize-and-OCR pipeline
+"""
+
+import pathlib
+import threading
+import time
+import types
+
+import pytest
+from PIL import Image
+
+import app
+import config
+import storage
+
+PAGE_COUNT = 6
+PAGE_SIZE = (170, 220)
+
+
+@pytest.fixture(name='rasterizer')
+def fixture_rasterizer(monkeypatch):
+    """
+    Replace Poppler with a fake that writes a small PPM per page and records each call
+    """
+    renders = []
+
+    def convert_from_path(_filepath, **options):
+        folder = pathlib.Path(options['output_folder'])
+        renders.append({'folder': folder, 'pages': (options['first_page'], options['last_page']),
+                        'dpi': options['dpi'], 'fmt': options['fmt'],
+                        'paths_only': options['paths_only'],
+                        'pages_on_disk': len(list(folder.glob('*.ppm')))})
+        page_path = folder / f"page-{options['first_page']}.ppm"
+        Image.new('L', PAGE_SIZE, 255).save(page_path)
+        return [str(page_path)]
+
+    monkeypatch.setattr(app, 'pdf2image', types.SimpleNamespace(
+        convert_from_path=convert_from_path))
+    monkeypatch.setattr(app, 'get_pdf_page_count', lambda _filepath: PAGE_COUNT)
+    monkeypatch.setattr(app, 'is_ocr_available', lambda wait=True: True)
+    monkeypatch.setattr(app, 'get_tesseract_config', lambda *_args: ('eng', ''))
+    monkeypatch.setattr(app, 'run_ocr_engine', lambda image, *_args: {
+        'text': ['Scanned'], 'conf': [90], 'left': [1], 'top': [2], 'width': [30],
+        'height': [10]
+    })
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 1)
+    return renders
+
+
+def ocr_pdf(pdf_path, **options):
+    """
+    Run the PDF OCR path on a placeholder PDF
+
+    Args:
+        pdf_path (pathlib.Path): Placeholder PDF path
+        **options: Keyword options for process_pdf_with_ocr()
+
+    Returns:
+        dict: OCR result
+    """
+    pdf_path.write_bytes(b'%PDF-1.4 placeholder')
+    return app.process_pdf_with_ocr(str(pdf_path), 'low', **options)
+
+
+def test_pages_are_rendered_one_at_a_time(rasterizer, tmp_path):
+    """
+    Each page is rasterized on its own and removed before the next one is rendered
+    """
+    result = ocr_pdf(tmp_path / 'scan.pdf', page_range=(2, 5), include_images=False)
+
+    assert [render['pages'] for render in rasterizer] == [(2, 2), (3, 3), (4, 4), (5, 5)]
+    assert all(render['paths_only'] and render['fmt'] == 'ppm' for render in rasterizer)
+    assert {render['dpi'] for render in rasterizer} == {config.DPI_PRESETS['low']}
+    assert [render['pages_on_disk'] for render in rasterizer] == [0, 0, 0, 0]
+    assert [entry['page'] for entry in result['data']] == [2, 3, 4, 5]
+    assert not rasterizer[0]['folder'].exists()
+
+
+def test_page_limit_bounds_rasterization(rasterizer, tmp_path, monkeypatch):
+    """
+    Pages past MAX_PDF_PAGES are never rasterized
+    """
+    monkeypatch.setattr(config, 'MAX_PDF_PAGES', 2)
+    result = ocr_pdf(tmp_path / 'scan.pdf', include_images=False)
+    assert [render['pages'] for render in rasterizer] == [(1, 1), (2, 2)]
+    assert result['page_count'] == 2
+
+
+def test_worker_pool_keeps_a_bounded_number_of_pages_rendered(rasterizer, tmp_path,
+                                                                monkeypatch):
+    """
+    With OCR_WORKER_PROCESSES > 1 pages are OCR'd in the process pool, in page order,
+    and no more pages than workers are rendered at a time
+    """
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 2)
+    # The fake OCR engine only exists in this process, so workers must be forked from it
+    monkeypatch.setattr(config, 'OCR_POOL_START_METHOD', 'fork')
+    app.reset_ocr_executor()
+    try:
+        result = ocr_pdf(tmp_path / 'scan.pdf', include_images=False)
+        assert app._OCR_POOL['executor'] is not None  # pylint: disable=protected-access
+    finally:
+        app.reset_ocr_executor()
+
+    assert result['page_count'] == PAGE_COUNT
+    assert sorted({entry['page'] for entry in result['data']}) == list(range(1, PAGE_COUNT + 1))
+    assert max(render['pages_on_disk'] for render in rasterizer) <= 1
+    assert not rasterizer[0]['folder'].exists()
+
+
+def test_pages_are_ocrd_in_memory_without_png_encoding(rasterizer, tmp_path, monkeypatch):
+    """
+    The decoded page goes straight to the OCR engine; nothing is encoded to PNG
+    """
+    ocr_inputs, saved_formats = [], []
+    save = Image.Image.save
+
+    def recording_save(image, fp, format=None, **params):  # pylint: disable=redefined-builtin
+        saved_formats.append((format or str(fp).rsplit('.', 1)[-1]).upper())
+        return save(image, fp, format, **params)
+
+    def recording_ocr_engine(image, *_args):
+        ocr_inputs.append(image)
+        return {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+
+    monkeypatch.setattr(Image.Image, 'save', recording_save)
+    monkeypatch.setattr(app, 'run_ocr_engine', recording_ocr_engine)
+    ocr_pdf(tmp_path / 'scan.pdf', page_range=(1, 2), include_images=False)
+
+    assert len(rasterizer) == 2
+    assert all(isinstance(image, Image.Image) for image in ocr_inputs)
+    assert 'PNG' not in saved_formats
+
+
+def test_previews_are_written_by_the_preview_threads(rasterizer, upload_folder, tmp_path,
+                                                     monkeypatch):
+    """
+    Page previews are PNGs in the upload folder, written off the OCR thread
+    """
+    writer_threads = []
+    save_page_preview = app.save_page_preview
+
+    def recording_save_page_preview(image_path, preview_path):
+        writer_threads.append(threading.current_thread().name)
+        save_page_preview(image_path, preview_path)
+
+    monkeypatch.setattr(app, 'save_page_preview', recording_save_page_preview)
+    result = ocr_pdf(tmp_path / 'scan.pdf', page_range=(1, 3))
+
+    assert len(rasterizer) == 3
+    assert result['converted_images'] == [f'scan_page_{page_num}.png' for page_num in (1, 2, 3)]
+    assert all(name.startswith('docusense-preview') for name in writer_threads)
+    for image_name in result['converted_images']:
+        with Image.open(storage.resolve_stored_file(image_name)) as preview:
+            assert (preview.format, preview.size) == ('PNG', PAGE_SIZE)
+    assert len(list(upload_folder.rglob('*.png'))) == 3
+
+
+def test_pool_workers_start_fresh_with_the_server_state(monkeypatch):
+    """
+    OCR workers are not forked from the threaded server; they are handed its settings
+    and Tesseract discovery instead of probing the binary again
+    """
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 2)
+    monkeypatch.setattr(config, 'OCR_MAX_IMAGE_DIMENSION', 1234)
+    monkeypatch.setattr(app, '_TESSERACT_DISCOVERY', {
+        'done': True, 'cmd': '/opt/tesseract/bin/tesseract', 'version': '5.3.0', 'thread': None
+    })
+    monkeypatch.setattr(app, '_TESSERACT_INFO', {
+        'languages': ['eng', 'deu'], 'version': '5.3.0', 'loaded_at': time.monotonic()
+    })
+    app.reset_ocr_executor()
+    try:
+        executor = app.get_ocr_executor()
+        tesseract_info = executor.submit(app.get_tesseract_info).result(timeout=60)
+        worker_settings = executor.submit(app.get_ocr_worker_state).result(timeout=60)[0]
+        start_method = executor._mp_context.get_start_method()  # pylint: disable=protected-access
+    finally:
+        app.reset_ocr_executor()
+
+    assert start_method in ('forkserver', 'spawn')
+    assert (tesseract_info['languages'], tesseract_info['version']) == (['eng', 'deu'], '5.3.0')
+    assert worker_settings['OCR_MAX_IMAGE_DIMENSION'] == 1234
@@ -0,0 +1,115 @@
+"""
+Tests for image preprocessing ahead of OCR
+"""
+
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageEnhance, ImageFont, ImageStat
+
+import app
+import config
+
+
+def open_large_jpeg():
+    """
+    Encode a blank 8000x6000 grayscale JPEG scanned at 600 DPI and open it without
+    decoding it
+
+    Returns:
+        PIL.Image: Lazily loaded JPEG image
+    """
+    buffer = io.BytesIO()
+    Image.new('L', (8000, 6000), 255).save(buffer, 'JPEG', dpi=(600, 600))
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+def test_default_dimension_cap_decodes_large_jpegs_reduced():
+    """
+    With the shipped defaults, an oversized JPEG is decoded at reduced size
+    """
+    assert config.OCR_MAX_IMAGE_DIMENSION > 0
+    image = open_large_jpeg()
+    processed = app.preprocess_image_for_dpi(image, 'medium')
+
+    # draft() picked the 1/2 scale: the decoded image is smaller than the file
+    assert image.size == (4000, 3000)
+    assert max(processed.size) == config.OCR_MAX_IMAGE_DIMENSION
+
+
+def test_without_dimension_cap_jpegs_decode_full_size(monkeypatch):
+    """
+    Without the cap the DPI scale never drops below 0.8, so nothing is decoded reduced
+    """
+    monkeypatch.setattr(config, 'OCR_MAX_IMAGE_DIMENSION', 0)
+    image = open_large_jpeg()
+    app.preprocess_image_for_dpi(image, 'medium')
+    assert image.size == (8000, 6000)
+
+
+def test_pdf_page_rasters_keep_the_preset_size(tmp_path, monkeypatch):
+    """
+    Rasterized PDF pages are not capped, so each DPI preset still gives its own size
+    """
+    ocr_sizes = {}
+
+    def fake_ocr_engine(image, *_args):
+        ocr_sizes[current_preset] = image.size
+        return {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+
+    monkeypatch.setattr(app, 'is_ocr_available', lambda wait=True: True)
+    monkeypatch.setattr(app, 'get_tesseract_config', lambda *_args: ('eng', ''))
+    monkeypatch.setattr(app, 'run_ocr_engine', fake_ocr_engine)
+
+    for current_preset, preset_dpi in config.DPI_PRESETS.items():
+        # A 4x6 inch page as pdf2image writes it: a PPM without DPI information
+        page_path = tmp_path / f'{current_preset}.ppm'
+        Image.new('L', (4 * preset_dpi, 6 * preset_dpi), 255).save(page_path)
+        app.process_pdf_page_with_ocr(str(page_path), 1, {'dpi_setting': current_preset})
+
+    assert max(ocr_sizes['high']) > config.OCR_MAX_IMAGE_DIMENSION
+    assert len(set(ocr_sizes.values())) == len(config.DPI_PRESETS)
+
+
+def enhance_in_three_passes(image):
+    """
+    Enhancement as done before the single-pass pipeline, on RGB
+
+    Args:
+        image (PIL.Image): The input image
+
+    Returns:
+        PIL.Image: Enhanced grayscale image
+    """
+    image = ImageEnhance.Sharpness(image.convert('RGB')).enhance(1.2)
+    image = ImageEnhance.Contrast(image).enhance(1.1)
+    return ImageEnhance.Brightness(image).enhance(1.05).convert('L')
+
+
+def test_single_pass_enhancement_matches_the_three_enhancers():
+    """
+    Grayscale sharpening plus the fused lookup stay within a few gray levels of the
+    sharpness, contrast and brightness enhancers applied one after another
+    """
+    image = Image.new('RGB', (400, 120), (235, 230, 225))
+    ImageDraw.Draw(image).text((10, 10), 'Invoice 42 total due', fill=(20, 30, 40),
+                               font=ImageFont.load_default(size=28))
+
+    enhanced = app.enhance_image_for_ocr(image)
+    assert (enhanced.mode, enhanced.size) == ('L', image.size)
+    difference = np.abs(np.asarray(enhanced, dtype=int)
+                        - np.asarray(enhance_in_three_passes(image), dtype=int))
+    assert difference.max() <= 4
+    assert difference.mean() < 1.5
+
+
+def test_fused_lut_matches_contrast_then_brightness():
+    """
+    The lookup table reproduces ImageEnhance.Contrast followed by Brightness
+    """
+    gradient = Image.linear_gradient('L').resize((256, 16))
+    mean_level = int(ImageStat.Stat(gradient).mean[0] + 0.5)
+    expected = ImageEnhance.Brightness(ImageEnhance.Contrast(gradient).enhance(1.1)).enhance(1.05)
+    fused = gradient.point(app.build_enhancement_lut(mean_level))
+    assert np.abs(np.asarray(fused, dtype=int) - np.asarray(expected, dtype=int)).max() <= 2
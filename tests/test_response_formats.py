@@ -0,0 +1,108 @@
+"""
+Tests for the columnar and MessagePack response options of /api/v1/ocr
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+import app
+
+WORDS = {'text': ['', 'Total', 'due'], 'conf': [-1, 95.5, 87.0], 'left': [0, 10, 60],
+         'top': [0, 20, 20], 'width': [100, 45, 30], 'height': [50, 12, 12]}
+
+
+@pytest.fixture(name='png_upload')
+def fixture_png_upload(monkeypatch):
+    """
+    A PNG upload recognized by a fake OCR engine as two words
+
+    Returns:
+        bytes: PNG file
+    """
+    monkeypatch.setattr(app, 'is_ocr_available', lambda wait=True: True)
+    monkeypatch.setattr(app, 'get_tesseract_config', lambda *_args: ('eng', ''))
+    monkeypatch.setattr(app, 'run_ocr_engine', lambda *_args: WORDS)
+    buffer = io.BytesIO()
+    # Saved at the medium preset DPI, so the image is not rescaled and boxes keep their values
+    Image.new('L', (200, 100), 255).save(buffer, 'PNG', dpi=(300, 300))
+    return buffer.getvalue()
+
+
+def post_ocr(client, filename, content, **fields):
+    """
+    Upload a file to POST /api/v1/ocr
+
+    Args:
+        client (FlaskClient): Test client
+        filename (str): Upload filename
+        content (bytes): File content
+        **fields: Extra form fields
+
+    Returns:
+        Response: Test client response
+    """
+    return client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(content), filename), 'use_cache': 'false', **fields
+    })
+
+
+def test_records_format_is_the_default(client, png_upload):
+    """
+    Without options, word boxes are a list of objects
+    """
+    result = post_ocr(client, 'scan.png', png_upload).get_json()
+    assert result['format'] == 'records'
+    assert result['data'] == [
+        {'text': 'Total', 'confidence': 95, 'left': 10, 'top': 20, 'width': 45, 'height': 12},
+        {'text': 'due', 'confidence': 87, 'left': 60, 'top': 20, 'width': 30, 'height': 12}
+    ]
+
+
+def test_columnar_format_returns_parallel_arrays(client, png_upload):
+    """
+    format=columnar returns one array per field, in the same word order
+    """
+    result = post_ocr(client, 'scan.png', png_upload, format='columnar').get_json()
+    assert result['format'] == 'columnar'
+    assert result['data'] == {'text': ['Total', 'due'], 'confidence': [95, 87],
+                              'left': [10, 60], 'top': [20, 20], 'width': [45, 30],
+                              'height': [12, 12]}
+
+
+def test_columnar_keeps_page_numbers_and_text_only_results():
+    """
+    PDF entries add a page array; results without word boxes are left as they are
+    """
+    entries = [{'text': 'a', 'confidence': 90, 'left': 1, 'top': 2, 'width': 3, 'height': 4,
+                'page': 2}]
+    assert app.build_columnar_data(entries)['page'] == [2]
+    assert app.build_columnar_data([]) == {field: [] for field in app.COLUMNAR_FIELDS}
+
+
+def test_msgpack_encoding_carries_the_same_result(client, png_upload):
+    """
+    encoding=msgpack returns the JSON result, timings included, as MessagePack
+    """
+    msgpack = pytest.importorskip('msgpack')
+    response = post_ocr(client, 'scan.png', png_upload, format='columnar', encoding='msgpack')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/msgpack'
+    result = msgpack.unpackb(response.get_data())
+    assert result['data']['text'] == ['Total', 'due']
+    assert 'total_ms' in result['timings']
+
+
+def test_invalid_options_are_rejected(client, png_upload, monkeypatch):
+    """
+    Unknown formats and encodings, and msgpack without the package, give HTTP 400
+    """
+    for fields in ({'format': 'table'}, {'encoding': 'xml'}):
+        response = post_ocr(client, 'scan.png', png_upload, **fields)
+        assert response.status_code == 400
+
+    monkeypatch.setattr(app, 'MSGPACK_AVAILABLE', False)
+    response = post_ocr(client, 'scan.png', png_upload, encoding='msgpack')
+    assert response.status_code == 400
+    assert 'msgpack package' in response.get_json()['message']
@@ -0,0 +1,107 @@
+"""
+Tests for the persistent result cache
+"""
+
+import pytest
+
+import app
+import config
+import result_cache
+
+
+@pytest.fixture(name='text_upload')
+def fixture_text_upload(upload_folder, monkeypatch):
+    """
+    Store a text upload and make results cacheable without a Tesseract installation
+    """
+    monkeypatch.setattr(app, 'is_ocr_available', lambda wait=True: True)
+    monkeypatch.setattr(app, 'get_tesseract_info', lambda refresh=False: {
+        'languages': ['eng'], 'version': '5.3.0', 'cache_age_seconds': 0.0
+    })
+    upload_path = upload_folder / 'notes.txt'
+    upload_path.write_text('cached text', encoding='utf-8')
+    return str(upload_path)
+
+
+def process_with_cache(upload_path):
+    """
+    Process the text upload through the result cache
+
+    Args:
+        upload_path (str): Path to the upload
+
+    Returns:
+        bool: True if the result was served from the cache
+    """
+    return app.process_file_with_cache(upload_path, 'txt', {}, {})[2]
+
+
+def test_identical_upload_is_served_from_cache(text_upload):
+    """
+    The second request for the same file and settings is a cache hit
+    """
+    assert not process_with_cache(text_upload)
+    assert process_with_cache(text_upload)
+
+
+@pytest.mark.parametrize('setting, value', [('EXCEL_MAX_ROWS', 10), ('MAX_PDF_PAGES', 5),
+                                            ('OCR_MAX_IMAGE_DIMENSION', 0)])
+def test_config_change_invalidates_cached_results(text_upload, monkeypatch, setting, value):
+    """
+    Results cached under other server settings are not served
+    """
+    assert not process_with_cache(text_upload)
+    monkeypatch.setattr(config, setting, value)
+    assert not process_with_cache(text_upload)
+
+
+def test_tesseract_upgrade_invalidates_cached_results(text_upload, monkeypatch):
+    """
+    Results cached with another Tesseract version are not served
+    """
+    assert not process_with_cache(text_upload)
+    monkeypatch.setattr(app, 'get_tesseract_info', lambda refresh=False: {
+        'languages': ['eng'], 'version': '5.4.1', 'cache_age_seconds': 0.0
+    })
+    assert not process_with_cache(text_upload)
+
+
+def test_language_is_keyed_as_used(monkeypatch):
+    """
+    A language without an installed pack is keyed as the English fallback it runs as
+    """
+    ocr_settings = {'dpi_setting': 'medium', 'language': 'fra', 'engine_mode': 'lstm',
+                    'psm_mode': 'auto'}
+    monkeypatch.setattr(app, 'get_available_languages', lambda: ['eng'])
+    assert app.get_cache_settings('png', ocr_settings, {})['language'] == 'eng'
+    monkeypatch.setattr(app, 'get_available_languages', lambda: ['eng', 'fra'])
+    assert app.get_cache_settings('png', ocr_settings, {})['language'] == 'fra'
+
+
+def test_stores_and_stats_use_a_running_size_total(upload_folder, monkeypatch):
+    """
+    The cache folder is scanned once, then again only to evict over the size limit
+    """
+    scans = []
+    list_entries = result_cache._list_entries  # pylint: disable=protected-access
+
+    def counting_list_entries():
+        scans.append(True)
+        return list_entries()
+
+    monkeypatch.setattr(result_cache, '_list_entries', counting_list_entries)
+    for index in range(5):
+        result_cache.store_result(f'key{index}', {'result': {'text': 'x' * 100}})
+    result_cache.store_result('key0', {'result': {'text': 'y' * 100}})
+    stats = result_cache.get_cache_stats()
+    assert len(scans) == 1
+    assert stats['entries'] == 5
+    assert stats['size_bytes'] == sum(path.stat().st_size
+                                      for path in (upload_folder.parent / 'cache').iterdir())
+
+    monkeypatch.setattr(config, 'RESULT_CACHE_MAX_BYTES', stats['size_bytes'])
+    result_cache.store_result('key5', {'result': {'text': 'z' * 100}})
+    stats = result_cache.get_cache_stats()
+    assert len(scans) == 2
+    assert stats['entries'] == 5
+    assert stats['size_bytes'] <= config.RESULT_CACHE_MAX_BYTES
@@ -0,0 +1,93 @@
+"""
+Tests for the production server launcher
+"""
+
+import os
+
+import pytest
+
+import app
+import config
+import ocr_engines
+import serve
+
+
+@pytest.fixture(name='warm_up_calls')
+def fixture_warm_up_calls(monkeypatch):
+    """
+    Record how the launcher prepares the app instead of probing Tesseract
+    """
+    calls = []
+
+    def fake_create_app(**options):
+        calls.append(('create_app', options))
+        return app.app
+
+    monkeypatch.setattr(app, 'create_app', fake_create_app)
+    monkeypatch.setattr(app, 'warm_up_ocr_state', lambda: calls.append(('warm_up', {})))
+    monkeypatch.setattr(config, 'DEBUG', True)
+    monkeypatch.setattr(app.app, 'debug', True)
+    monkeypatch.setattr(config, 'OCR_WORKER_PROCESSES', 8)
+    monkeypatch.setattr(config, 'SERVE_OCR_PROCESSES_PER_WORKER', 1)
+    monkeypatch.setattr(config, 'METRICS_MULTIPROCESS_DIR', None)
+    return calls
+
+
+def test_factory_turns_debug_off_and_warms_up_before_forking(warm_up_calls, monkeypatch):
+    """
+    The factory disables debug mode, shrinks the per-worker OCR pool and discovers
+    Tesseract synchronously, so the master forks warm workers
+    """
+    monkeypatch.setattr(serve, 'GUNICORN_AVAILABLE', False)
+    assert serve.create_app() is app.app
+    assert warm_up_calls == [('create_app', {'discover_in_background': False}), ('warm_up', {})]
+    assert (config.DEBUG, app.app.debug) == (False, False)
+    assert config.OCR_WORKER_PROCESSES == 1
+    assert config.METRICS_MULTIPROCESS_DIR is None
+
+
+@pytest.mark.usefixtures('warm_up_calls')
+def test_gunicorn_workers_share_a_metrics_folder_owned_by_the_master(monkeypatch):
+    """
+    Under gunicorn a shared metrics folder is created, and only the master removes it
+    """
+    exit_handlers = []
+    monkeypatch.setattr(serve, 'GUNICORN_AVAILABLE', True)
+    monkeypatch.setattr(serve.atexit, 'register',
+                        lambda handler, *args: exit_handlers.append((handler, args)))
+    serve.create_app()
+
+    folder = config.METRICS_MULTIPROCESS_DIR
+    assert os.path.isdir(folder)
+    assert exit_handlers == [(serve.remove_metrics_folder, (folder, os.getpid()))]
+    serve.remove_metrics_folder(folder, os.getpid() + 1)
+    assert os.path.isdir(folder)
+    serve.remove_metrics_folder(folder, os.getpid())
+    assert not os.path.exists(folder)
+
+
+def test_worker_count_defaults_to_one_per_core(monkeypatch):
+    """
+    A worker count of 0 means one worker per CPU core, and never fewer than one
+    """
+    monkeypatch.setattr(serve.os, 'cpu_count', lambda: 6)
+    assert serve.get_worker_count(3) == 3
+    assert serve.get_worker_count(0) == 6
+    monkeypatch.setattr(serve.os, 'cpu_count', lambda: None)
+    assert serve.get_worker_count(0) == 1
+
+
+def test_warm_up_preloads_engines_for_installed_languages_only(monkeypatch):
+    """
+    Persistent engines are preloaded for configured languages that Tesseract has installed
+    """
+    preloaded = []
+    monkeypatch.setattr(app, 'is_ocr_available', lambda: True)
+    monkeypatch.setattr(app, 'get_tesseract_info', lambda: {'languages': ['eng', 'fra']})
+    monkeypatch.setattr(config, 'SERVE_PRELOAD_LANGUAGES', ['eng', 'deu', 'fra'])
+    monkeypatch.setattr(ocr_engines, 'preload_engines',
+                        lambda languages, oem: preloaded.append((languages, oem)))
+    app.warm_up_ocr_state()
+
+    oem, _ = app.get_tesseract_modes(config.DEFAULT_OCR_ENGINE_MODE, config.DEFAULT_PSM_MODE)
+    assert preloaded == [(['eng', 'fra'], oem)]
@@ -0,0 +1,110 @@
+"""
+Tests for the upload storage lifecycle
+"""
+
+import os
+import pathlib
+import time
+
+import pytest
+
+import config
+import storage
+
+
+@pytest.mark.usefixtures('upload_folder')
+def test_sweeper_survives_a_failing_sweep(monkeypatch):
+    """
+    An unexpected exception fails one sweep; the thread keeps sweeping afterwards
+    """
+    sweeps = []
+
+    def flaky_sweep():
+        sweeps.append(True)
+        if len(sweeps) == 1:
+            raise KeyError('stat entry vanished')
+        return {'expired': 0, 'evicted': 0, 'freed_bytes': 0}
+
+    monkeypatch.setattr(storage, 'sweep_uploads', flaky_sweep)
+    monkeypatch.setattr(config, 'UPLOAD_SWEEP_INTERVAL', 0.01)
+    monkeypatch.setitem(storage._SWEEPER, 'thread', None)  # pylint: disable=protected-access
+    storage.ensure_sweeper_started()
+
+    deadline = time.monotonic() + 5
+    while len(sweeps) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(sweeps) >= 3
+    assert storage._SWEEPER['thread'].is_alive()  # pylint: disable=protected-access
+
+
+def store_file(name, size, age, now):
+    """
+    Write a stored file of a given size and age
+
+    Args:
+        name (str): Flat stored filename
+        size (int): File size in bytes
+        age (float): Seconds since the file was last modified
+        now (float): Reference time
+
+    Returns:
+        pathlib.Path: Path of the file
+    """
+    path = pathlib.Path(storage.get_storage_path(name, create=True))
+    path.write_bytes(b'x' * size)
+    os.utime(path, (now - age, now - age))
+    return path
+
+
+def test_sweep_expires_old_files_then_evicts_the_oldest_over_quota(upload_folder, monkeypatch):
+    """
+    Files past the retention period go first; then the oldest files until the quota fits,
+    sparing files younger than the eviction grace period
+    """
+    monkeypatch.setattr(config, 'UPLOAD_RETENTION_SECONDS', 3600)
+    monkeypatch.setattr(config, 'UPLOAD_MAX_TOTAL_BYTES', 250)
+    monkeypatch.setattr(config, 'UPLOAD_EVICTION_GRACE_SECONDS', 60)
+    now = time.time()
+    expired = store_file('aa000001_expired.png', 100, 7200, now)
+    oldest = store_file('bb000002_oldest.png', 100, 1800, now)
+    older = store_file('cc000003_older.png', 100, 900, now)
+    recent = store_file('dd000004_recent.png', 100, 300, now)
+    in_flight = store_file('ee000005_in_flight.png', 100, 10, now)
+    (upload_folder / '.gitkeep').write_bytes(b'')
+
+    assert storage.sweep_uploads(now) == {'expired': 1, 'evicted': 2, 'freed_bytes': 300}
+    assert [path.exists() for path in (expired, oldest, older, recent, in_flight)] == [
+        False, False, False, True, True]
+    assert (upload_folder / '.gitkeep').exists()
+    stats = storage.get_storage_stats()
+    assert (stats['files'], stats['size_bytes']) == (2, 200)
+
+
+@pytest.mark.usefixtures('upload_folder')
+def test_grace_period_wins_over_the_quota(monkeypatch):
+    """
+    A folder full of fresh files stays over quota rather than losing in-flight uploads
+    """
+    monkeypatch.setattr(config, 'UPLOAD_RETENTION_SECONDS', 0)
+    monkeypatch.setattr(config, 'UPLOAD_MAX_TOTAL_BYTES', 100)
+    monkeypatch.setattr(config, 'UPLOAD_EVICTION_GRACE_SECONDS', 60)
+    now = time.time()
+    paths = [store_file(f'{index:02d}000000_page.png', 100, 5, now) for index in range(3)]
+    assert storage.sweep_uploads(now)['evicted'] == 0
+    assert all(path.exists() for path in paths)
+
+
+def test_files_are_sharded_and_legacy_flat_files_still_resolve(upload_folder):
+    """
+    Stored files live in a shard named after their prefix; files in the root are found too
+    """
+    sharded = storage.get_storage_path('ab12cd34_scan.png', create=True)
+    assert pathlib.Path(sharded) == upload_folder / 'ab' / 'ab12cd34_scan.png'
+    pathlib.Path(sharded).write_bytes(b'png')
+    (upload_folder / 'ef56ab78_legacy.png').write_bytes(b'png')
+
+    assert storage.resolve_stored_file('ab12cd34_scan.png') == sharded
+    assert storage.resolve_stored_file('ef56ab78_legacy.png') == str(
+        upload_folder / 'ef56ab78_legacy.png')
+    for unsafe_name in ('../ab12cd34_scan.png', 'ab/ab12cd34_scan.png', '.gitkeep', ''):
+        assert storage.resolve_stored_file(unsafe_name) is None
@@ -0,0 +1,90 @@
+"""
+Tests for the shared CSV and Excel table renderer
+"""
+
+import math
+
+import pandas as pd
+
+import app
+import config
+
+
+def render_rows_with_iterrows(df):
+    """
+    Row formatting as done before the vectorized renderer
+
+    Args:
+        df (DataFrame): Table data
+
+    Returns:
+        list: One text line per row
+    """
+    return [" | ".join(str(cell) if pd.notna(cell) and str(cell).strip() else ""
+                       for cell in row)
+            for _, row in df.iterrows()]
+
+
+def baseline_csv_text(path):
+    """
+    Text output of the original process_csv(), which parsed the whole file
+
+    Args:
+        path (str): Path to a comma-separated UTF-8 CSV file
+
+    Returns:
+        str: Formatted CSV content
+    """
+    df = pd.read_csv(path, encoding='utf-8', delimiter=',', on_bad_lines='skip', dtype=str,
+                     keep_default_na=False)
+    truncated_message = ''
+    if len(df) > config.EXCEL_MAX_ROWS:
+        df = df.head(config.EXCEL_MAX_ROWS)
+        truncated_message = f" (truncated to {config.EXCEL_MAX_ROWS} rows)"
+    if len(df.columns) > config.EXCEL_MAX_COLUMNS:
+        df = df.iloc[:, :config.EXCEL_MAX_COLUMNS]
+        truncated_message += f" (truncated to {config.EXCEL_MAX_COLUMNS} columns)"
+    header_row = " | ".join(df.columns)
+    return '\n'.join([
+        f"CSV File Content ({len(df)} rows, {len(df.columns)} columns){truncated_message}",
+        "=" * 50, header_row, "-" * len(header_row), *render_rows_with_iterrows(df)
+    ])
+
+
+def test_renderer_matches_iterrows_formatting():
+    """
+    Missing, blank and whitespace-only cells render empty; other cells as str()
+    """
+    df = pd.DataFrame({
+        'text': ['alpha', '', '   ', None, 'Ω mixed case'],
+        'number': [1, 2, 3, 4, 5],
+        'ratio': [0.5, math.nan, 1e20, -2.25, 3.0],
+        'object': [True, None, 'x', 7, ' padded ']
+    })
+    assert app.render_table_lines(df) == render_rows_with_iterrows(df)
+
+
+def test_csv_text_matches_the_original_output(tmp_path, monkeypatch):
+    """
+    Bounded CSV reading renders the same text as parsing the whole file did
+    """
+    monkeypatch.setattr(config, 'EXCEL_MAX_ROWS', 4)
+    monkeypatch.setattr(config, 'EXCEL_MAX_COLUMNS', 3)
+    for row_count in (3, 9):
+        path = tmp_path / f'rows{row_count}.csv'
+        path.write_text('id,name,city,note\n' + ''.join(
+            f'{index},name {index},{"" if index % 2 else "  "},"quoted, note"\n'
+            for index in range(row_count)
+        ), encoding='utf-8')
+        assert app.process_csv(str(path))['data']['text_only'] == baseline_csv_text(str(path))
+
+
+def test_excel_sheet_text_matches_iterrows_formatting():
+    """
+    Sheet rows are rendered like the original per-row loop
+    """
+    df = pd.DataFrame({'id': ['1', '2'], 'note': ['first', ' ']})
+    lines = app.format_excel_sheet_data(df, 'Data', 0, df.shape)
+    assert lines[-2:] == render_rows_with_iterrows(df)
+    assert lines[:5] == ["\nSheet 1: 'Data'", 'Original size: 2 rows, 2 columns', '-' * 40,
+                         'id | note', '.' * len('id | note')]
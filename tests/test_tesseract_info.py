@@ -0,0 +1,74 @@
+"""
+Tests for the cached Tesseract metadata
+"""
+
+import time
+
+import pytest
+
+import app
+import config
+
+
+@pytest.fixture(name='probes')
+def fixture_probes(monkeypatch):
+    """
+    Count Tesseract probes and drive the cache clock by hand
+    """
+    probes = {'languages': 0, 'version': 0, 'clock': 1000.0}
+
+    def detect_languages():
+        probes['languages'] += 1
+        return ['eng', 'deu']
+
+    def detect_version():
+        probes['version'] += 1
+        return '5.3.0'
+
+    monkeypatch.setattr(app, 'detect_available_languages', detect_languages)
+    monkeypatch.setattr(app, 'detect_tesseract_version', detect_version)
+    monkeypatch.setattr(time, 'monotonic', lambda: probes['clock'])
+    monkeypatch.setattr(app, '_TESSERACT_INFO',
+                        {'languages': None, 'version': None, 'loaded_at': 0.0})
+    monkeypatch.setattr(config, 'TESSERACT_INFO_CACHE_TTL', 60)
+    return probes
+
+
+def test_metadata_is_probed_once_within_the_ttl(client, probes):
+    """
+    Language lists and requests within the TTL reuse the first probe
+    """
+    for _ in range(3):
+        assert client.get('/api/v1/languages').status_code == 200
+        probes['clock'] += 10
+    assert app.get_available_languages() == ['eng', 'deu']
+    assert probes['languages'] == probes['version'] == 1
+
+
+def test_metadata_is_probed_again_after_the_ttl(probes):
+    """
+    An expired cache entry is re-probed on the next use, then cached again
+    """
+    app.get_tesseract_info()
+    probes['clock'] += 61
+    info = app.get_tesseract_info()
+    assert info['cache_age_seconds'] == 0.0
+    assert probes['languages'] == 2
+    probes['clock'] += 30
+    assert app.get_tesseract_info()['cache_age_seconds'] == 30.0
+    assert probes['languages'] == 2
+
+
+def test_refresh_endpoint_probes_immediately(client, probes, monkeypatch):
+    """
+    POST /api/v1/languages/refresh bypasses the TTL; a TTL of 0 never expires
+    """
+    monkeypatch.setattr(config, 'TESSERACT_INFO_CACHE_TTL', 0)
+    app.get_tesseract_info()
+    probes['clock'] += 10 ** 6
+    app.get_tesseract_info()
+    assert probes['languages'] == 1
+
+    response = client.post('/api/v1/languages/refresh')
+    assert response.get_json()['languages'] == ['eng', 'deu']
+    assert probes['languages'] == 2
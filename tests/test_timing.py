@@ -0,0 +1,56 @@
+"""
+Tests for stage timing instrumentation
+"""
+
+import io
+
+import timing
+
+
+def test_ocr_response_reports_stage_timings(client):
+    """
+    API responses carry a timings block and a measured processing_time
+    """
+    response = client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(b'timed text'), 'notes.txt'), 'use_cache': 'false'
+    })
+    assert response.status_code == 200
+    result = response.get_json()
+
+    timings = result['timings']
+    assert {'upload_save', 'process_txt', 'json_serialization'} <= set(timings['stages_ms'])
+    assert 0 < result['processing_time'] * 1000 <= timings['total_ms']
+    assert sum(timings['stages_ms'].values()) <= timings['total_ms']
+
+
+def test_request_totals_feed_the_histograms(client):
+    """
+    Each finished request adds one 'total' observation to /api/v1/timings
+    """
+    def total_count():
+        histograms = client.get('/api/v1/timings').get_json()['histograms']
+        return histograms.get('total', {'count': 0})['count']
+
+    before = total_count()
+    client.post('/api/v1/ocr', content_type='multipart/form-data', data={
+        'file': (io.BytesIO(b'timed text'), 'notes.txt'), 'use_cache': 'false'
+    })
+    assert total_count() == before + 1
+
+
+def test_page_timings_merge_into_the_outer_collector():
+    """
+    Stages timed in a nested page collector are reported per page by the request
+    """
+    with timing.collect() as request_timings:
+        with timing.collect() as page_timings:
+            timing.record('ocr', 0.25)
+            timing.record('preprocess', 0.05)
+        timing.record_page(2, timing.stage_totals(page_timings))
+        timing.record_page(1, {'ocr': 0.5})
+        summary = timing.summarize(request_timings)
+
+    assert summary['stages_ms'] == {'ocr': 750.0, 'preprocess': 50.0}
+    assert summary['pages'] == [{'page': 1, 'ocr': 500.0},
+                                {'page': 2, 'ocr': 250.0, 'preprocess': 50.0}]
+    assert timing.current_collector() is None
@@ -0,0 +1,247 @@
+"""
+Docusense OCR Prototype - Stage Timing Instrumentation
+
+Wall-clock timing of the processing hot path. Each request (or background job, or
+batch file) opens a collector; code inside it wraps stages with measure() and the
+timings are reported back in the response. Collectors nest, so a PDF page can be
+timed in its own collector (possibly in an OCR worker process) and merged into the
+request afterwards. When the outermost collector closes, every stage execution is
+added to process-wide latency histograms.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+import config
+
+# Collector stack for the current thread
+_STATE = threading.local()
+
+# Process-wide latency histograms keyed by stage name
+_HISTOGRAMS = {}
+_HISTOGRAMS_LOCK = threading.Lock()
+
+
+def _collector_stack():
+    """
+    Get the collector stack of the current thread
+
+    Returns:
+        list: Active collectors, innermost last
+    """
+    if not hasattr(_STATE, 'stack'):
+        _STATE.stack = []
+    return _STATE.stack
+
+
+@contextmanager
+def collect():
+    """
+    Open a timing collector for a request, job, batch file or PDF page
+
+    Yields:
+        dict: The collector, to be passed to summarize() or stage_totals()
+    """
+    stack = _collector_stack()
+    collector = {'started': time.perf_counter(), 'executions': [], 'pages': {}}
+    stack.append(collector)
+    try:
+        yield collector
+    finally:
+        stack.pop()
+        if not stack:
+            _observe(collector)
+
+
+def timed(view):
+    """
+    Decorator that runs a Flask view inside its own timing collector
+
+    Args:
+        view (callable): View function
+
+    Returns:
+        callable: Wrapped view function
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        with collect():
+            return view(*args, **kwargs)
+    return wrapper
+
+
+def measured(stage):
+    """
+    Decorator factory that times every call of a function as a stage
+
+    Args:
+        stage (str): Stage name
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with measure(stage):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_collector():
+    """
+    Get the innermost active collector of the current thread
+
+    Returns:
+        dict: Active collector, or None outside any collector
+    """
+    stack = _collector_stack()
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def measure(stage, page=None):
+    """
+    Time a block of code as one execution of a stage
+
+    Args:
+        stage (str): Stage name
+        page (int): Page number the stage belongs to, if any
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started, page)
+
+
+def record(stage, seconds, page=None):
+    """
+    Record a stage execution in the innermost active collector
+    Does nothing when no collector is active
+
+    Args:
+        stage (str): Stage name
+        seconds (float): Elapsed wall time
+        page (int): Page number the stage belongs to, if any
+    """
+    stack = _collector_stack()
+    if not stack:
+        return
+    collector = stack[-1]
+    collector['executions'].append((stage, seconds))
+    if page is not None:
+        page_stages = collector['pages'].setdefault(page, {})
+        page_stages[stage] = page_stages.get(stage, 0.0) + seconds
+
+
+def record_page(page, stage_seconds):
+    """
+    Merge stage timings measured for one page (e.g. in a worker process)
+
+    Args:
+        page (int): Page number
+        stage_seconds (dict): Stage name to elapsed seconds
+    """
+    for stage, seconds in stage_seconds.items():
+        record(stage, seconds, page)
+
+
+def stage_totals(collector):
+    """
+    Sum the time spent in each stage of a collector
+
+    Args:
+        collector (dict): Timing collector
+
+    Returns:
+        dict: Stage name to total elapsed seconds
+    """
+    totals = {}
+    for stage, seconds in collector['executions']:
+        totals[stage] = totals.get(stage, 0.0) + seconds
+    return totals
+
+
+def summarize(collector):
+    """
+    Build the 'timings' block reported in API responses
+
+    Args:
+        collector (dict): Timing collector
+
+    Returns:
+        dict: Total and per-stage milliseconds, plus per-page breakdown when available
+    """
+    summary = {
+        'total_ms': _to_ms(time.perf_counter() - collector['started']),
+        'stages_ms': {stage: _to_ms(seconds) for stage, seconds in stage_totals(collector).items()}
+    }
+    if collector['pages']:
+        summary['pages'] = [
+            {'page': page, **{stage: _to_ms(seconds) for stage, seconds in stages.items()}}
+            for page, stages in sorted(collector['pages'].items())
+        ]
+    return summary
+
+
+def get_histograms():
+    """
+    Get a snapshot of the latency histograms
+
+    Returns:
+        dict: Stage name to bucket counts (cumulative, in milliseconds), count and sum
+    """
+    with _HISTOGRAMS_LOCK:
+        return {
+            stage: {
+                'buckets_ms': dict(zip(
+                    [str(bound) for bound in config.TIMING_HISTOGRAM_BUCKETS_MS] + ['+Inf'],
+                    histogram['buckets']
+                )),
+                'count': histogram['count'],
+                'sum_ms': round(histogram['sum_ms'], 3)
+            }
+            for stage, histogram in sorted(_HISTOGRAMS.items())
+        }
+
+
+def _to_ms(seconds):
+    """
+    Convert seconds to milliseconds for reporting
+
+    Args:
+        seconds (float): Duration in seconds
+
+    Returns:
+        float: Duration in milliseconds, rounded to microseconds
+    """
+    return round(seconds * 1000, 3)
+
+
+def _observe(collector):
+    """
+    Add every stage execution of a finished collector to the histograms
+
+    Args:
+        collector (dict): Outermost timing collector that just closed
+    """
+    observations = list(collector['executions'])
+    observations.append(('total', time.perf_counter() - collector['started']))
+
+    bounds = config.TIMING_HISTOGRAM_BUCKETS_MS
+    with _HISTOGRAMS_LOCK:
+        for stage, seconds in observations:
+            histogram = _HISTOGRAMS.setdefault(
+                stage, {'buckets': [0] * (len(bounds) + 1), 'count': 0, 'sum_ms': 0.0}
+            )
+            elapsed_ms = seconds * 1000
+            # Buckets are cumulative: every bucket whose bound covers the value is incremented
+            for bucket_idx, bound in enumerate(bounds):
+                if elapsed_ms <= bound:
+                    histogram['buckets'][bucket_idx] += 1
+            histogram['buckets'][-1] += 1
+            histogram['count'] += 1
+            histogram['sum_ms'] += elapsed_ms